@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Compare parsing several large RSS feeds from fetch threads: in-process (GIL-bound) vs. the process pool.
+
+    python benchmarks/bench_parse_pool.py --feeds 6 --entries 3000 --workers 4
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from pathlib import Path
+
+
+def repo_root() -> Path:
+    return Path(__file__).resolve().parents[1]
+
+
+def synthetic_feed(entries: int, feed_no: int) -> bytes:
+    base = datetime(2026, 2, 23, 12, tzinfo=timezone.utc)
+    items = []
+    for idx in range(entries):
+        published = (base - timedelta(minutes=7 * idx + feed_no)).strftime("%a, %d %b %Y %H:%M:%S +0000")
+        items.append(
+            f"<item><title>Feed {feed_no} story {idx}</title><link>https://example.com/{feed_no}/{idx}</link>"
+            f"<pubDate>{published}</pubDate><description>&lt;p&gt;Summary {idx} of a long article&lt;/p&gt;"
+            "</description></item>"
+        )
+    body = "<?xml version='1.0' encoding='utf-8'?><rss version='2.0'><channel><title>Bench</title>"
+    return (body + "".join(items) + "</channel></rss>").encode("utf-8")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the process-pool parse stage")
+    parser.add_argument("--feeds", type=int, default=6, help="Feeds parsed concurrently")
+    parser.add_argument("--entries", type=int, default=3000, help="Entries per feed")
+    parser.add_argument("--workers", type=int, default=None, help="Pool processes (default: CPU count)")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(repo_root()))
+    from src.news_briefing.parse import parse_rss_news  # noqa: E402
+    from src.news_briefing.parse_pool import ParsePool  # noqa: E402
+    from src.news_briefing.timeparse import clear_cache  # noqa: E402
+
+    feeds = [synthetic_feed(args.entries, n) for n in range(args.feeds)]
+    calls = [partial(parse_rss_news, "world_news", f"Feed {n}", body, "Europe/Rome") for n, body in enumerate(feeds)]
+
+    def timed(run) -> tuple[float, list[int]]:
+        clear_cache()
+        started = time.perf_counter()
+        with ThreadPoolExecutor(len(calls)) as threads:
+            counts = [len(x) for x in threads.map(run, calls, feeds)]
+        return time.perf_counter() - started, counts
+
+    inline, inline_counts = timed(lambda call, body: call())
+    pool = ParsePool(workers=args.workers, min_bytes=0)
+    try:
+        offload = lambda call, body: pool.run(call, len(body), "Europe/Rome")  # noqa: E731
+        timed(offload)  # start the workers outside the timing
+        pooled, pooled_counts = timed(offload)
+    finally:
+        pool.close()
+    if inline_counts != pooled_counts:
+        raise SystemExit(f"Result mismatch: {inline_counts} vs {pooled_counts}")
+
+    print(
+        json.dumps(
+            {
+                "feeds": args.feeds,
+                "entries": args.entries,
+                "bytes_per_feed": len(feeds[0]),
+                "workers": pool.workers,
+                "seconds": {"threads": round(inline, 3), "pool": round(pooled, 3)},
+                "speedup": round(inline / pooled, 2) if pooled else None,
+            },
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
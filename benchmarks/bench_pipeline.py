@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Replay a recorded cassette through BriefingPipeline.generate and report wall-clock timings.
+
+Record once against the live feeds:
+    python -m src.news_briefing.main --dry-run --date 2026-02-24 --record output/cassettes/2026-02-24
+then benchmark offline, as often as needed:
+    python benchmarks/bench_pipeline.py output/cassettes/2026-02-24 --date 2026-02-24 --runs 5
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+
+def repo_root() -> Path:
+    return Path(__file__).resolve().parents[1]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark BriefingPipeline.generate against a recorded cassette")
+    parser.add_argument("cassette", help="Directory previously passed to --record")
+    parser.add_argument("--date", required=True, help="Report date used when recording, YYYY-MM-DD")
+    parser.add_argument("--config", default="config/sources.yaml", help="Config YAML path")
+    parser.add_argument("--runs", type=int, default=5, help="Number of replays")
+    parser.add_argument("--workers", type=int, default=None, help="Concurrent fetch workers")
+    parser.add_argument("--scale", type=float, default=1.0, help="Latency multiplier (0 = CPU cost only)")
+    args = parser.parse_args()
+
+    root = repo_root()
+    sys.path.insert(0, str(root))
+    from src.news_briefing.cassette import Cassette  # noqa: E402
+    from src.news_briefing.config import load_config  # noqa: E402
+    from src.news_briefing.pipeline import BriefingPipeline  # noqa: E402
+    from src.news_briefing.timeparse import parse_stats  # noqa: E402
+
+    cfg = load_config(root / args.config)
+    report_day = datetime.strptime(args.date, "%Y-%m-%d").date()
+    timings: list[float] = []
+    counts: dict[str, int] = {}
+    for _ in range(max(args.runs, 1)):
+        cassette = Cassette(root / args.cassette, "replay", latency_scale=args.scale)
+        with tempfile.TemporaryDirectory() as d:
+            pipeline = BriefingPipeline(cfg, db_path=Path(d) / "briefing.db", workers=args.workers, cassette=cassette)
+            try:
+                started = time.perf_counter()
+                _, _, meta = pipeline.generate(report_day=report_day, dry_run=True)
+                timings.append(time.perf_counter() - started)
+                counts = meta["counts"]
+            finally:
+                pipeline.close()
+
+    print(
+        json.dumps(
+            {
+                "runs": len(timings),
+                "workers": args.workers,
+                "scale": args.scale,
+                "seconds": {
+                    "min": round(min(timings), 4),
+                    "median": round(statistics.median(timings), 4),
+                    "max": round(max(timings), 4),
+                },
+                "counts": counts,
+                "timestamps": parse_stats(),
+            },
+            ensure_ascii=False,
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Benchmark the MIT strikes table parser against the previous regex implementation.
+
+Builds a large synthetic page shaped like scioperi.mit.gov.it, checks that both parsers agree, and
+times them; `--chunk` also times feeding the page in network-sized pieces, as the pipeline does.
+
+    python benchmarks/bench_strikes_html.py --rows 20000 --runs 3
+"""
+from __future__ import annotations
+
+import argparse
+import html
+import json
+import random
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+
+def repo_root() -> Path:
+    return Path(__file__).resolve().parents[1]
+
+
+def legacy_parse(page_html: str, tz_name: str) -> list:
+    """The regex implementation this benchmark replaces, kept verbatim for comparison."""
+    from src.news_briefing.models import StrikeItem
+    from src.news_briefing.parse import _parse_ddmmyyyy
+    from src.news_briefing.timeparse import get_zone
+
+    def clean(value: str) -> str:
+        no_tags = re.sub(r"<[^>]+>", " ", value)
+        normalized = re.sub(r"\s+", " ", no_tags).strip()
+        return html.unescape(normalized)
+
+    tz = get_zone(tz_name)
+    rows = re.findall(r"<tr[^>]*>(.*?)</tr>", page_html, flags=re.IGNORECASE | re.DOTALL)
+    out = []
+    for row in rows:
+        cols = re.findall(r"<t[dh][^>]*>(.*?)</t[dh]>", row, flags=re.IGNORECASE | re.DOTALL)
+        clean_cols = [clean(c) for c in cols]
+        if len(clean_cols) < 12:
+            continue
+        start = _parse_ddmmyyyy(clean_cols[0], tz)
+        end = _parse_ddmmyyyy(clean_cols[1], tz)
+        if start is None and end is None:
+            continue
+        title = f"{clean_cols[3]} | {clean_cols[4]}".strip(" |")
+        city = "/".join([x for x in [clean_cols[9], clean_cols[10]] if x]) or None
+        out.append(StrikeItem(title=title or "罢工", start=start, end=end, impact_window=clean_cols[5] or None, city=city))
+    return out
+
+
+def synthetic_page(rows: int, seed: int) -> str:
+    rng = random.Random(seed)
+    sectors = ["Trasporto pubblico locale", "Ferroviario", "Aereo", "Marittimo", "Scuola &amp; Università"]
+    regions = ["Lombardia", "Lazio", "Campania", "Piemonte", ""]
+    parts = ['<html><body><table class="table"><thead><tr><th>Inizio</th><th>Fine</th></tr></thead><tbody>']
+    for idx in range(rows):
+        day = rng.randint(1, 28)
+        cells = [
+            f"{day:02d}/03/2026",
+            f"{min(day + 1, 28):02d}/03/2026",
+            f'<a href="/s/{idx}">USB</a>',
+            rng.choice(sectors),
+            "Personale\n  viaggiante",
+            f"<span>DALLE {rng.randint(0, 12):02d}.00 ALLE 17.00</span>",
+            "Nazionale",
+            "<em>Note</em> " * rng.randint(0, 4),
+            "20/02/2026",
+            rng.choice(regions),
+            rng.choice(["Milano", "Roma", ""]),
+            "21/02/2026",
+        ]
+        parts.append('<tr class="row">' + "".join(f"<td>\n  {c}\n</td>" for c in cells) + "</tr>\n")
+    parts.append("</tbody></table></body></html>")
+    return "".join(parts)
+
+
+def _time(fn, runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark MIT strikes HTML parsing")
+    parser.add_argument("--rows", type=int, default=20000, help="Table rows in the synthetic page")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--chunk", type=int, default=16384, help="Bytes per fed chunk for the streaming run")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(repo_root()))
+    from src.news_briefing.parse import MitStrikeTableParser, parse_strikes_italy_mit_html  # noqa: E402
+
+    page = synthetic_page(args.rows, args.seed)
+    body = page.encode("utf-8")
+
+    def streamed() -> list:
+        table = MitStrikeTableParser("Europe/Rome")
+        for offset in range(0, len(body), args.chunk):
+            table.feed_bytes(body[offset : offset + args.chunk])
+        return table.close()
+
+    expected = legacy_parse(page, "Europe/Rome")
+    if parse_strikes_italy_mit_html(page, "Europe/Rome") != expected or streamed() != expected:
+        print("parsers disagree", file=sys.stderr)
+        return 1
+
+    legacy = _time(lambda: legacy_parse(page, "Europe/Rome"), args.runs)
+    single = _time(lambda: parse_strikes_italy_mit_html(page, "Europe/Rome"), args.runs)
+    chunked = _time(streamed, args.runs)
+    print(
+        json.dumps(
+            {
+                "rows": args.rows,
+                "page_bytes": len(body),
+                "items": len(expected),
+                "seconds": {"regex": round(legacy, 4), "tokenizer": round(single, 4), "tokenizer_chunked": round(chunked, 4)},
+                "speedup": round(legacy / single, 2) if single else None,
+            },
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
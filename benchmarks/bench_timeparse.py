@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Compare timestamp parsing: dateutil on every string vs. the fast-path engine with its LRU cache.
+
+    python benchmarks/bench_timeparse.py --entries 20000 --distinct 500
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+
+def repo_root() -> Path:
+    return Path(__file__).resolve().parents[1]
+
+
+def _corpus(entries: int, distinct: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    base = datetime(2026, 2, 23, tzinfo=timezone.utc)
+    pool: list[str] = []
+    for idx in range(max(distinct, 1)):
+        dt = base - timedelta(minutes=rng.randint(0, 60 * 24 * 30))
+        if idx % 3 == 0:
+            pool.append(dt.strftime("%a, %d %b %Y %H:%M:%S +0000"))
+        elif idx % 3 == 1:
+            pool.append(dt.strftime("%Y-%m-%dT%H:%M:%SZ"))
+        else:
+            pool.append(dt.strftime("%B %d, %Y %I:%M %p"))
+    return [rng.choice(pool) for _ in range(entries)]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark timestamp parsing")
+    parser.add_argument("--entries", type=int, default=20000, help="Timestamps to parse")
+    parser.add_argument("--distinct", type=int, default=500, help="Distinct strings among them")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(repo_root()))
+    from dateutil import parser as dt_parser  # noqa: E402
+
+    from src.news_briefing.timeparse import clear_cache, get_zone, parse_stats, parse_timestamp  # noqa: E402
+
+    corpus = _corpus(args.entries, args.distinct, args.seed)
+    tz = get_zone("Europe/Rome")
+
+    started = time.perf_counter()
+    for text in corpus:
+        dt = dt_parser.parse(text)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=tz)
+    baseline = time.perf_counter() - started
+
+    clear_cache()
+    started = time.perf_counter()
+    for text in corpus:
+        parse_timestamp(text, tz)
+    engine = time.perf_counter() - started
+
+    print(
+        json.dumps(
+            {
+                "entries": len(corpus),
+                "distinct": args.distinct,
+                "seconds": {"dateutil": round(baseline, 4), "engine": round(engine, 4)},
+                "speedup": round(baseline / engine, 1) if engine else None,
+                "cache": parse_stats(),
+            },
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,10 +4,12 @@ import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
-from urllib import request
 
 import yaml
 
+from .cassette import Cassette
+from .client import FetchClient, FetchOptions
+
 
 NEWS_SECTIONS = ("italian_news", "world_news", "ai_news", "milan_events")
 
@@ -36,7 +38,21 @@ def dump_yaml(path: str | Path, data: dict[str, Any]) -> None:
         yaml.safe_dump(data, f, allow_unicode=True, sort_keys=False)
 
 
-def check_config_sources(cfg: dict[str, Any], timeout: int = 12) -> dict[str, Any]:
+def check_config_sources(cfg: dict[str, Any], timeout: int = 12, cassette: Cassette | None = None) -> dict[str, Any]:
+    client = FetchClient.from_config(cfg.get("fetch"), cassette=cassette)
+    try:
+        results = _check_sources(cfg, client, timeout)
+    finally:
+        client.close()
+
+    summary = _summarize(results)
+    return {
+        "summary": summary,
+        "results": [r.__dict__ for r in results],
+    }
+
+
+def _check_sources(cfg: dict[str, Any], client: FetchClient, timeout: int) -> list[SourceCheckResult]:
     results: list[SourceCheckResult] = []
     for section in ("strikes",) + NEWS_SECTIONS:
         section_cfg = cfg.get(section, {})
@@ -52,13 +68,8 @@ def check_config_sources(cfg: dict[str, Any], timeout: int = 12) -> dict[str, An
                     SourceCheckResult(section, name, src_type, url, False, "empty_url", None)
                 )
                 continue
-            results.append(_check_one(section, name, src_type, url, timeout))
-
-    summary = _summarize(results)
-    return {
-        "summary": summary,
-        "results": [r.__dict__ for r in results],
-    }
+            results.append(_check_one(client, section, name, src_type, url, timeout))
+    return results
 
 
 def build_degraded_config(cfg: dict[str, Any], report: dict[str, Any]) -> dict[str, Any]:
@@ -90,14 +101,21 @@ def build_degraded_config(cfg: dict[str, Any], report: dict[str, Any]) -> dict[s
     return out
 
 
-def _check_one(section: str, name: str, src_type: str, url: str, timeout: int) -> SourceCheckResult:
+def _check_one(
+    client: FetchClient,
+    section: str,
+    name: str,
+    src_type: str,
+    url: str,
+    timeout: int,
+) -> SourceCheckResult:
     try:
-        req = request.Request(url=url, headers={"User-Agent": "milan-brief-health/1.0"})
-        with request.urlopen(req, timeout=timeout) as resp:
-            code = int(getattr(resp, "status", 200))
-            body = resp.read(2048)
-            ok, detail = _validate_payload(src_type, body)
-            return SourceCheckResult(section, name, src_type, url, ok and code < 400, detail, code)
+        resp = client.get(url, options=FetchOptions(timeout=timeout, max_bytes=2048))
+        code = resp.status_code
+        if code >= 400:
+            return SourceCheckResult(section, name, src_type, url, False, f"http_error:{code}", code)
+        ok, detail = _validate_payload(src_type, resp.content)
+        return SourceCheckResult(section, name, src_type, url, ok, detail, code)
     except Exception as exc:
         return SourceCheckResult(section, name, src_type, url, False, f"fetch_error:{exc.__class__.__name__}")
 
@@ -7,6 +7,7 @@ from datetime import date, datetime
 from typing import Any
 from zoneinfo import ZoneInfo
 
+from .cassette import Cassette
 from .config import load_config
 from .pipeline import BriefingPipeline
 
@@ -23,6 +24,34 @@ def build_parser() -> argparse.ArgumentParser:
         help="Comma separated sections, e.g. weather,strikes,ai_news,world_news,italian_news,milan_events",
     )
     p.add_argument("--output-format", default="markdown", choices=["markdown", "json", "both"], help="Stdout format")
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Concurrent fetch workers (default: fetch.workers in config; 1 = sequential)",
+    )
+    p.add_argument(
+        "--cache-only",
+        "--offline",
+        dest="cache_only",
+        action="store_true",
+        help="Build the brief from cached responses only (no network)",
+    )
+    p.add_argument(
+        "--deadline",
+        type=float,
+        default=None,
+        help="Wall-clock budget in seconds; late sources are dropped and the brief renders on time",
+    )
+    cassette = p.add_mutually_exclusive_group()
+    cassette.add_argument("--record", default="", metavar="DIR", help="Record every HTTP exchange into DIR")
+    cassette.add_argument("--replay", default="", metavar="DIR", help="Replay HTTP exchanges recorded in DIR")
+    p.add_argument(
+        "--replay-scale",
+        type=float,
+        default=1.0,
+        help="Multiplier for recorded latencies during --replay (0 = no delay)",
+    )
     return p
 
 
@@ -36,16 +65,24 @@ def main() -> int:
         report_day = datetime.now(ZoneInfo(tz_name)).date()
 
     section_order = [x.strip() for x in args.section_order.split(",") if x.strip()] if args.section_order else None
-    pipeline = BriefingPipeline(cfg)
+    cassette = None
+    if args.record:
+        cassette = Cassette(args.record, "record")
+    elif args.replay:
+        cassette = Cassette(args.replay, "replay", latency_scale=args.replay_scale)
+    pipeline = BriefingPipeline(cfg, workers=args.workers, offline=args.cache_only, cassette=cassette)
     try:
         brief, markdown, meta = pipeline.generate(
             report_day=report_day,
             dry_run=args.dry_run,
             layout=(args.layout or None),
             section_order=section_order,
+            deadline=args.deadline,
         )
     finally:
         pipeline.close()
+        if cassette is not None:
+            cassette.save()
 
     if args.output_format in ("markdown", "both"):
         print(markdown)
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import argparse
 import json
+import sys
 from pathlib import Path
 from typing import Any
 
@@ -10,6 +11,7 @@ import yaml
 
 
 DEFAULT_CONFIG = "config/sources.yaml"
+DEFAULT_DB = "data/briefing.db"
 SECTIONS = {"strikes", "italian_news", "world_news", "ai_news", "milan_events"}
 
 
@@ -26,6 +28,24 @@ def _save(path: Path, data: dict[str, Any]) -> None:
         yaml.safe_dump(data, f, allow_unicode=True, sort_keys=False)
 
 
+def repo_root() -> Path:
+    return Path(__file__).resolve().parents[3]
+
+
+def _load_circuits(db_path: Path, data: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    if not db_path.exists():
+        return {}
+    sys.path.insert(0, str(repo_root()))
+    from src.news_briefing.storage import DEFAULT_BREAKER_COOLDOWN, Store  # noqa: E402
+
+    cb_cfg = (data.get("fetch") or {}).get("circuit_breaker") or {}
+    store = Store(db_path)
+    try:
+        return store.source_circuits(float(cb_cfg.get("cooldown_seconds", DEFAULT_BREAKER_COOLDOWN)))
+    finally:
+        store.close()
+
+
 def _emit(payload: dict[str, Any], as_json: bool) -> None:
     if as_json:
         print(json.dumps(payload, ensure_ascii=False))
@@ -36,7 +56,8 @@ def _emit(payload: dict[str, Any], as_json: bool) -> None:
             print(payload)
 
 
-def cmd_list(data: dict[str, Any], as_json: bool = False) -> int:
+def cmd_list(data: dict[str, Any], as_json: bool = False, circuits: dict[str, dict[str, Any]] | None = None) -> int:
+    circuits = circuits or {}
     sections_payload: dict[str, Any] = {}
     lines: list[str] = []
     for section in sorted(SECTIONS):
@@ -49,9 +70,12 @@ def cmd_list(data: dict[str, Any], as_json: bool = False) -> int:
             src_type = src.get("type", "<unknown>")
             url = src.get("url", "")
             parser = src.get("parser", "")
+            circuit = circuits.get(f"{section}:{name}")
             suffix = f", parser={parser}" if parser else ""
+            if circuit and circuit["state"] != "closed":
+                suffix += f", circuit={circuit['state']} after {circuit['failures']} failure(s)"
             lines.append(f"  {idx}. {name} ({src_type}{suffix}) -> {url}")
-            section_rows.append({"name": name, "type": src_type, "url": url, "parser": parser})
+            section_rows.append({"name": name, "type": src_type, "url": url, "parser": parser, "circuit": circuit})
         sections_payload[section] = section_rows
     _emit({"status": "ok", "sections": sections_payload, "text": "\n".join(lines)}, as_json)
     return 0
@@ -126,6 +150,7 @@ def build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(description="Manage source pipelines for Milan briefing")
     p.add_argument("--config", default=DEFAULT_CONFIG, help="Config YAML path")
     p.add_argument("--json", action="store_true", help="Print machine-readable JSON output")
+    p.add_argument("--db", default=DEFAULT_DB, help="Briefing SQLite DB holding per-source circuit breaker state")
 
     sub = p.add_subparsers(dest="command", required=True)
 
@@ -151,7 +176,7 @@ def main() -> int:
     data = _load(cfg_path)
 
     if args.command == "list":
-        return cmd_list(data, as_json=args.json)
+        return cmd_list(data, as_json=args.json, circuits=_load_circuits(Path(args.db), data))
     if args.command == "add":
         code = cmd_add(data, args, as_json=args.json)
         _save(cfg_path, data)
@@ -16,14 +16,27 @@ def main() -> int:
     parser.add_argument("--config", default="config/sources.yaml", help="Config YAML path")
     parser.add_argument("--timeout", type=int, default=12, help="Per-source timeout seconds")
     parser.add_argument("--write-report", default="", help="Optional report JSON output path")
+    parser.add_argument("--record", default="", metavar="DIR", help="Record HTTP exchanges into DIR")
+    parser.add_argument("--replay", default="", metavar="DIR", help="Replay HTTP exchanges recorded in DIR")
     args = parser.parse_args()
 
     root = repo_root()
     sys.path.insert(0, str(root))
+    from src.news_briefing.cassette import Cassette  # noqa: E402
     from src.news_briefing.health import check_config_sources, load_yaml  # noqa: E402
 
+    cassette = None
+    if args.record:
+        cassette = Cassette(root / args.record, "record")
+    elif args.replay:
+        cassette = Cassette(root / args.replay, "replay")
+
     cfg = load_yaml(root / args.config)
-    report = check_config_sources(cfg, timeout=max(1, args.timeout))
+    try:
+        report = check_config_sources(cfg, timeout=max(1, args.timeout), cassette=cassette)
+    finally:
+        if cassette is not None:
+            cassette.save()
     text = json.dumps(report, ensure_ascii=False, indent=2)
     print(text)
 
@@ -29,6 +29,12 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--alert-webhook", default="", help="Webhook URL for alerts")
     p.add_argument("--alert-success", action="store_true", help="Send webhook on success too")
     p.add_argument("--dry-run", action="store_true", help="Run briefing in dry-run mode")
+    p.add_argument(
+        "--deadline",
+        type=float,
+        default=None,
+        help="Per-attempt wall-clock budget in seconds; late sources are dropped instead of failing the run",
+    )
     p.add_argument(
         "--print-cron",
         action="store_true",
@@ -61,6 +67,8 @@ def run_once(args: argparse.Namespace, log_file: Path, config_path: str) -> tupl
         cmd.extend(["--section-order", args.section_order])
     if args.output_format:
         cmd.extend(["--output-format", args.output_format])
+    if args.deadline is not None:
+        cmd.extend(["--deadline", str(args.deadline)])
 
     started = datetime.now().isoformat(timespec="seconds")
     header = f"[{started}] command: {' '.join(cmd)}\n"
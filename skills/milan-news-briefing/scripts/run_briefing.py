@@ -15,6 +15,12 @@ def main() -> int:
     parser.add_argument("--layout", default="", choices=["classic", "editorial", "brief"], help="Render layout")
     parser.add_argument("--section-order", default="", help="Comma separated section order")
     parser.add_argument("--output-format", default="markdown", choices=["markdown", "json", "both"], help="Output format")
+    parser.add_argument("--workers", type=int, default=None, help="Concurrent fetch workers")
+    parser.add_argument("--cache-only", "--offline", dest="cache_only", action="store_true", help="Use cached responses only")
+    parser.add_argument("--deadline", type=float, default=None, help="Wall-clock budget in seconds")
+    parser.add_argument("--record", default="", metavar="DIR", help="Record HTTP exchanges into DIR")
+    parser.add_argument("--replay", default="", metavar="DIR", help="Replay HTTP exchanges recorded in DIR")
+    parser.add_argument("--replay-scale", type=float, default=None, help="Latency multiplier for --replay")
     args = parser.parse_args()
 
     root = Path(__file__).resolve().parents[3]
@@ -29,6 +35,18 @@ def main() -> int:
         cmd.extend(["--section-order", args.section_order])
     if args.output_format:
         cmd.extend(["--output-format", args.output_format])
+    if args.workers is not None:
+        cmd.extend(["--workers", str(args.workers)])
+    if args.cache_only:
+        cmd.append("--cache-only")
+    if args.deadline is not None:
+        cmd.extend(["--deadline", str(args.deadline)])
+    if args.record:
+        cmd.extend(["--record", args.record])
+    if args.replay:
+        cmd.extend(["--replay", args.replay])
+    if args.replay_scale is not None:
+        cmd.extend(["--replay-scale", str(args.replay_scale)])
 
     return subprocess.call(cmd, cwd=str(root))
 
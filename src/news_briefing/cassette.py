@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+import zipfile
+from collections import deque
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import requests
+
+if TYPE_CHECKING:
+    from .client import FetchResponse
+
+ARCHIVE_NAME = "cassette.zip"
+
+
+class CassetteMissError(LookupError):
+    """Raised in replay mode when a request was never recorded."""
+
+
+class Cassette:
+    """Records HTTP exchanges into DIR/cassette.zip, or replays them with the recorded (scaled) latency.
+
+    The archive holds `exchanges.json` plus one deflated `bodies/<sha256>` entry per distinct payload.
+    """
+
+    def __init__(self, directory: str | Path, mode: str, latency_scale: float = 1.0):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Invalid cassette mode: {mode}")
+        self.directory = Path(directory)
+        self.mode = mode
+        self.latency_scale = max(latency_scale, 0.0)
+        self._lock = threading.Lock()
+        self._exchanges: list[dict[str, Any]] = []
+        self._bodies: dict[str, bytes] = {}
+        self._queues: dict[str, deque[dict[str, Any]]] = {}
+        self._last: dict[str, dict[str, Any]] = {}
+        if mode == "replay":
+            self._load()
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        data: dict[str, Any] | None,
+        max_bytes: int | None,
+        response: FetchResponse,
+    ) -> None:
+        digest = hashlib.sha256(response.content).hexdigest()
+        row = {
+            "key": exchange_key(method, url, params, data, max_bytes),
+            "method": method,
+            "url": url,
+            "final_url": response.url,
+            "status_code": response.status_code,
+            "headers": response.headers,
+            "encoding": response.encoding,
+            "elapsed": round(response.elapsed, 6),
+            "truncated": response.truncated,
+            "body": digest,
+        }
+        with self._lock:
+            self._exchanges.append(row)
+            self._bodies.setdefault(digest, response.content)
+
+    def record_error(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        data: dict[str, Any] | None,
+        max_bytes: int | None,
+        error: BaseException,
+        elapsed: float,
+    ) -> None:
+        row = {
+            "key": exchange_key(method, url, params, data, max_bytes),
+            "method": method,
+            "url": url,
+            "error": f"{error.__class__.__name__}: {error}",
+            "elapsed": round(elapsed, 6),
+        }
+        with self._lock:
+            self._exchanges.append(row)
+
+    def replay(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        data: dict[str, Any] | None,
+        max_bytes: int | None,
+    ) -> tuple[dict[str, Any], bytes]:
+        """Return (recorded row, body) for this request, after sleeping its scaled latency.
+
+        Identical requests are served in recording order; once exhausted the last one is reused.
+        Recorded failures are raised again as `requests.ConnectionError`.
+        """
+        key = exchange_key(method, url, params, data, max_bytes)
+        with self._lock:
+            queue = self._queues.get(key)
+            if queue:
+                row = queue.popleft()
+                self._last[key] = row
+            else:
+                row = self._last.get(key)
+        if row is None:
+            raise CassetteMissError(f"No recorded exchange for {method} {url}")
+        delay = float(row.get("elapsed", 0.0)) * self.latency_scale
+        if delay > 0:
+            time.sleep(delay)
+        if "error" in row:
+            raise requests.ConnectionError(f"Replayed failure for {method} {url}: {row['error']}")
+        return row, self._bodies[row["body"]]
+
+    def save(self) -> Path | None:
+        if self.mode != "record":
+            return None
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / ARCHIVE_NAME
+        with self._lock, zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("exchanges.json", json.dumps(self._exchanges, ensure_ascii=False))
+            for digest, body in self._bodies.items():
+                zf.writestr(f"bodies/{digest}", body)
+        return path
+
+    def _load(self) -> None:
+        path = self.directory / ARCHIVE_NAME
+        if not path.exists():
+            raise FileNotFoundError(f"Cassette not found: {path}")
+        with zipfile.ZipFile(path, "r") as zf:
+            self._exchanges = json.loads(zf.read("exchanges.json"))
+            for row in self._exchanges:
+                if "body" in row and row["body"] not in self._bodies:
+                    self._bodies[row["body"]] = zf.read(f"bodies/{row['body']}")
+        for row in self._exchanges:
+            self._queues.setdefault(row["key"], deque()).append(row)
+
+
+def exchange_key(
+    method: str,
+    url: str,
+    params: dict[str, Any] | None,
+    data: dict[str, Any] | None,
+    max_bytes: int | None,
+) -> str:
+    raw = json.dumps(
+        [method.upper(), url, sorted((params or {}).items()), sorted((data or {}).items()), max_bytes],
+        default=str,
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
@@ -0,0 +1,540 @@
+from __future__ import annotations
+
+import codecs
+import json
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError, ResponseError
+from urllib3.util.retry import Retry
+
+from .cassette import Cassette
+from .http_cache import CachedResponse, CacheMissError, ResponseCache, ValidatorCache, response_key
+from .throttle import HostScheduler
+
+
+DEFAULT_TIMEOUT = 15
+DEFAULT_USER_AGENT = "milan-brief-bot/1.0"
+DEFAULT_RETRIES = 2
+DEFAULT_BACKOFF = 0.5
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_HEDGE_WORKERS = 32
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Bodies are handed out already decoded, so transfer framing headers no longer apply.
+DECODED_DROP_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+
+@dataclass(frozen=True)
+class FetchOptions:
+    """Per-request limits. `ttl` lets a stored response younger than that many seconds skip the network;
+    `max_bytes` / `max_seconds` cap the body download and keep whatever prefix has arrived;
+    `hedge_after` sends a second identical request if the first has not answered within that many seconds;
+    `on_chunk` receives body bytes as they arrive off the wire (the response is then marked `streamed`);
+    `deadline_at` (a `time.monotonic()` instant) stops retries that would start or back off past it."""
+
+    timeout: float | None = None
+    ttl: float | None = None
+    max_bytes: int | None = None
+    max_seconds: float | None = None
+    hedge_after: float | None = None
+    on_chunk: Callable[[bytes], None] | None = None
+    deadline_at: float | None = None
+
+
+class DeadlineRetry(Retry):
+    """The adapter's retry policy, except that a request bound by a run deadline is not retried past it.
+
+    The deadline is per request but the policy is per adapter, so `_transmit` publishes it thread-locally.
+    """
+
+    def increment(
+        self,
+        method: str | None = None,
+        url: str | None = None,
+        response: Any = None,
+        error: Exception | None = None,
+        _pool: Any = None,
+        _stacktrace: Any = None,
+    ) -> "DeadlineRetry":
+        retry = super().increment(method, url, response, error, _pool, _stacktrace)
+        deadline_at = getattr(_request_deadline, "at", None)
+        if deadline_at is not None and time.monotonic() + retry.get_backoff_time() >= deadline_at:
+            # Same outcome as running out of retries: errors raise, retryable statuses are returned as-is.
+            reason = error or ResponseError("run deadline reached before the next retry")
+            raise MaxRetryError(_pool, url or "", reason)
+        return retry
+
+
+_request_deadline = threading.local()
+
+
+class HedgeCancelled(Exception):
+    """Raised inside the losing attempt of a hedged request once the other one has answered."""
+
+
+@dataclass
+class FetchResponse:
+    url: str
+    status_code: int
+    headers: dict[str, str] = field(default_factory=dict)
+    content: bytes = b""
+    encoding: str | None = None
+    elapsed: float = 0.0
+    queue_wait: float = 0.0
+    from_cache: bool = False
+    truncated: str | None = None
+    streamed: bool = False
+
+    @property
+    def text(self) -> str:
+        if self.truncated:
+            # A cut-off prefix may end inside a multi-byte character; the incremental
+            # decoder holds those bytes back instead of emitting replacement characters.
+            decoder = codecs.getincrementaldecoder(self.encoding or "utf-8")(errors="replace")
+            return decoder.decode(self.content, final=False)
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}")
+
+
+class FetchClient:
+    """Shared HTTP client: one keep-alive connection pool per host, one retry/timeout policy."""
+
+    def __init__(
+        self,
+        user_agent: str = DEFAULT_USER_AGENT,
+        timeout: float = DEFAULT_TIMEOUT,
+        retries: int = DEFAULT_RETRIES,
+        backoff: float = DEFAULT_BACKOFF,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        cache: ValidatorCache | None = None,
+        responses: ResponseCache | None = None,
+        offline: bool = False,
+        cassette: Cassette | None = None,
+        scheduler: HostScheduler | None = None,
+    ):
+        if offline and responses is None:
+            raise ValueError("offline mode needs a response cache")
+        self.timeout = timeout
+        self.cassette = cassette
+        self.scheduler = scheduler or HostScheduler()
+        self.cache = cache
+        self.responses = responses
+        self.offline = offline
+        self.session = requests.Session()
+        self.session.headers.update(
+            {
+                "User-Agent": user_agent,
+                "Accept-Encoding": "gzip, deflate",
+                "Connection": "keep-alive",
+            }
+        )
+        retry = DeadlineRetry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            status=retries,
+            backoff_factor=backoff,
+            status_forcelist=RETRY_STATUSES,
+            # urllib3's default set: a retried POST (the DuckDuckGo search) would be a search call the quota misses.
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            raise_on_status=False,
+        )
+        self.adapter = HTTPAdapter(pool_connections=16, pool_maxsize=pool_maxsize, max_retries=retry)
+        self.session.mount("http://", self.adapter)
+        self.session.mount("https://", self.adapter)
+        self._lock = threading.Lock()
+        self._host_stats: dict[str, dict[str, float]] = {}
+        self._cache_stats: dict[str, dict[str, int]] = {}
+        self._truncations: list[dict[str, Any]] = []
+        self._latencies: dict[str, list[float]] = {}
+        self._hedge_stats: dict[str, dict[str, int]] = {}
+        self._hedge_pool: ThreadPoolExecutor | None = None
+
+    @classmethod
+    def from_config(
+        cls,
+        fetch_cfg: dict[str, Any] | None,
+        cache: ValidatorCache | None = None,
+        responses: ResponseCache | None = None,
+        offline: bool = False,
+        cassette: Cassette | None = None,
+    ) -> "FetchClient":
+        fetch_cfg = fetch_cfg or {}
+        return cls(
+            user_agent=str(fetch_cfg.get("user_agent", DEFAULT_USER_AGENT)),
+            timeout=float(fetch_cfg.get("timeout", DEFAULT_TIMEOUT)),
+            retries=int(fetch_cfg.get("retries", DEFAULT_RETRIES)),
+            backoff=float(fetch_cfg.get("retry_backoff", DEFAULT_BACKOFF)),
+            pool_maxsize=int(fetch_cfg.get("pool_maxsize", DEFAULT_POOL_MAXSIZE)),
+            cache=cache,
+            responses=responses,
+            offline=offline,
+            cassette=cassette,
+            scheduler=HostScheduler.from_config(fetch_cfg),
+        )
+
+    def get(self, url: str, **kwargs: Any) -> FetchResponse:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> FetchResponse:
+        return self.request("POST", url, **kwargs)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+        data: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        options: FetchOptions | None = None,
+    ) -> FetchResponse:
+        opts = options or FetchOptions()
+        started = time.monotonic()
+        stored_key = None
+        if self.responses is not None:
+            stored_key = response_key(method, url, params, data)
+            if self.offline or opts.ttl:
+                stored = self.responses.get(stored_key, max_age=None if self.offline else opts.ttl)
+                if stored is not None:
+                    self._count_cache(_cache_key(url, params), "fresh_hits", len(stored.body))
+                    return _from_cached(stored, url, time.monotonic() - started)
+            if self.offline:
+                raise CacheMissError(f"No cached response for {method} {_cache_key(url, params)}")
+        cache_key = _cache_key(url, params) if self.cache and method == "GET" else None
+        cached = self.cache.lookup(cache_key) if cache_key else None
+        if cached:
+            headers = {**cached.conditional_headers(), **(headers or {})}
+        sent = time.monotonic()
+        try:
+            out = self._send(method, url, params, data, headers, opts)
+        except Exception:
+            # Timeouts and refused connections are the slow tail hedging is for; leaving them out biases p90 low.
+            self._record_latency(_cache_key(url, params), time.monotonic() - sent)
+            raise
+        self._count_host(urlsplit(url).hostname or "", out)
+        self._record_latency(_cache_key(url, params), out.elapsed)
+        if out.truncated:
+            # A cut-off body is handed to the caller as-is but never cached.
+            with self._lock:
+                self._truncations.append(
+                    {"url": _cache_key(url, params), "reason": out.truncated, "bytes": len(out.content)}
+                )
+            return out
+        if cache_key:
+            out = self._revalidate(cache_key, cached, out)
+        if stored_key and out.status_code == 200:
+            self.responses.put(stored_key, method, out.url, out.status_code, out.headers, out.encoding, out.content)
+        return out
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        data: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+        opts: FetchOptions,
+    ) -> FetchResponse:
+        # Replayed exchanges are consumed in order, and a streamed body must reach its consumer once.
+        if opts.hedge_after and self.cassette is None and opts.on_chunk is None:
+            return self._send_hedged(method, url, params, data, headers, opts)
+        return self._attempt(method, url, params, data, headers, opts)
+
+    def _attempt(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        data: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+        opts: FetchOptions,
+        cancel: threading.Event | None = None,
+    ) -> FetchResponse:
+        with self.scheduler.slot(urlsplit(url).hostname or "") as waited:
+            out = self._transmit(method, url, params, data, headers, opts, cancel)
+        out.queue_wait = waited
+        return out
+
+    def _send_hedged(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        data: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+        opts: FetchOptions,
+    ) -> FetchResponse:
+        """Send once; if no answer within `opts.hedge_after`, send again and keep whichever answers first.
+
+        The loser stops reading its body as soon as the winner is in. Both attempts take a scheduler slot.
+        """
+        key = _cache_key(url, params)
+        pool = self._hedge_executor()
+        cancels = (threading.Event(), threading.Event())
+        primary = pool.submit(self._attempt, method, url, params, data, headers, opts, cancels[0])
+        done, _ = wait([primary], timeout=opts.hedge_after)
+        if done:
+            self._count_hedge(key, hedged=False, won=False)
+            return primary.result()
+        attempts: list[Future] = [
+            primary,
+            pool.submit(self._attempt, method, url, params, data, headers, opts, cancels[1]),
+        ]
+        pending = set(attempts)
+        error: BaseException | None = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                if fut.exception() is not None:
+                    error = fut.exception()
+                    continue
+                winner = attempts.index(fut)
+                cancels[1 - winner].set()
+                self._count_hedge(key, hedged=True, won=winner == 1)
+                out = fut.result()
+                if winner == 1:
+                    # Report latency as seen by the caller, from the first send.
+                    out.elapsed += opts.hedge_after or 0.0
+                return out
+        self._count_hedge(key, hedged=True, won=False)
+        assert error is not None
+        raise error
+
+    def _hedge_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._hedge_pool is None:
+                self._hedge_pool = ThreadPoolExecutor(
+                    max_workers=DEFAULT_HEDGE_WORKERS, thread_name_prefix="fetch-hedge"
+                )
+            return self._hedge_pool
+
+    def _transmit(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        data: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+        opts: FetchOptions,
+        cancel: threading.Event | None = None,
+    ) -> FetchResponse:
+        if self.cassette is not None and self.cassette.replaying:
+            started = time.monotonic()
+            row, body = self.cassette.replay(method, url, params, data, opts.max_bytes)
+            return FetchResponse(
+                url=row["final_url"],
+                status_code=int(row["status_code"]),
+                headers=dict(row["headers"]),
+                content=body,
+                encoding=row["encoding"],
+                elapsed=time.monotonic() - started,
+                truncated=row.get("truncated"),
+            )
+        timeout: float | tuple[float, float] = opts.timeout or self.timeout
+        if opts.max_seconds:
+            # A stalled socket must not outlive the body budget: cap the read timeout too.
+            timeout = (timeout, min(timeout, opts.max_seconds))
+        started = time.monotonic()
+        _request_deadline.at = opts.deadline_at
+        try:
+            with self.session.request(
+                method,
+                url,
+                params=params,
+                data=data,
+                headers=headers,
+                timeout=timeout,
+                stream=True,
+            ) as resp:
+                content, truncated = _read_body(resp, opts.max_bytes, opts.max_seconds, cancel, opts.on_chunk)
+                out = FetchResponse(
+                    url=resp.url,
+                    status_code=resp.status_code,
+                    headers={k.lower(): v for k, v in resp.headers.items() if k.lower() not in DECODED_DROP_HEADERS},
+                    content=content,
+                    encoding=resp.encoding,
+                    elapsed=time.monotonic() - started,
+                    truncated=truncated,
+                    streamed=opts.on_chunk is not None,
+                )
+        except requests.RequestException as exc:
+            if self.cassette is not None:
+                self.cassette.record_error(method, url, params, data, opts.max_bytes, exc, time.monotonic() - started)
+            raise
+        finally:
+            _request_deadline.at = None
+        if self.cassette is not None:
+            self.cassette.record(method, url, params, data, opts.max_bytes, out)
+        return out
+
+    def _revalidate(self, key: str, cached: CachedResponse | None, resp: FetchResponse) -> FetchResponse:
+        assert self.cache is not None
+        if resp.status_code == 304 and cached is not None:
+            self._count_cache(key, "hits", len(cached.body))
+            out = _from_cached(cached, resp.url, resp.elapsed)
+            out.headers.update(resp.headers)
+            out.queue_wait = resp.queue_wait
+            return out
+        self._count_cache(key, "misses", 0)
+        if resp.status_code == 200:
+            self.cache.store(key, resp.status_code, resp.headers, resp.encoding, resp.content)
+        return resp
+
+    def _count_host(self, host: str, resp: FetchResponse) -> None:
+        with self._lock:
+            row = self._host_stats.setdefault(
+                host, {"requests": 0, "queue_wait": 0.0, "queue_wait_max": 0.0, "network": 0.0}
+            )
+            row["requests"] += 1
+            row["queue_wait"] += resp.queue_wait
+            row["queue_wait_max"] = max(row["queue_wait_max"], resp.queue_wait)
+            row["network"] += resp.elapsed
+
+    def _count_hedge(self, key: str, hedged: bool, won: bool) -> None:
+        with self._lock:
+            row = self._hedge_stats.setdefault(key, {"requests": 0, "hedged": 0, "hedge_wins": 0})
+            row["requests"] += 1
+            row["hedged"] += int(hedged)
+            row["hedge_wins"] += int(won)
+
+    def _count_cache(self, key: str, outcome: str, saved: int) -> None:
+        with self._lock:
+            row = self._cache_stats.setdefault(key, {"fresh_hits": 0, "hits": 0, "misses": 0, "bytes_saved": 0})
+            row[outcome] += 1
+            row["bytes_saved"] += saved
+
+    def _record_latency(self, key: str, seconds: float) -> None:
+        with self._lock:
+            self._latencies.setdefault(key, []).append(seconds)
+
+    def truncations(self) -> list[dict[str, Any]]:
+        """Bodies cut short by `max_bytes` / `max_seconds`, in arrival order."""
+        with self._lock:
+            return [dict(row) for row in self._truncations]
+
+    def hedge_stats(self) -> dict[str, dict[str, int]]:
+        """Per URL with hedging on: `hedged` requests sent a second copy, `hedge_wins` were answered by it first."""
+        with self._lock:
+            return {url: dict(row) for url, row in self._hedge_stats.items()}
+
+    def drain_latencies(self) -> dict[str, list[float]]:
+        """Network latencies per URL observed since the last call (cache hits excluded, failures included)."""
+        with self._lock:
+            out, self._latencies = self._latencies, {}
+        return out
+
+    def cache_stats(self) -> dict[str, dict[str, int]]:
+        """Cache outcome per URL: `fresh_hits` skipped the network (TTL/offline), `hits` were 304s served from disk."""
+        with self._lock:
+            return {url: dict(row) for url, row in self._cache_stats.items()}
+
+    def stats(self) -> dict[str, Any]:
+        """Per-host counters: `reused` requests rode a warm connection; `queue_wait` is time spent
+        throttled by the scheduler, `network` the time on the wire (both in seconds)."""
+        hosts: dict[str, dict[str, Any]] = {}
+
+        def row_for(host: str) -> dict[str, Any]:
+            return hosts.setdefault(
+                host,
+                {"requests": 0, "connections": 0, "reused": 0, "queue_wait": 0.0, "queue_wait_max": 0.0, "network": 0.0},
+            )
+
+        pools = self.adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            row = row_for(pool.host)
+            row["connections"] += pool.num_connections
+            row["reused"] += max(pool.num_requests - pool.num_connections, 0)
+        with self._lock:
+            for host, timing in self._host_stats.items():
+                row = row_for(host)
+                row["requests"] = int(timing["requests"])
+                for name in ("queue_wait", "queue_wait_max", "network"):
+                    row[name] = round(timing[name], 4)
+        return {
+            "requests": sum(x["requests"] for x in hosts.values()),
+            "connections": sum(x["connections"] for x in hosts.values()),
+            "reused": sum(x["reused"] for x in hosts.values()),
+            "queue_wait": round(sum(x["queue_wait"] for x in hosts.values()), 4),
+            "hosts": hosts,
+        }
+
+    def close(self) -> None:
+        if self._hedge_pool is not None:
+            self._hedge_pool.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+        if self.cache:
+            self.cache.close()
+        if self.responses:
+            self.responses.close()
+
+
+_default_client: FetchClient | None = None
+_default_lock = threading.Lock()
+
+
+def get_client() -> FetchClient:
+    global _default_client
+    with _default_lock:
+        if _default_client is None:
+            _default_client = FetchClient()
+        return _default_client
+
+
+def _cache_key(url: str, params: dict[str, Any] | None) -> str:
+    if not params:
+        return url
+    return requests.Request("GET", url, params=params).prepare().url or url
+
+
+def _from_cached(cached: CachedResponse, url: str, elapsed: float) -> FetchResponse:
+    return FetchResponse(
+        url=url,
+        status_code=cached.status_code,
+        headers=dict(cached.headers),
+        content=cached.body,
+        encoding=cached.encoding,
+        elapsed=elapsed,
+        from_cache=True,
+    )
+
+
+def _read_body(
+    resp: requests.Response,
+    max_bytes: int | None,
+    max_seconds: float | None,
+    cancel: threading.Event | None = None,
+    on_chunk: Callable[[bytes], None] | None = None,
+) -> tuple[bytes, str | None]:
+    """Stream the body, stopping early at either cap; returns (prefix, reason) when cut short."""
+    if max_bytes is None and not max_seconds and cancel is None and on_chunk is None:
+        return resp.content, None
+    deadline = time.monotonic() + max_seconds if max_seconds else None
+    chunks: list[bytes] = []
+    received = 0
+    for chunk in resp.iter_content(chunk_size=16384):
+        if cancel is not None and cancel.is_set():
+            raise HedgeCancelled(resp.url)
+        chunks.append(chunk)
+        received += len(chunk)
+        if on_chunk is not None:
+            on_chunk(chunk if max_bytes is None or received <= max_bytes else chunk[: max_bytes - received])
+        if max_bytes is not None and received > max_bytes:
+            return b"".join(chunks)[:max_bytes], "max_bytes"
+        if deadline is not None and time.monotonic() > deadline:
+            return b"".join(chunks), "max_seconds"
+    return b"".join(chunks), None
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from typing import Iterator
+from xml.etree.ElementTree import Element, ParseError, XMLPullParser
+
+
+CHUNK_SIZE = 64 * 1024
+ENTRY_TAGS = {"item", "entry"}
+FEED_ROOTS = {"rss", "feed", "RDF"}
+
+
+class FeedSyntaxError(ValueError):
+    """The payload is not well-formed RSS 2.0 / RSS 1.0 / Atom; callers fall back to feedparser."""
+
+
+def iter_feed_entries(payload: bytes) -> Iterator[dict[str, str]]:
+    """Yield one dict per RSS item / Atom entry (title, link, published, summary) as the XML is read.
+
+    Each entry element is dropped from the tree once yielded, so memory stays flat however long the
+    feed is, and a caller that stops iterating never parses the rest of the document.
+    """
+    parser = XMLPullParser(events=("start", "end"))
+    root_checked = False
+    depth = 0
+    for offset in range(0, max(len(payload), 1), CHUNK_SIZE):
+        try:
+            parser.feed(payload[offset : offset + CHUNK_SIZE])
+            events = list(parser.read_events())
+        except ParseError as exc:
+            raise FeedSyntaxError(str(exc)) from exc
+        for event, elem in events:
+            name = _local(elem.tag)
+            if event == "start":
+                if not root_checked:
+                    if name not in FEED_ROOTS:
+                        raise FeedSyntaxError(f"Unexpected root element: {name}")
+                    root_checked = True
+                if name in ENTRY_TAGS:
+                    depth += 1
+                continue
+            if name in ENTRY_TAGS and depth == 1:
+                yield _entry(elem)
+                elem.clear()
+            if name in ENTRY_TAGS:
+                depth -= 1
+    try:
+        parser.close()
+    except ParseError as exc:
+        raise FeedSyntaxError(str(exc)) from exc
+    if not root_checked:
+        raise FeedSyntaxError("Empty feed")
+
+
+def _entry(elem: Element) -> dict[str, str]:
+    out = {"title": "", "link": "", "published": "", "summary": ""}
+    for child in elem:
+        name = _local(child.tag)
+        text = "".join(child.itertext()).strip()
+        if name == "title":
+            out["title"] = text
+        elif name == "link":
+            href = child.get("href")
+            if href is None:
+                out["link"] = out["link"] or text
+            elif child.get("rel", "alternate") == "alternate" and not out["link"]:
+                out["link"] = href.strip()
+        elif name in ("pubDate", "published", "date"):
+            out["published"] = out["published"] or text
+        elif name == "updated":
+            out.setdefault("updated", text)
+        elif name in ("description", "summary") or (name == "content" and not out["summary"]):
+            out["summary"] = text
+    if not out["published"]:
+        out["published"] = out.pop("updated", "")
+    out.pop("updated", None)
+    return out
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
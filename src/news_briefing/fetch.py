@@ -1,27 +1,60 @@
 from __future__ import annotations
 
 import os
+from dataclasses import replace
+from functools import partial
 from typing import Any
 
-import requests
+from .client import FetchClient, FetchOptions, FetchResponse, get_client
+from .search_cache import SearchCache
 
 
-DEFAULT_TIMEOUT = 15
+def fetch_response(
+    url: str,
+    timeout: float | None = None,
+    client: FetchClient | None = None,
+    options: FetchOptions | None = None,
+) -> FetchResponse:
+    resp = (client or get_client()).get(url, options=_with_timeout(options, timeout))
+    resp.raise_for_status()
+    return resp
 
 
-def fetch_text(url: str, timeout: int = DEFAULT_TIMEOUT) -> str:
-    resp = requests.get(url, timeout=timeout, headers={"User-Agent": "milan-brief-bot/1.0"})
-    resp.raise_for_status()
-    return resp.text
+def fetch_bytes(
+    url: str,
+    timeout: float | None = None,
+    client: FetchClient | None = None,
+    options: FetchOptions | None = None,
+) -> bytes:
+    return fetch_response(url, timeout=timeout, client=client, options=options).content
 
 
-def fetch_json(url: str, timeout: int = DEFAULT_TIMEOUT) -> Any:
-    resp = requests.get(url, timeout=timeout, headers={"User-Agent": "milan-brief-bot/1.0"})
-    resp.raise_for_status()
-    return resp.json()
+def fetch_text(
+    url: str,
+    timeout: float | None = None,
+    client: FetchClient | None = None,
+    options: FetchOptions | None = None,
+) -> str:
+    return fetch_response(url, timeout=timeout, client=client, options=options).text
+
+
+def fetch_json(
+    url: str,
+    timeout: float | None = None,
+    client: FetchClient | None = None,
+    options: FetchOptions | None = None,
+) -> Any:
+    return fetch_response(url, timeout=timeout, client=client, options=options).json()
 
 
-def fetch_web_search(query: str, count: int = 10, country: str = "IT") -> list[dict[str, Any]]:
+def fetch_web_search(
+    query: str,
+    count: int = 10,
+    country: str = "IT",
+    client: FetchClient | None = None,
+    options: FetchOptions | None = None,
+    cache: SearchCache | None = None,
+) -> list[dict[str, Any]]:
     """
     Fetch search results using Brave Search API.
     
@@ -29,18 +62,40 @@ def fetch_web_search(query: str, count: int = 10, country: str = "IT") -> list[d
         query: Search query string
         count: Number of results to return (max 10)
         country: Country code for regional results
+        client: Shared fetch client (defaults to the process-wide one)
+        options: Cache TTL and download limits for the request
+        cache: Query cache and quota ledger; identical queries are answered once
     
     Returns:
         List of search result dictionaries with title, url, description
     """
     api_key = os.environ.get("BRAVE_API_KEY") or os.environ.get("BAIDU_API_KEY")
+    if cache is not None:
+        # The query cache answers repeats. A stored response answering instead would still be booked as a call.
+        options = replace(options or FetchOptions(), ttl=None)
     
     # Fallback: use a simple approach with DuckDuckGo or similar
     # For production, configure BRAVE_API_KEY in environment
     if not api_key:
         # Use DuckDuckGo HTML as fallback (no API key needed)
-        return _fetch_ddg_search(query, count)
-    
+        provider = "duckduckgo"
+        run = partial(_fetch_ddg_search, query, count, client=client, options=options)
+    else:
+        provider = "brave"
+        run = partial(_fetch_brave_search, query, count, country, api_key, client=client, options=options)
+    if cache is None:
+        return run()
+    return cache.search(provider, query, count, country, run)
+
+
+def _fetch_brave_search(
+    query: str,
+    count: int,
+    country: str,
+    api_key: str,
+    client: FetchClient | None = None,
+    options: FetchOptions | None = None,
+) -> list[dict[str, Any]]:
     # Brave Search API
     url = "https://api.search.brave.com/res/v1/web/search"
     headers = {
@@ -53,7 +108,7 @@ def fetch_web_search(query: str, count: int = 10, country: str = "IT") -> list[d
         "country": country,
     }
     
-    resp = requests.get(url, headers=headers, params=params, timeout=DEFAULT_TIMEOUT)
+    resp = (client or get_client()).get(url, headers=headers, params=params, options=options)
     resp.raise_for_status()
     data = resp.json()
     
@@ -67,7 +122,12 @@ def fetch_web_search(query: str, count: int = 10, country: str = "IT") -> list[d
     return results
 
 
-def _fetch_ddg_search(query: str, count: int) -> list[dict[str, Any]]:
+def _fetch_ddg_search(
+    query: str,
+    count: int,
+    client: FetchClient | None = None,
+    options: FetchOptions | None = None,
+) -> list[dict[str, Any]]:
     """
     Fallback: Use DuckDuckGo HTML search (no API key required).
     """
@@ -76,7 +136,7 @@ def _fetch_ddg_search(query: str, count: int) -> list[dict[str, Any]]:
     url = "https://html.duckduckgo.com/html/"
     data = {"q": query, "b": f"{count}"}
     
-    resp = requests.post(url, data=data, timeout=DEFAULT_TIMEOUT, headers={"User-Agent": "milan-brief-bot/1.0"})
+    resp = (client or get_client()).post(url, data=data, options=options)
     resp.raise_for_status()
     
     soup = BeautifulSoup(resp.text, "html.parser")
@@ -97,3 +157,8 @@ def _fetch_ddg_search(query: str, count: int) -> list[dict[str, Any]]:
                 break
     
     return results
+
+
+def _with_timeout(options: FetchOptions | None, timeout: float | None) -> FetchOptions:
+    options = options or FetchOptions()
+    return replace(options, timeout=timeout) if timeout else options
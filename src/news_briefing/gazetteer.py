@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import json
+import re
+import unicodedata
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+
+GAZETTEER_PATH = Path(__file__).with_name("gazetteer_it.json")
+
+KIND_LEVEL = {"country": 0, "region": 1, "province": 2, "city": 2}
+# Where one spelling names several places ("Milano" the comune and the province), the most local one wins.
+KIND_RANK = {"city": 3, "province": 2, "region": 1, "country": 0}
+
+WORD_RE = re.compile(r"[^\W_]+")
+
+
+@dataclass(frozen=True)
+class Place:
+    kind: str
+    name: str
+    region: str | None = None
+    province: str | None = None
+
+
+@dataclass(frozen=True)
+class PlaceMatch:
+    place: Place
+    start: int
+    end: int
+    # A word like "Tutte" that names Italy on its own but only "all of it" next to a place ("Lazio/Tutte").
+    qualifier: bool = False
+
+
+class Gazetteer:
+    """Italian regions, provinces (with their two-letter codes) and comuni, compiled into a word trie.
+
+    `find` tokenizes the text once and walks the trie from each word, keeping the longest name that starts
+    there, so "Reggio Emilia" is one match and "Emilia-Romagna" is not also "Emilia". Matching ignores case
+    and accents; names marked `strict` (places that are also common words: "Marche", "Potenza", "Fermo") must
+    be capitalised. Province codes count only as "(MI)", "/MI" or on their own, never as the word "mi".
+    """
+
+    def __init__(self, data: dict[str, Any]):
+        self._trie: dict[str, Any] = {}
+        self.codes: dict[str, Place] = {}
+        self.places: list[Place] = []
+        country = data["country"]
+        self._add(Place("country", country["name"]), country)
+        for raw in data["regions"]:
+            self._add(Place("region", raw["name"], region=raw["name"]), raw)
+        regions: dict[str, str] = {}
+        for raw in data["provinces"]:
+            place = Place("province", raw["name"], region=raw["region"], province=raw["code"])
+            regions[raw["code"]] = raw["region"]
+            self.codes[raw["code"]] = place
+            self._add(place, raw)
+        for raw in data["comuni"]:
+            code = raw["province"]
+            self._add(Place("city", raw["name"], region=regions[code], province=code), raw)
+
+    @classmethod
+    def from_file(cls, path: str | Path = GAZETTEER_PATH) -> "Gazetteer":
+        return cls(json.loads(Path(path).read_text(encoding="utf-8")))
+
+    def _add(self, place: Place, raw: dict[str, Any]) -> None:
+        self.places.append(place)
+        strict = bool(raw.get("strict"))
+        spellings = [(name, False) for name in [place.name, *raw.get("aliases", ())]]
+        for spelling, qualifier in spellings + [(name, True) for name in raw.get("qualifiers", ())]:
+            node = self._trie
+            for word in _words(spelling):
+                node = node.setdefault(word, {})
+            held = node.get("")
+            if held is None or KIND_RANK[place.kind] > KIND_RANK[held[0].kind]:
+                node[""] = (place, strict, qualifier)
+
+    def find(self, text: str) -> list[PlaceMatch]:
+        """Places named in `text`, in order of appearance; overlapping names resolve to the longest one."""
+        tokens = [(m.group(), m.start(), m.end()) for m in WORD_RE.finditer(text)]
+        found: list[PlaceMatch] = []
+        i = 0
+        while i < len(tokens):
+            raw, start, end = tokens[i]
+            best: tuple[tuple[Place, bool, bool], int] | None = None
+            node = self._trie
+            for j in range(i, len(tokens)):
+                node = node.get(_fold(tokens[j][0]))
+                if node is None:
+                    break
+                held = node.get("")
+                if held is not None and (not held[1] or raw[0].isupper()):
+                    best = (held, j)
+            if best is not None:
+                (place, _, qualifier), last = best
+                found.append(PlaceMatch(place, start, tokens[last][2], qualifier))
+                i = last + 1
+                continue
+            if len(raw) == 2 and raw.isupper() and raw in self.codes and _code_position(text, start, end):
+                found.append(PlaceMatch(self.codes[raw], start, end))
+            i += 1
+        return found
+
+    def resolve(self, name: str, kinds: tuple[str, ...]) -> Place | None:
+        """The place a whole config value names (a name, alias or province code), limited to `kinds`."""
+        name = name.strip()
+        if name.upper() in self.codes and "province" in kinds:
+            return self.codes[name.upper()]
+        node: dict[str, Any] | None = self._trie
+        for word in _words(name):
+            node = node.get(word) if node is not None else None
+        held = node.get("") if node is not None else None
+        if held is not None and held[0].kind in kinds:
+            return held[0]
+        # A comune shadows the province of the same name; look for the one asked for.
+        folded = " ".join(_words(name))
+        return next((p for p in self.places if p.kind in kinds and " ".join(_words(p.name)) == folded), None)
+
+
+@dataclass(frozen=True)
+class GeoScope:
+    """Which places a section cares about, from its `geo_scope:` block.
+
+    A match is in scope when it lies inside a listed region, province or comune, or when it covers one (a
+    region-wide strike in Lombardia reaches Milano). `national` admits any text with an Italy-wide match
+    ("sciopero nazionale", even if it also names Roma). Otherwise only the most local matches decide
+    ("Lombardia/BG" is about Bergamo, not the whole region; "Lazio/Tutte" is all of Lazio, not Italy). Text
+    naming no known place is kept when `unlocated` is set, and empty text always is.
+    """
+
+    regions: frozenset[str] = frozenset()
+    provinces: frozenset[str] = frozenset()
+    cities: frozenset[str] = frozenset()
+    national: bool = True
+    unlocated: bool = True
+    covered_regions: frozenset[str] = frozenset()
+    covered_provinces: frozenset[str] = frozenset()
+
+    @classmethod
+    def from_config(cls, raw: dict[str, Any] | None, unlocated: bool = True) -> "GeoScope | None":
+        if not raw:
+            return None
+        gaz = load_gazetteer()
+        regions = {_resolved(gaz, r, ("region",)) for r in raw.get("regions") or ()}
+        provinces = {gaz.resolve(p, ("province",)) for p in raw.get("provinces") or ()}
+        cities = {gaz.resolve(c, ("city",)) for c in raw.get("cities") or ()}
+        inside = [p for p in provinces | cities if p is not None]
+        return cls(
+            regions=frozenset(regions),
+            provinces=frozenset(p.province for p in provinces if p is not None),
+            cities=frozenset(c.name for c in cities if c is not None),
+            national=bool(raw.get("national", True)),
+            unlocated=bool(raw.get("unlocated", unlocated)),
+            covered_regions=frozenset(regions | {p.region for p in inside}),
+            covered_provinces=frozenset(p.province for p in inside),
+        )
+
+    def admits(self, place: Place) -> bool:
+        if place.kind == "country":
+            return self.national
+        if place.kind == "region":
+            return place.region in self.covered_regions
+        if place.region in self.regions:
+            return True
+        if place.kind == "province":
+            return place.province in self.covered_provinces
+        return place.name in self.cities or place.province in self.provinces
+
+    def keeps(self, text: str | None) -> bool:
+        if not text or not text.strip():
+            return True
+        matches = _named(load_gazetteer().find(text))
+        if not matches:
+            return self.unlocated
+        if self.national and any(m.place.kind == "country" for m in matches):
+            return True
+        level = max(KIND_LEVEL[m.place.kind] for m in matches)
+        return any(self.admits(m.place) for m in matches if KIND_LEVEL[m.place.kind] == level)
+
+
+@lru_cache(maxsize=1)
+def load_gazetteer() -> Gazetteer:
+    """The bundled gazetteer, compiled once per process."""
+    return Gazetteer.from_file()
+
+
+def place_label(text: str) -> str | None:
+    """Names of the places in `text`, most general first and joined with "/" ("Lombardia/Milano")."""
+    matches = _named(load_gazetteer().find(text))
+    places = sorted(dict.fromkeys(m.place for m in matches), key=lambda p: KIND_LEVEL[p.kind])
+    return "/".join(dict.fromkeys(p.name for p in places)) or None
+
+
+def _named(matches: list[PlaceMatch]) -> list[PlaceMatch]:
+    # Qualifiers count as Italy only when nothing else is named.
+    if any(not m.qualifier for m in matches):
+        return [m for m in matches if not m.qualifier]
+    return matches
+
+
+def _resolved(gaz: Gazetteer, name: str, kinds: tuple[str, ...]) -> str:
+    place = gaz.resolve(str(name), kinds)
+    return place.name if place is not None else str(name).strip()
+
+
+def _code_position(text: str, start: int, end: int) -> bool:
+    before = text[:start].rstrip()
+    after = text[end:].lstrip()
+    if not before and not after:
+        return True
+    return before.endswith(("(", "/")) or (after.startswith(("/", ")")) and not before)
+
+
+def _words(text: str) -> list[str]:
+    return [_fold(w) for w in WORD_RE.findall(text)]
+
+
+@lru_cache(maxsize=8192)
+def _fold(word: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", word.casefold())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS http_validators (
+  url TEXT PRIMARY KEY,
+  etag TEXT,
+  last_modified TEXT,
+  status_code INTEGER NOT NULL,
+  headers_json TEXT NOT NULL,
+  encoding TEXT,
+  body BLOB NOT NULL,
+  stored_at TEXT NOT NULL
+);
+"""
+
+
+RESPONSE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+  key TEXT PRIMARY KEY,
+  method TEXT NOT NULL,
+  url TEXT NOT NULL,
+  blob_hash TEXT NOT NULL,
+  status_code INTEGER NOT NULL,
+  headers_json TEXT NOT NULL,
+  encoding TEXT,
+  stored_at REAL NOT NULL,
+  accessed_at REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at);
+CREATE INDEX IF NOT EXISTS idx_responses_blob ON responses(blob_hash);
+
+CREATE TABLE IF NOT EXISTS blobs (
+  hash TEXT PRIMARY KEY,
+  size INTEGER NOT NULL,
+  raw_size INTEGER NOT NULL
+);
+"""
+
+DEFAULT_RESPONSE_CACHE_MB = 200
+
+
+class CacheMissError(LookupError):
+    """Raised in offline mode when a request has no cached response."""
+
+
+@dataclass
+class CachedResponse:
+    url: str
+    etag: str | None
+    last_modified: str | None
+    status_code: int
+    headers: dict[str, str]
+    encoding: str | None
+    body: bytes
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ValidatorCache:
+    """Last body + ETag/Last-Modified per URL, used to revalidate with conditional GETs."""
+
+    def __init__(self, db_path: str | Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL;")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+        self._lock = threading.Lock()
+
+    def lookup(self, url: str) -> CachedResponse | None:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT url, etag, last_modified, status_code, headers_json, encoding, body "
+                "FROM http_validators WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+        return CachedResponse(
+            url=row[0],
+            etag=row[1],
+            last_modified=row[2],
+            status_code=int(row[3]),
+            headers=json.loads(row[4]),
+            encoding=row[5],
+            body=bytes(row[6]),
+        )
+
+    def store(self, url: str, status_code: int, headers: dict[str, str], encoding: str | None, body: bytes) -> bool:
+        etag = headers.get("etag")
+        last_modified = headers.get("last-modified")
+        if not etag and not last_modified:
+            return False
+        with self._lock:
+            self.conn.execute(
+                """
+                INSERT INTO http_validators(url, etag, last_modified, status_code, headers_json, encoding, body, stored_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                  etag = excluded.etag,
+                  last_modified = excluded.last_modified,
+                  status_code = excluded.status_code,
+                  headers_json = excluded.headers_json,
+                  encoding = excluded.encoding,
+                  body = excluded.body,
+                  stored_at = excluded.stored_at
+                """,
+                (
+                    url,
+                    etag,
+                    last_modified,
+                    status_code,
+                    json.dumps(headers, ensure_ascii=False),
+                    encoding,
+                    sqlite3.Binary(body),
+                    datetime.utcnow().isoformat(),
+                ),
+            )
+            self.conn.commit()
+        return True
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
+
+class ResponseCache:
+    """Content-addressed response store under data/: zlib blobs named by SHA-256, SQLite index, LRU size cap."""
+
+    def __init__(self, root: str | Path, max_bytes: int = DEFAULT_RESPONSE_CACHE_MB * 1024 * 1024):
+        self.root = Path(root)
+        self.blob_dir = self.root / "blobs"
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.conn = sqlite3.connect(self.root / "index.db", check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL;")
+        self.conn.executescript(RESPONSE_SCHEMA)
+        self.conn.commit()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, max_age: float | None) -> CachedResponse | None:
+        """Return the stored response if younger than `max_age` seconds (`None` accepts any age)."""
+        now = time.time()
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT url, blob_hash, status_code, headers_json, encoding, stored_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None or (max_age is not None and now - float(row[5]) > max_age):
+                return None
+            try:
+                body = zlib.decompress(self._blob_path(row[1]).read_bytes())
+            except (OSError, zlib.error):
+                return None
+            self.conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self.conn.commit()
+        headers = json.loads(row[3])
+        return CachedResponse(
+            url=row[0],
+            etag=headers.get("etag"),
+            last_modified=headers.get("last-modified"),
+            status_code=int(row[2]),
+            headers=headers,
+            encoding=row[4],
+            body=body,
+        )
+
+    def put(
+        self,
+        key: str,
+        method: str,
+        url: str,
+        status_code: int,
+        headers: dict[str, str],
+        encoding: str | None,
+        body: bytes,
+    ) -> None:
+        digest = hashlib.sha256(body).hexdigest()
+        now = time.time()
+        with self._lock:
+            previous = self.conn.execute("SELECT blob_hash FROM responses WHERE key = ?", (key,)).fetchone()
+            known = self.conn.execute("SELECT 1 FROM blobs WHERE hash = ?", (digest,)).fetchone()
+            if known is None:
+                packed = zlib.compress(body, 6)
+                path = self._blob_path(digest)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_suffix(".tmp")
+                tmp.write_bytes(packed)
+                os.replace(tmp, path)
+                self.conn.execute(
+                    "INSERT INTO blobs(hash, size, raw_size) VALUES (?, ?, ?)", (digest, len(packed), len(body))
+                )
+            self.conn.execute(
+                """
+                INSERT INTO responses(key, method, url, blob_hash, status_code, headers_json, encoding, stored_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                  blob_hash = excluded.blob_hash,
+                  status_code = excluded.status_code,
+                  headers_json = excluded.headers_json,
+                  encoding = excluded.encoding,
+                  stored_at = excluded.stored_at,
+                  accessed_at = excluded.accessed_at
+                """,
+                (key, method, url, digest, status_code, json.dumps(headers, ensure_ascii=False), encoding, now, now),
+            )
+            # Only the blob this key pointed at can have lost its last reference; no need to scan them all.
+            if previous is not None and previous[0] != digest:
+                self._release(previous[0])
+            self._evict()
+            self.conn.commit()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            entries = self.conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            blobs, size, raw_size = self.conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(raw_size), 0) FROM blobs"
+            ).fetchone()
+        return {"entries": int(entries), "blobs": int(blobs), "bytes": int(size), "raw_bytes": int(raw_size)}
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
+    def _evict(self) -> None:
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+        while total > self.max_bytes:
+            row = self.conn.execute("SELECT key, blob_hash FROM responses ORDER BY accessed_at ASC LIMIT 1").fetchone()
+            if row is None:
+                break
+            self.conn.execute("DELETE FROM responses WHERE key = ?", (row[0],))
+            total -= self._release(row[1])
+
+    def _release(self, digest: str) -> int:
+        """Delete a blob no response points at any more; returns the bytes freed (0 if it is still shared)."""
+        if self.conn.execute("SELECT 1 FROM responses WHERE blob_hash = ? LIMIT 1", (digest,)).fetchone():
+            return 0
+        row = self.conn.execute("SELECT size FROM blobs WHERE hash = ?", (digest,)).fetchone()
+        self.conn.execute("DELETE FROM blobs WHERE hash = ?", (digest,))
+        self._blob_path(digest).unlink(missing_ok=True)
+        return int(row[0]) if row else 0
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.blob_dir / digest[:2] / f"{digest}.z"
+
+
+def response_key(method: str, url: str, params: dict[str, Any] | None, data: dict[str, Any] | None) -> str:
+    raw = json.dumps([method.upper(), url, sorted((params or {}).items()), sorted((data or {}).items())], default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
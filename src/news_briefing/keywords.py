@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from .models import NewsItem
+
+
+RULE_KINDS = ("include", "exclude", "required")
+
+
+@dataclass(frozen=True)
+class KeywordRules:
+    """A section's `keywords:` block: keep items matching any `include` term (when given), none of the
+    `exclude` terms and every `required` term. Terms match whole words, case-insensitively."""
+
+    include: tuple[str, ...] = ()
+    exclude: tuple[str, ...] = ()
+    required: tuple[str, ...] = ()
+
+    @classmethod
+    def from_config(cls, raw: dict[str, Any] | None) -> "KeywordRules | None":
+        if not raw:
+            return None
+        terms = {kind: tuple(_norm(str(t)) for t in raw.get(kind) or () if str(t).strip()) for kind in RULE_KINDS}
+        rules = cls(**terms)
+        return rules if rules.include or rules.exclude or rules.required else None
+
+
+class KeywordFilter:
+    """All terms of a rule set compiled into one regex; one scan of the text finds every term present.
+
+    The terms form a prefix trie, so each word start costs one walk down shared prefixes rather than a
+    try per term. The scan is a zero-width lookahead, so overlapping terms ("new york" / "york times") are
+    all seen; a term that occurs inside a longer matched term is credited through `implied`.
+    """
+
+    def __init__(self, rules: KeywordRules):
+        self.rules = rules
+        self.kinds: dict[str, list[str]] = {}
+        for kind in RULE_KINDS:
+            for term in getattr(rules, kind):
+                self.kinds.setdefault(term, []).append(kind)
+        terms = sorted(self.kinds)
+        self.pattern = re.compile(rf"(?<!\w)(?=({_trie_regex(terms)})(?!\w))", re.IGNORECASE)
+        # Each term with every other term found inside it.
+        self.implied = {
+            term: frozenset(t for t in terms if re.search(rf"(?<!\w){re.escape(t)}(?!\w)", term)) for term in terms
+        }
+        self._spelled: dict[str, frozenset[str]] = {}
+
+    def matches(self, text: str) -> set[str]:
+        found: set[str] = set()
+        spelled = self._spelled
+        for raw in self.pattern.findall(text):
+            terms = spelled.get(raw)
+            if terms is None:
+                # Matched spellings ("AI", "Ai", "ai") are few; remember what each one stands for.
+                terms = spelled[raw] = self.implied.get(_norm(raw), frozenset())
+            found |= terms
+        return found
+
+    def keeps(self, found: set[str]) -> bool:
+        rules = self.rules
+        if rules.include and found.isdisjoint(rules.include):
+            return False
+        if rules.exclude and not found.isdisjoint(rules.exclude):
+            return False
+        return all(t in found for t in rules.required)
+
+    def select(self, items: list[NewsItem]) -> tuple[list[NewsItem], dict[str, Any]]:
+        """Items that pass, plus stats: `checked`, `kept` and per-rule `hits` ("<kind>:<term>": items matched)."""
+        kept: list[NewsItem] = []
+        hits: Counter[str] = Counter()
+        for item in items:
+            found = self.matches(f"{item.title}\n{item.summary or ''}")
+            for term in found:
+                for kind in self.kinds.get(term, ()):
+                    hits[f"{kind}:{term}"] += 1
+            if self.keeps(found):
+                kept.append(item)
+        return kept, {"checked": len(items), "kept": len(kept), "hits": dict(sorted(hits.items()))}
+
+
+@lru_cache(maxsize=64)
+def compile_rules(rules: KeywordRules) -> KeywordFilter:
+    """Compiled filter for a rule set; the same rules (any section, any run in this process) compile once."""
+    return KeywordFilter(rules)
+
+
+def _trie_regex(terms: list[str]) -> str:
+    trie: dict[str, Any] = {}
+    for term in terms:
+        node = trie
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+    return _node_regex(trie)
+
+
+def _node_regex(node: dict[str, Any]) -> str:
+    # Longer continuations are tried first (greedy `?`), so the longest term at a position wins.
+    branches = [(r"\s+" if ch == " " else re.escape(ch)) + _node_regex(child) for ch, child in node.items() if ch]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if "" in node:
+        return f"(?:{body})?"
+    return body
+
+
+def _norm(term: str) -> str:
+    return " ".join(term.casefold().split())
@@ -1,43 +1,122 @@
 from __future__ import annotations
 
+import codecs
 import html
+import math
 import re
-from datetime import date, datetime, timedelta
-from typing import Any
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Iterator
 from zoneinfo import ZoneInfo
 
-import feedparser
-from dateutil import parser as dt_parser
-
+from .feed_stream import FeedSyntaxError, iter_feed_entries
+from .gazetteer import place_label
 from .models import NewsItem, StrikeItem
+from .timeparse import get_zone, parse_timestamp
 from .utils import dedupe_key
 
 
-def parse_rss_news(section: str, source_name: str, url: str, tz_name: str) -> list[NewsItem]:
-    feed = feedparser.parse(url)
-    out: list[NewsItem] = []
-    tz = ZoneInfo(tz_name)
-    for entry in feed.entries:
-        title = (entry.get("title") or "").strip()
-        link = (entry.get("link") or "").strip()
+# Consecutive out-of-window entries after which a streamed feed is assumed to be past the window.
+STALE_RUN_LIMIT = 5
+
+TABLE_TOKEN_RE = re.compile(
+    r"<(/?)tr(?=[\s/>])[^>]*>|<t[dh](?=[\s/>])[^>]*>(.*?)</t[dh]\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+ANY_TAG_RE = re.compile(r"<[^>]+>")
+WS_RE = re.compile(r"\s+")
+DDMMYYYY_RE = re.compile(r"(\d{2})/(\d{2})/(\d{4})")
+DDMMYYYY_TEXT_RE = re.compile(r"(\d{2}/\d{2}/\d{4})")
+TIME_RANGE_RE = re.compile(r"DALLE\s+(\d{1,2})[.:](\d{2})\s+ALLE\s+(\d{1,2})[.:](\d{2})", re.IGNORECASE)
+IMPACT_RE = re.compile(
+    r"(\d{1,2}\s*ORE[^.;]*|INTERA\s+GIORNATA[^.;]*|DALLE\s+\d{1,2}[.:]\d{2}\s+ALLE\s+\d{1,2}[.:]\d{2})",
+    re.IGNORECASE,
+)
+
+
+def parse_rss_news(
+    section: str,
+    source_name: str,
+    payload: bytes,
+    tz_name: str,
+    headers: dict[str, str] | None = None,
+    since: datetime | None = None,
+    max_entries: int | None = None,
+    engine: str = "feedparser",
+    truncated: bool = False,
+) -> list[NewsItem]:
+    """Entries of an RSS/Atom feed as `NewsItem`s.
+
+    `engine="stream"` reads the XML incrementally and stops early (see `iter_rss_news`); feeds it cannot
+    read are handed to feedparser. `since` / `max_entries` are applied by both engines. `truncated` marks
+    a body cut off by the fetch limits: the stream engine then keeps the entries read before the break.
+    """
+    tz = get_zone(tz_name)
+    if engine == "stream":
+        out: list[NewsItem] = []
+        try:
+            for item in iter_rss_news(section, source_name, payload, tz, since=since, max_entries=max_entries):
+                out.append(item)
+        except FeedSyntaxError:
+            # A truncated body breaks off mid-document: keep what was read. A malformed feed goes to feedparser,
+            # which recovers past the bad spot instead of dropping every later entry.
+            if out and truncated:
+                return out
+            return _parse_rss_feedparser(section, source_name, payload, tz, headers, since, max_entries)
+        return out
+    return _parse_rss_feedparser(section, source_name, payload, tz, headers, since, max_entries)
+
+
+def limit_entries(items: list[NewsItem], since: datetime | None, max_entries: int | None) -> list[NewsItem]:
+    """Apply `since` / `max_entries` to an unfiltered feedparser result exactly as `parse_rss_news` would."""
+    if since is not None:
+        items = [x for x in items if x.published_at is None or x.published_at >= since]
+    return items[:max_entries] if max_entries is not None else items
+
+
+def iter_rss_news(
+    section: str,
+    source_name: str,
+    payload: bytes,
+    tz: ZoneInfo,
+    since: datetime | None = None,
+    max_entries: int | None = None,
+) -> Iterator[NewsItem]:
+    """Lazily yield `NewsItem`s from a well-formed RSS 2.0 / RSS 1.0 / Atom payload.
+
+    Entries older than `since` are skipped; after `STALE_RUN_LIMIT` of them in a row the feed is taken
+    to have moved past the window and reading stops. Raises `FeedSyntaxError` on malformed XML.
+    """
+    stale = 0
+    kept = 0
+    for entry in iter_feed_entries(payload):
+        if max_entries is not None and kept >= max_entries:
+            return
+        title = entry["title"]
+        link = entry["link"]
         if not title or not link:
             continue
-        published = _parse_entry_datetime(entry, tz)
-        out.append(
-            NewsItem(
-                section=section,
-                title=title,
-                url=link,
-                source=source_name,
-                published_at=published,
-                summary=(entry.get("summary") or "").strip() or None,
-            )
+        published = _parse_datetime(entry["published"], tz)
+        if since is not None and published is not None and published < since:
+            stale += 1
+            if stale >= STALE_RUN_LIMIT:
+                return
+            continue
+        stale = 0
+        kept += 1
+        yield NewsItem(
+            section=section,
+            title=title,
+            url=link,
+            source=source_name,
+            published_at=published,
+            summary=entry["summary"] or None,
         )
-    return out
 
 
 def parse_json_news_generic(section: str, source_name: str, payload: Any, tz_name: str) -> list[NewsItem]:
-    tz = ZoneInfo(tz_name)
+    tz = get_zone(tz_name)
     rows: list[dict[str, Any]]
     if isinstance(payload, list):
         rows = [x for x in payload if isinstance(x, dict)]
@@ -67,7 +146,7 @@ def parse_json_news_generic(section: str, source_name: str, payload: Any, tz_nam
 
 
 def parse_strikes_italy_transport(payload: Any, tz_name: str) -> list[StrikeItem]:
-    tz = ZoneInfo(tz_name)
+    tz = get_zone(tz_name)
     rows: list[dict[str, Any]]
     if isinstance(payload, list):
         rows = [x for x in payload if isinstance(x, dict)]
@@ -89,9 +168,13 @@ def parse_strikes_italy_transport(payload: Any, tz_name: str) -> list[StrikeItem
     return out
 
 
-def parse_strikes_italy_mit_rss(url: str, tz_name: str) -> list[StrikeItem]:
-    feed = feedparser.parse(url)
-    tz = ZoneInfo(tz_name)
+def parse_strikes_italy_mit_rss(
+    payload: bytes,
+    tz_name: str,
+    headers: dict[str, str] | None = None,
+) -> list[StrikeItem]:
+    feed = _parse_feed(payload, headers)
+    tz = get_zone(tz_name)
     out: list[StrikeItem] = []
     for entry in feed.entries:
         text = " ".join(
@@ -112,35 +195,83 @@ def parse_strikes_italy_mit_rss(url: str, tz_name: str) -> list[StrikeItem]:
 
 
 def parse_strikes_italy_mit_html(page_html: str, tz_name: str) -> list[StrikeItem]:
-    tz = ZoneInfo(tz_name)
-    rows = re.findall(r"<tr[^>]*>(.*?)</tr>", page_html, flags=re.IGNORECASE | re.DOTALL)
-    out: list[StrikeItem] = []
-    for row in rows:
-        cols = re.findall(r"<t[dh][^>]*>(.*?)</t[dh]>", row, flags=re.IGNORECASE | re.DOTALL)
-        clean_cols = [_clean_html(c) for c in cols]
-        if len(clean_cols) < 12:
-            continue
-        # Expected MIT columns:
-        # 0=inize,1=fine,2=sindacati,3=settore,4=categoria,5=modalita,6=rilevanza,7=note,8=data proclamazione,9=regione,10=provincia,11=data ricezione
-        start = _parse_ddmmyyyy(clean_cols[0], tz)
-        end = _parse_ddmmyyyy(clean_cols[1], tz)
-        if start is None and end is None:
-            continue
-        title = f"{clean_cols[3]} | {clean_cols[4]}".strip(" |")
-        region = clean_cols[9]
-        province = clean_cols[10]
-        city = "/".join([x for x in [region, province] if x]) or None
-        impact = clean_cols[5] or None
-        out.append(
-            StrikeItem(
-                title=title or "罢工",
-                start=start,
-                end=end,
-                impact_window=impact,
-                city=city,
-            )
-        )
-    return out
+    table = MitStrikeTableParser(tz_name)
+    table.feed(page_html)
+    return table.close()
+
+
+class MitStrikeTableParser:
+    """Single-pass tokenizer for the MIT strikes table; rows become `StrikeItem`s as soon as they close.
+
+    One precompiled pattern yields row tags and whole cells in document order. Feed it text (`feed`)
+    or raw UTF-8 bytes straight off the wire (`feed_bytes`), then call `close`.
+    """
+
+    def __init__(self, tz_name: str):
+        self.tz = get_zone(tz_name)
+        self.items: list[StrikeItem] = []
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._pending = ""
+        self._row: list[str] | None = None
+
+    def feed_bytes(self, chunk: bytes) -> None:
+        self.feed(self._decoder.decode(chunk))
+
+    def feed(self, text: str) -> None:
+        buf = self._pending + text
+        last = 0
+        for m in TABLE_TOKEN_RE.finditer(buf):
+            last = m.end()
+            cell = m.group(2)
+            if cell is not None:
+                if self._row is not None:
+                    self._row.append(_clean_cell(cell))
+            elif not m.group(1):
+                self._row = []
+            elif self._row is not None:
+                item = _mit_row_item(self._row, self.tz)
+                if item is not None:
+                    self.items.append(item)
+                self._row = None
+        # Carry over what may still complete: inside a row a whole half-received cell,
+        # outside one just a tag that is still arriving.
+        cut = buf.find("<", last) if self._row is not None else buf.rfind("<", last)
+        self._pending = buf[cut:] if cut != -1 else ""
+
+    def close(self) -> list[StrikeItem]:
+        self.feed(self._decoder.decode(b"", final=True))
+        self._pending = ""
+        return self.items
+
+
+def _clean_cell(raw: str) -> str:
+    if "<" in raw:
+        raw = ANY_TAG_RE.sub(" ", raw)
+    raw = " ".join(raw.split())
+    return html.unescape(raw) if "&" in raw else raw
+
+
+def _mit_row_item(clean_cols: list[str], tz: ZoneInfo) -> StrikeItem | None:
+    if len(clean_cols) < 12:
+        return None
+    # Expected MIT columns:
+    # 0=inize,1=fine,2=sindacati,3=settore,4=categoria,5=modalita,6=rilevanza,7=note,8=data proclamazione,9=regione,10=provincia,11=data ricezione
+    start = _parse_ddmmyyyy(clean_cols[0], tz)
+    end = _parse_ddmmyyyy(clean_cols[1], tz)
+    if start is None and end is None:
+        return None
+    title = f"{clean_cols[3]} | {clean_cols[4]}".strip(" |")
+    region = clean_cols[9]
+    province = clean_cols[10]
+    city = "/".join([x for x in [region, province] if x]) or None
+    impact = clean_cols[5] or None
+    return StrikeItem(
+        title=title or "罢工",
+        start=start,
+        end=end,
+        impact_window=impact,
+        city=city,
+    )
 
 
 def is_today_or_recent(
@@ -152,37 +283,98 @@ def is_today_or_recent(
 ) -> bool:
     if dt is None:
         return not only_today
-    local_day = dt.astimezone(ZoneInfo(timezone)).date()
+    local_day = dt.astimezone(get_zone(timezone)).date()
     if only_today:
         return local_day == report_day
     return local_day >= report_day - timedelta(days=max(fallback_days, 0))
 
 
+@dataclass(frozen=True)
+class TimeWindow:
+    """A section's acceptance window as UTC epoch seconds, `start <= t < end`, computed once per run.
+
+    Same result as `is_today_or_recent` for every item, without per-item zone conversion or date math.
+    """
+
+    start: float
+    end: float
+    keep_undated: bool
+
+    @classmethod
+    def for_report_day(cls, report_day: date, tz: ZoneInfo, only_today: bool, fallback_days: int) -> "TimeWindow":
+        first_day = report_day if only_today else report_day - timedelta(days=max(fallback_days, 0))
+        end = math.inf
+        if only_today:
+            next_day = report_day + timedelta(days=1)
+            end = datetime(next_day.year, next_day.month, next_day.day, tzinfo=tz).timestamp()
+        start = datetime(first_day.year, first_day.month, first_day.day, tzinfo=tz).timestamp()
+        return cls(start=start, end=end, keep_undated=not only_today)
+
+    @property
+    def since(self) -> datetime:
+        return datetime.fromtimestamp(self.start, timezone.utc)
+
+    def select(self, items: list[NewsItem]) -> list[NewsItem]:
+        start, end, keep_undated = self.start, self.end, self.keep_undated
+        stamps = [x.published_at.timestamp() if x.published_at is not None else None for x in items]
+        return [x for x, t in zip(items, stamps) if (keep_undated if t is None else start <= t < end)]
+
+
+def _parse_rss_feedparser(
+    section: str,
+    source_name: str,
+    payload: bytes,
+    tz: ZoneInfo,
+    headers: dict[str, str] | None,
+    since: datetime | None,
+    max_entries: int | None,
+) -> list[NewsItem]:
+    feed = _parse_feed(payload, headers)
+    out: list[NewsItem] = []
+    for entry in feed.entries:
+        if max_entries is not None and len(out) >= max_entries:
+            break
+        title = (entry.get("title") or "").strip()
+        link = (entry.get("link") or "").strip()
+        if not title or not link:
+            continue
+        published = _parse_entry_datetime(entry, tz)
+        if since is not None and published is not None and published < since:
+            continue
+        out.append(
+            NewsItem(
+                section=section,
+                title=title,
+                url=link,
+                source=source_name,
+                published_at=published,
+                summary=(entry.get("summary") or "").strip() or None,
+            )
+        )
+    return out
+
+
+def _parse_feed(payload: bytes, headers: dict[str, str] | None) -> Any:
+    # The raw bytes go straight to feedparser (no decode/re-encode); it sniffs the charset from
+    # them and the Content-Type header. A truncated body still yields the entries that arrived.
+    # Imported here: runs whose sources never need feedparser do not pay for loading it.
+    import feedparser
+
+    return feedparser.parse(payload, response_headers=headers or {})
+
+
 def _parse_entry_datetime(entry: Any, tz: ZoneInfo) -> datetime | None:
     value = entry.get("published") or entry.get("updated")
     return _parse_datetime(value, tz)
 
 
 def _parse_datetime(value: Any, tz: ZoneInfo) -> datetime | None:
-    if not value:
-        return None
-    try:
-        dt = dt_parser.parse(str(value))
-    except Exception:
-        return None
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=tz)
-    return dt
-
-
-def _clean_html(value: str) -> str:
-    no_tags = re.sub(r"<[^>]+>", " ", value)
-    normalized = re.sub(r"\s+", " ", no_tags).strip()
-    return html.unescape(normalized)
+    return parse_timestamp(value, tz)
 
 
+@lru_cache(maxsize=1024)
 def _parse_ddmmyyyy(value: str, tz: ZoneInfo) -> datetime | None:
-    m = re.search(r"(\d{2})/(\d{2})/(\d{4})", value)
+    m = DDMMYYYY_RE.search(value)
     if not m:
         return None
     day, month, year = map(int, m.groups())
@@ -190,16 +382,12 @@ def _parse_ddmmyyyy(value: str, tz: ZoneInfo) -> datetime | None:
 
 
 def _extract_dates_and_times(text: str, tz: ZoneInfo) -> tuple[datetime | None, datetime | None]:
-    date_matches = re.findall(r"(\d{2}/\d{2}/\d{4})", text)
+    date_matches = DDMMYYYY_TEXT_RE.findall(text)
     start = _parse_ddmmyyyy(date_matches[0], tz) if len(date_matches) >= 1 else None
     end = _parse_ddmmyyyy(date_matches[1], tz) if len(date_matches) >= 2 else start
 
     # Examples: "DALLE 13.00 ALLE 17.00", "DALLE 00:01 ALLE 24.00"
-    tm = re.search(
-        r"DALLE\s+(\d{1,2})[.:](\d{2})\s+ALLE\s+(\d{1,2})[.:](\d{2})",
-        text,
-        flags=re.IGNORECASE,
-    )
+    tm = TIME_RANGE_RE.search(text)
     if tm and start:
         sh, sm, eh, em = map(int, tm.groups())
         sh = min(sh, 23)
@@ -210,25 +398,14 @@ def _extract_dates_and_times(text: str, tz: ZoneInfo) -> tuple[datetime | None,
 
 
 def _extract_impact_window(text: str) -> str | None:
-    m = re.search(
-        r"(\d{1,2}\s*ORE[^.;]*|INTERA\s+GIORNATA[^.;]*|DALLE\s+\d{1,2}[.:]\d{2}\s+ALLE\s+\d{1,2}[.:]\d{2})",
-        text,
-        flags=re.IGNORECASE,
-    )
+    m = IMPACT_RE.search(text)
     if not m:
         return None
-    return re.sub(r"\s+", " ", m.group(1)).strip()
+    return WS_RE.sub(" ", m.group(1)).strip()
 
 
 def _extract_city_hint(text: str) -> str | None:
-    low = text.lower()
-    if "milano" in low or "milan" in low:
-        return "Milano"
-    if "lombardia" in low:
-        return "Lombardia"
-    if "italia" in low or "tutte" in low:
-        return "Italia/Tutte"
-    return None
+    return place_label(text)
 
 
 def parse_web_search_results(section: str, source_name: str, results: list[dict[str, Any]], tz_name: str) -> list[NewsItem]:
@@ -244,7 +421,7 @@ def parse_web_search_results(section: str, source_name: str, results: list[dict[
     Returns:
         List of NewsItem objects
     """
-    tz = ZoneInfo(tz_name)
+    tz = get_zone(tz_name)
     out: list[NewsItem] = []
     
     for item in results:
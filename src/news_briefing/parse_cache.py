@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import hashlib
+import importlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Union
+from zoneinfo import ZoneInfo
+
+from .models import NewsItem, StrikeItem
+from .timeparse import get_zone
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS parsed_payloads (
+  key TEXT PRIMARY KEY,
+  parser TEXT NOT NULL,
+  version TEXT NOT NULL,
+  payload_hash TEXT NOT NULL,
+  tz TEXT NOT NULL,
+  items BLOB NOT NULL,
+  accessed_at REAL NOT NULL
+);
+"""
+
+DEFAULT_PARSE_CACHE_DAYS = 14
+
+# Modules whose code decides what a payload parses to; editing any of them changes `parser_version()`.
+PARSER_MODULES = ("parse", "feed_stream", "timeparse", "models", "gazetteer")
+PARSER_DATA = ("gazetteer_it.json",)
+
+Item = Union[NewsItem, StrikeItem]
+
+
+class ParseCache:
+    """Parsed items per (parser, parser version, payload SHA-256, timezone), stored as compact zlib'd JSON rows.
+
+    The version is a hash of the parser modules' source and the data they read (the gazetteer), so entries
+    written by older parser code are never served and are dropped when the cache is opened. Rows unused for `max_age_days` are dropped too.
+    """
+
+    def __init__(self, db_path: str | Path, max_age_days: float = DEFAULT_PARSE_CACHE_DAYS):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.version = parser_version()
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL;")
+        self.conn.executescript(SCHEMA)
+        self.conn.execute(
+            "DELETE FROM parsed_payloads WHERE version != ? OR accessed_at < ?",
+            (self.version, time.time() - max_age_days * 86400),
+        )
+        self.conn.commit()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0}
+
+    @classmethod
+    def from_config(cls, db_path: str | Path, pc_cfg: dict[str, Any] | None) -> "ParseCache":
+        pc_cfg = pc_cfg or {}
+        return cls(db_path, max_age_days=float(pc_cfg.get("max_age_days", DEFAULT_PARSE_CACHE_DAYS)))
+
+    def parse(
+        self,
+        parser: str,
+        payload: bytes,
+        tz_name: str,
+        parse: Callable[[], list[Item]],
+        **args: Any,
+    ) -> list[Item]:
+        """Items stored for this payload, or `parse()`'s result (which is then stored).
+
+        `args` are any further inputs the result depends on (section, source name, cutoff...).
+        """
+        key = parse_key(parser, self.version, payload, tz_name, args)
+        items = self.lookup(key, tz_name)
+        if items is not None:
+            return items
+        items = parse()
+        self.store(key, parser, payload, tz_name, items)
+        return items
+
+    def lookup(self, key: str, tz_name: str) -> list[Item] | None:
+        with self._lock:
+            row = self.conn.execute("SELECT items FROM parsed_payloads WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["hits"] += 1
+            self.conn.execute("UPDATE parsed_payloads SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            self.conn.commit()
+        return decode_items(json.loads(zlib.decompress(bytes(row[0]))), get_zone(tz_name))
+
+    def store(self, key: str, parser: str, payload: bytes, tz_name: str, items: list[Item]) -> None:
+        rows = encode_items(items, get_zone(tz_name))
+        blob = zlib.compress(json.dumps(rows, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+        with self._lock:
+            self.conn.execute(
+                """
+                INSERT INTO parsed_payloads(key, parser, version, payload_hash, tz, items, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET items = excluded.items, accessed_at = excluded.accessed_at
+                """,
+                (
+                    key,
+                    parser,
+                    self.version,
+                    hashlib.sha256(payload).hexdigest(),
+                    tz_name,
+                    sqlite3.Binary(blob),
+                    time.time(),
+                ),
+            )
+            self.conn.commit()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            out: dict[str, Any] = dict(self._stats)
+        lookups = out["hits"] + out["misses"]
+        out["hit_rate"] = round(out["hits"] / lookups, 4) if lookups else 0.0
+        return out
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
+
+def parse_key(parser: str, version: str, payload: bytes, tz_name: str, args: dict[str, Any]) -> str:
+    payload_hash = hashlib.sha256(payload).hexdigest()
+    raw = json.dumps([parser, version, payload_hash, tz_name, args], sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=1)
+def parser_version() -> str:
+    digest = hashlib.sha256()
+    for name in PARSER_MODULES:
+        module = importlib.import_module(f".{name}", __package__)
+        digest.update(name.encode("utf-8"))
+        digest.update(Path(str(module.__file__)).read_bytes())
+    for name in PARSER_DATA:
+        digest.update(name.encode("utf-8"))
+        digest.update(Path(__file__).with_name(name).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def encode_items(items: list[Item], tz: ZoneInfo) -> list[list[Any]]:
+    """Items as plain lists of str/None (datetimes in `tz` keep their zone); inverse of `decode_items`."""
+    rows: list[list[Any]] = []
+    for x in items:
+        if isinstance(x, NewsItem):
+            rows.append(["n", x.section, x.title, x.url, x.source, _dump_dt(x.published_at, tz), x.summary, x.extra])
+        else:
+            rows.append(["s", x.title, _dump_dt(x.start, tz), _dump_dt(x.end, tz), x.impact_window, x.city])
+    return rows
+
+
+def decode_items(rows: list[list[Any]], tz: ZoneInfo) -> list[Item]:
+    out: list[Item] = []
+    for row in rows:
+        if row[0] == "n":
+            _, section, title, url, source, published, summary, extra = row
+            out.append(NewsItem(section, title, url, source, _load_dt(published, tz), summary, extra))
+        else:
+            _, title, start, end, impact, city = row
+            out.append(StrikeItem(title, _load_dt(start, tz), _load_dt(end, tz), impact, city))
+    return out
+
+
+def _dump_dt(dt: datetime | None, tz: ZoneInfo) -> str | None:
+    # Datetimes in the keyed zone are stored as wall time ("L"/"F" for fold) so they come back with the
+    # same ZoneInfo rather than a fixed offset; anything else round-trips through its ISO form.
+    if dt is None:
+        return None
+    if dt.tzinfo is tz:
+        return ("F" if dt.fold else "L") + dt.replace(tzinfo=None).isoformat()
+    return dt.isoformat()
+
+
+def _load_dt(value: str | None, tz: ZoneInfo) -> datetime | None:
+    if value is None:
+        return None
+    if value[0] in "LF":
+        return datetime.fromisoformat(value[1:]).replace(tzinfo=tz, fold=int(value[0] == "F"))
+    return datetime.fromisoformat(value)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable
+
+from .parse_cache import Item, decode_items, encode_items
+from .timeparse import get_zone
+
+
+DEFAULT_PARSE_POOL_MIN_KB = 512
+
+
+class ParsePool:
+    """Parses large payloads in worker processes; everything under `min_bytes` is parsed in the calling thread.
+
+    Parse calls must be picklable (module-level functions or `functools.partial`s of them). Workers send
+    items back as the compact rows of `encode_items`. The pool is only started by the first large payload,
+    with the spawn start method, since the pipeline forks from a process that is running fetch threads.
+    """
+
+    def __init__(self, workers: int | None = None, min_bytes: int = DEFAULT_PARSE_POOL_MIN_KB * 1024):
+        self.workers = max(int(workers or os.cpu_count() or 1), 1)
+        self.min_bytes = min_bytes
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._stats = {"inline": 0, "offloaded": 0, "offloaded_bytes": 0}
+
+    @classmethod
+    def from_config(cls, pool_cfg: dict[str, Any] | None) -> "ParsePool | None":
+        pool_cfg = pool_cfg or {}
+        if not pool_cfg.get("enabled", False):
+            return None
+        return cls(
+            workers=pool_cfg.get("workers"),
+            min_bytes=int(float(pool_cfg.get("min_kb", DEFAULT_PARSE_POOL_MIN_KB)) * 1024),
+        )
+
+    def run(self, parse: Callable[[], list[Item]], size: int, tz_name: str) -> list[Item]:
+        if size < self.min_bytes:
+            with self._lock:
+                self._stats["inline"] += 1
+            return parse()
+        with self._lock:
+            self._stats["offloaded"] += 1
+            self._stats["offloaded_bytes"] += size
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"))
+            executor = self._executor
+        rows = executor.submit(_parse_rows, parse, tz_name).result()
+        return decode_items(rows, get_zone(tz_name))
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {"workers": self.workers, "min_bytes": self.min_bytes, **self._stats}
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _parse_rows(parse: Callable[[], list[Item]], tz_name: str) -> list[list[Any]]:
+    return encode_items(parse(), get_zone(tz_name))
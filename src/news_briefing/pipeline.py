@@ -1,24 +1,34 @@
 from __future__ import annotations
 
+import codecs
 import json
+import threading
+import time
+from contextlib import contextmanager
+from functools import partial
+from dataclasses import replace
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, wait
 from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Any
-from zoneinfo import ZoneInfo
+from typing import Any, Callable, Iterator
 
-from .fetch import fetch_json, fetch_text, fetch_web_search
+from .cassette import Cassette
+from .client import FetchClient, FetchOptions, FetchResponse
+from .http_cache import DEFAULT_RESPONSE_CACHE_MB, ResponseCache, ValidatorCache
+from .fetch import fetch_json, fetch_response, fetch_web_search
+from .gazetteer import GeoScope
+from .keywords import KeywordRules, compile_rules
 from .models import DailyBrief, NewsItem, StrikeItem, WeatherInfo
-from .parse import (
-    is_today_or_recent,
-    parse_json_news_generic,
-    parse_rss_news,
-    parse_strikes_italy_mit_html,
-    parse_strikes_italy_mit_rss,
-    parse_strikes_italy_transport,
-    parse_web_search_results,
-)
+from .parse import TimeWindow, limit_entries, parse_rss_news, parse_web_search_results
+from .parse_cache import ParseCache
+from .parse_pool import ParsePool
+from .registry import ParserRegistry, ParserSpec
 from .render import render_markdown
-from .storage import Store
+from .search_cache import SearchCache
+from .seen_index import DEFAULT_SEEN_FP_RATE
+from .storage import CIRCUIT_OPEN, DEFAULT_BREAKER_COOLDOWN, Store, source_key
+from .summary import DEFAULT_SUMMARY_CHARS, clean_summaries, summary_stats, truncate_summaries
+from .timeparse import get_zone
 
 
 WEATHER_CODE_MAP = {
@@ -41,29 +51,83 @@ WEATHER_CODE_MAP = {
     95: "雷暴",
 }
 
-NEWS_PARSERS = {
-    "generic_json_news_v1": parse_json_news_generic,
-}
+NEWS_SECTIONS = ("italian_news", "world_news", "ai_news", "milan_events")
 
-STRIKE_PARSERS = {
-    "italy_transport_strikes_v1": parse_strikes_italy_transport,
-}
+DEFAULT_FETCH_WORKERS = 8
+DEFAULT_BREAKER_THRESHOLD = 3
+DEFAULT_HEDGE_QUANTILE = 0.9
+DEFAULT_HEDGE_MIN_SAMPLES = 5
+DEFAULT_HEDGE_MIN_DELAY = 0.25
+DEFAULT_LATENCY_HISTORY = 50
 
-STRIKE_RSS_PARSERS = {
-    "italy_mit_strikes_rss_v1": parse_strikes_italy_mit_rss,
-}
 
-STRIKE_HTML_PARSERS = {
-    "italy_mit_strikes_html_v1": parse_strikes_italy_mit_html,
-}
+class DeadlineExceeded(TimeoutError):
+    """Raised by a source job that starts after the run deadline has passed, or fails once it has."""
 
 
 class BriefingPipeline:
-    def __init__(self, cfg: dict[str, Any], db_path: str | Path = "data/briefing.db"):
+    def __init__(
+        self,
+        cfg: dict[str, Any],
+        db_path: str | Path = "data/briefing.db",
+        workers: int | None = None,
+        offline: bool = False,
+        cassette: Cassette | None = None,
+    ):
         self.cfg = cfg
-        self.tz = ZoneInfo(cfg.get("timezone", "Europe/Rome"))
+        fetch_cfg = cfg.get("fetch", {})
+        self.workers = int(workers if workers is not None else fetch_cfg.get("workers", DEFAULT_FETCH_WORKERS))
+        self.tz = get_zone(cfg.get("timezone", "Europe/Rome"))
         self.city = cfg.get("city", "Milan")
         self.store = Store(db_path)
+        si_cfg = cfg.get("storage", {}).get("seen_index", {})
+        if si_cfg.get("enabled", False):
+            self.store.load_seen_index(
+                float(si_cfg.get("fp_rate", DEFAULT_SEEN_FP_RATE)), window_days=si_cfg.get("window_days")
+            )
+        data_dir = Path(db_path).parent
+        # Recording/replaying must see every exchange on the wire, so local caches stay out of the way.
+        use_caches = cassette is None
+        cache = None
+        if use_caches and fetch_cfg.get("conditional_get", True):
+            cache = ValidatorCache(data_dir / "http_cache.db")
+        rc_cfg = fetch_cfg.get("response_cache", {})
+        responses = None
+        if offline or (use_caches and rc_cfg.get("enabled", True)):
+            max_mb = float(rc_cfg.get("max_mb", DEFAULT_RESPONSE_CACHE_MB))
+            responses = ResponseCache(data_dir / "response_cache", max_bytes=int(max_mb * 1024 * 1024))
+        self.offline = offline
+        self.search_cache = None
+        if offline or use_caches:
+            self.search_cache = SearchCache.from_config(data_dir / "search_cache.db", fetch_cfg.get("search"), offline)
+        pc_cfg = fetch_cfg.get("parse_cache", {})
+        self.parse_cache = None
+        if use_caches and pc_cfg.get("enabled", True):
+            self.parse_cache = ParseCache.from_config(data_dir / "parse_cache.db", pc_cfg)
+        self.parse_pool = ParsePool.from_config(fetch_cfg.get("parse_pool"))
+        self.parsers = ParserRegistry(cfg.get("parsers"))
+        cb_cfg = fetch_cfg.get("circuit_breaker", {})
+        # Breaker state is only updated from live runs; cached and replayed failures say nothing about the source.
+        self.breaker = bool(cb_cfg.get("enabled", True)) and not offline and cassette is None
+        self.breaker_threshold = int(cb_cfg.get("failure_threshold", DEFAULT_BREAKER_THRESHOLD))
+        self.breaker_cooldown = float(cb_cfg.get("cooldown_seconds", DEFAULT_BREAKER_COOLDOWN))
+        self.hedge_cfg = fetch_cfg.get("hedge", {})
+        self.hedge_after: dict[str, float] = {}
+        self.windows: dict[str, TimeWindow] = {}
+        self._filter_stats: dict[str, dict[str, Any]] = {}
+        self._geo_stats: dict[str, dict[str, int]] = {}
+        self._stragglers: list[Future] = []
+        # Only live runs teach the latency history; cached and replayed timings are not the source's.
+        self.learn_latency = not offline and cassette is None
+        self._timings: dict[str, dict[str, float]] = {}
+        self._timings_lock = threading.Lock()
+        self.client = FetchClient.from_config(
+            fetch_cfg,
+            cache=cache,
+            responses=responses,
+            offline=offline,
+            cassette=cassette,
+        )
 
     def generate(
         self,
@@ -71,14 +135,68 @@ class BriefingPipeline:
         dry_run: bool = False,
         layout: str | None = None,
         section_order: list[str] | None = None,
+        deadline: float | None = None,
     ) -> tuple[DailyBrief, str, dict[str, Any]]:
-        weather = self._fetch_weather(report_day)
-        strikes = self._fetch_strikes(report_day)
+        """Build the brief. `deadline` is a wall-clock budget in seconds for all fetching; sources
+        still outstanding when it runs out are dropped and listed under meta["deadline"]."""
+        # Every source of every section is submitted up front; results are merged
+        # back in config order so the output does not depend on completion order.
+        self.hedge_after = self._hedge_delays()
+        self.windows = {section: self._window(section, report_day) for section in NEWS_SECTIONS}
+        self._timings = {}
+        self._filter_stats = {}
+        self._geo_stats = {}
+        fetch_started = time.monotonic()
+        deadline_at = fetch_started + deadline if deadline else None
+        late: dict[str, list[str]] = {}
+        errors: dict[str, str] = {}
+        skipped: dict[str, list[str]] = {}
+        opened: list[str] = []
+        outstanding: list[Future] = []
+        executor = self._make_executor()
+        try:
+            weather_job = executor.submit(_by_deadline, deadline_at, self._fetch_weather, report_day)
+            strike_jobs = [
+                (src, executor.submit(_by_deadline, deadline_at, self._fetch_strike_source, src))
+                for src in self._admitted("strikes", skipped)
+            ]
+            section_jobs = {
+                section: [
+                    (src, executor.submit(_by_deadline, deadline_at, self._fetch_section_items, section, src))
+                    for src in self._admitted(section, skipped)
+                ]
+                for section in NEWS_SECTIONS
+            }
+            outstanding += [weather_job] + [job for _, job in strike_jobs]
+            outstanding += [job for jobs in section_jobs.values() for _, job in jobs]
+            wait(outstanding, timeout=None if deadline_at is None else max(deadline_at - time.monotonic(), 0))
 
-        italian_news = self._collect_section("italian_news", report_day)
-        world_news = self._collect_section("world_news", report_day)
-        ai_news = self._collect_section("ai_news", report_day)
-        events = self._collect_section("milan_events", report_day)
+            weather = WeatherInfo(self.city, report_day.isoformat(), None, None, None, None)
+            if not _arrived(weather_job):
+                late["weather"] = ["weather"]
+            elif deadline_at is not None and weather_job.exception() is not None:
+                # Its timeouts were capped to the budget; a failed forecast must not hold back the brief.
+                error = weather_job.exception()
+                errors["weather"] = f"{error.__class__.__name__}: {error}"[:500]
+            else:
+                weather = weather_job.result()
+            strikes = self._fetch_strikes(report_day, self._gather("strikes", strike_jobs, late, opened))
+            sections = {
+                section: self._collect_section(section, report_day, self._gather(section, jobs, late, opened))
+                for section, jobs in section_jobs.items()
+            }
+        finally:
+            # Past the deadline nobody waits for stragglers: their timeouts are capped and they are not retried
+            # past it. They still use the client and caches, so `close()` waits for them.
+            executor.shutdown(wait=deadline_at is None, cancel_futures=deadline_at is not None)
+            self._stragglers = [job for job in self._stragglers + outstanding if not job.done()]
+        fetch_seconds = time.monotonic() - fetch_started
+        self._record_latencies()
+
+        italian_news = sections["italian_news"]
+        world_news = sections["world_news"]
+        ai_news = sections["ai_news"]
+        events = sections["milan_events"]
 
         brief = DailyBrief(
             report_date=report_day.isoformat(),
@@ -105,6 +223,37 @@ class BriefingPipeline:
                 "layout": effective_layout,
                 "section_order": effective_order,
             },
+            "fetch": {
+                "workers": self.workers,
+                "seconds": round(fetch_seconds, 3),
+                "http": self.client.stats(),
+                "offline": self.offline,
+                "cassette": self.client.cassette.mode if self.client.cassette else None,
+                "cache": self._cache_meta(),
+                "truncated": self._truncation_meta(),
+                "response_cache": self.client.responses.stats() if self.client.responses else None,
+                "search": self.search_cache.stats() if self.search_cache else None,
+                "parse_cache": self.parse_cache.stats() if self.parse_cache else None,
+                "parse_pool": self.parse_pool.stats() if self.parse_pool else None,
+                "summaries": summary_stats(),
+                "hedge": self._hedge_meta(),
+                "sources": self._timing_meta(),
+            },
+            "deadline": {
+                "budget_seconds": deadline,
+                "late_sections": sorted(late),
+                "late_sources": late,
+                "errors": errors,
+            },
+            "filters": self._filter_stats,
+            "geo": self._geo_stats,
+            "seen_index": self.store.seen_index_stats(),
+            "circuits": {
+                "enabled": self.breaker,
+                "skipped": skipped,
+                "opened": opened,
+                "sources": self._circuit_meta(),
+            },
         }
         if not dry_run:
             output_dir = Path("output")
@@ -112,32 +261,50 @@ class BriefingPipeline:
             run_dir = output_dir / "runs"
             run_dir.mkdir(parents=True, exist_ok=True)
             md_path = output_dir / f"{brief.report_date}.md"
-            md_path.write_text(markdown, encoding="utf-8")
-
-            run_payload = _brief_to_dict(brief)
             run_json_path = run_dir / f"{brief.report_date}.json"
-            run_json_path.write_text(json.dumps(run_payload, ensure_ascii=False, indent=2), encoding="utf-8")
 
-            run_id = self.store.create_run(brief.report_date, str(md_path), meta=meta)
-            for item in italian_news + world_news + ai_news + events:
-                self.store.store_item(run_id, brief.report_date, item)
+            def write_outputs() -> None:
+                md_path.write_text(markdown, encoding="utf-8")
+                run_payload = _brief_to_dict(brief)
+                run_json_path.write_text(json.dumps(run_payload, ensure_ascii=False, indent=2), encoding="utf-8")
+
+            # Run rows and seen items commit only once both files are written.
+            self.store.persist_run(
+                brief.report_date,
+                str(md_path),
+                meta,
+                italian_news + world_news + ai_news + events,
+                write_outputs=write_outputs,
+            )
             meta["output_markdown"] = str(md_path)
             meta["output_json"] = str(run_json_path)
         return brief, markdown, meta
 
     def close(self) -> None:
+        wait(self._stragglers)
+        self._stragglers = []
+        self.client.close()
+        if self.search_cache is not None:
+            self.search_cache.close()
+        if self.parse_cache is not None:
+            self.parse_cache.close()
+        if self.parse_pool is not None:
+            self.parse_pool.close()
         self.store.close()
 
-    def _fetch_weather(self, report_day: date) -> WeatherInfo:
+    def _weather_url(self) -> str:
         w_cfg = self.cfg.get("weather", {})
         lat = w_cfg.get("latitude", 45.4642)
         lon = w_cfg.get("longitude", 9.19)
-        url = (
+        return (
             "https://api.open-meteo.com/v1/forecast"
             f"?latitude={lat}&longitude={lon}&daily=weathercode,temperature_2m_max,temperature_2m_min,precipitation_probability_max"
             f"&timezone={self.cfg.get('timezone', 'Europe/Rome')}"
         )
-        payload = fetch_json(url)
+
+    def _fetch_weather(self, report_day: date, deadline_at: float | None = None) -> WeatherInfo:
+        options = self._fetch_options("weather", self.cfg.get("weather", {}), deadline_at)
+        payload = fetch_json(self._weather_url(), client=self.client, options=options)
         daily = payload.get("daily", {})
         dates = daily.get("time", [])
         idx = 0
@@ -155,111 +322,407 @@ class BriefingPipeline:
             precipitation_probability_max=_safe_pick(daily.get("precipitation_probability_max"), idx),
         )
 
-    def _fetch_strikes(self, report_day: date) -> list[StrikeItem]:
+    def _fetch_strike_source(self, src: dict[str, Any], deadline_at: float | None = None) -> list[StrikeItem]:
+        src_type = src.get("type")
+        url = (src.get("url") or "").strip()
+        if not url:
+            return []
+        tz_name = self.cfg.get("timezone", "Europe/Rome")
+        options = self._fetch_options("strikes", src, deadline_at)
+        spec = self.parsers.get(src.get("parser"), "strikes", str(src_type))
+        if spec is None:
+            return []
+        key = source_key("strikes", str(src.get("name", "Unknown")))
+        stream_cls = spec.load_stream()
+        if stream_cls is not None:
+            return self._fetch_streamed(key, url, tz_name, options, spec, stream_cls(tz_name))
+        with self._timed(key, "fetch"):
+            resp = fetch_response(url, client=self.client, options=options)
+        with self._timed(key, "parse"):
+            return self._run_parser(spec, resp, tz_name)
+
+    def _fetch_streamed(
+        self,
+        key: str,
+        url: str,
+        tz_name: str,
+        options: FetchOptions,
+        spec: ParserSpec,
+        stream: Any,
+    ) -> list[StrikeItem]:
+        # Rows are parsed as chunks arrive, so parsing overlaps the download.
+        with self._timed(key, "fetch"):
+            resp = fetch_response(url, client=self.client, options=replace(options, on_chunk=stream.feed_bytes))
+        with self._timed(key, "parse"):
+            if resp.streamed and codecs.lookup(resp.encoding or "utf-8").name == "utf-8":
+                # Already parsed; storing the rows still lets a revalidated (304) body skip the parse next time.
+                return self._parsed(
+                    spec.cache_name, resp.content, tz_name, stream.close, content_type=resp.headers.get("content-type")
+                )
+            # Served from a cache or replayed, or not UTF-8: parse the finished body instead.
+            return self._run_parser(spec, resp, tz_name)
+
+    def _fetch_strikes(self, report_day: date, batches: list[list[StrikeItem]]) -> list[StrikeItem]:
         s_cfg = self.cfg.get("strikes", {})
         lookahead_days = int(s_cfg.get("lookahead_days", 20))
-        sources = s_cfg.get("sources", [])
-        all_items: list[StrikeItem] = []
-        for src in sources:
-            src_type = src.get("type")
-            url = (src.get("url") or "").strip()
-            if not url:
-                continue
-            try:
-                if src_type == "json":
-                    payload = fetch_json(url)
-                    parser_name = src.get("parser", "italy_transport_strikes_v1")
-                    parser = STRIKE_PARSERS.get(parser_name)
-                    if parser:
-                        all_items.extend(parser(payload, self.cfg.get("timezone", "Europe/Rome")))
-                elif src_type == "rss":
-                    parser_name = src.get("parser", "italy_mit_strikes_rss_v1")
-                    parser = STRIKE_RSS_PARSERS.get(parser_name)
-                    if parser:
-                        all_items.extend(parser(url, self.cfg.get("timezone", "Europe/Rome")))
-                elif src_type == "html":
-                    page_html = fetch_text(url)
-                    parser_name = src.get("parser", "italy_mit_strikes_html_v1")
-                    parser = STRIKE_HTML_PARSERS.get(parser_name)
-                    if parser:
-                        all_items.extend(parser(page_html, self.cfg.get("timezone", "Europe/Rome")))
-            except Exception:
-                continue
-
         day_end = report_day + timedelta(days=lookahead_days)
+        # Strikes whose location names no known place are dropped unless the scope says otherwise.
+        raw_scope = s_cfg.get("geo_scope") or {"cities": [self.cfg.get("city", "Milan")], "national": True}
+        scope = GeoScope.from_config(raw_scope, unlocated=False)
         out: list[StrikeItem] = []
-        for item in all_items:
+        for item in (x for batch in batches for x in batch):
             if item.start is None:
                 continue
             item_day = item.start.astimezone(self.tz).date()
-            city = (item.city or "").lower()
-            is_milan = (
-                (not city)
-                or ("milan" in city)
-                or ("milano" in city)
-                or ("lombardia" in city)
-                or ("italia" in city)
-                or ("tutte" in city)
-            )
-            if is_milan and report_day <= item_day <= day_end:
+            if report_day <= item_day <= day_end and scope.keeps(item.city):
                 out.append(item)
         out.sort(key=lambda x: x.start or datetime.max.replace(tzinfo=self.tz))
         return out
 
-    def _collect_section(self, section: str, report_day: date) -> list[NewsItem]:
+    def _fetch_section_items(
+        self,
+        section: str,
+        src: dict[str, Any],
+        deadline_at: float | None = None,
+    ) -> list[NewsItem]:
+        # Summaries become plain text as soon as they arrive, so raw HTML never reaches candidates or run files.
+        # They stay whole until `_collect_section` has filtered on them.
+        return clean_summaries(self._fetch_section_source(section, src, deadline_at), None)
+
+    def _fetch_section_source(
+        self,
+        section: str,
+        src: dict[str, Any],
+        deadline_at: float | None = None,
+    ) -> list[NewsItem]:
+        src_type = src.get("type")
+        src_name = src.get("name", "Unknown")
+        url = (src.get("url") or "").strip()
+        if not url:
+            return []
+        tz_name = self.cfg.get("timezone", "Europe/Rome")
+        options = self._fetch_options(section, src, deadline_at)
+        key = source_key(section, str(src_name))
+        if src_type == "rss" and not src.get("parser"):
+            with self._timed(key, "fetch"):
+                resp = fetch_response(url, client=self.client, options=options)
+            with self._timed(key, "parse"):
+                return self._parse_rss(
+                    section, str(src_name), src, resp.content, resp.headers, tz_name, truncated=bool(resp.truncated)
+                )
+        if src_type in ("json", "rss", "html"):
+            spec = self.parsers.get(src.get("parser"), "news", src_type)
+            if spec is None:
+                return []
+            with self._timed(key, "fetch"):
+                resp = fetch_response(url, client=self.client, options=options)
+            with self._timed(key, "parse"):
+                return self._run_parser(spec, resp, tz_name, section, src_name, section=section, source=src_name)
+        if src_type == "search":
+            # Web search: url field is used as the search query
+            search_query = url.strip()
+            with self._timed(key, "fetch"):
+                search_results = fetch_web_search(
+                    search_query,
+                    count=src.get("count", 10),
+                    country=src.get("country", "IT"),
+                    client=self.client,
+                    options=options,
+                    cache=self.search_cache,
+                )
+            with self._timed(key, "parse"):
+                return parse_web_search_results(section, src_name, search_results, tz_name)
+        return []
+
+    def _parse_rss(
+        self,
+        section: str,
+        src_name: str,
+        src: dict[str, Any],
+        payload: bytes,
+        headers: dict[str, str],
+        tz_name: str,
+        truncated: bool = False,
+    ) -> list[NewsItem]:
+        since = self.windows[section].since if section in self.windows else None
+        max_entries = int(src["max_entries"]) if src.get("max_entries") else None
+        engine = str(src.get("engine") or self.cfg.get(section, {}).get("rss_engine", "feedparser"))
+        run = partial(parse_rss_news, section, src_name, payload, tz_name, headers=headers, engine=engine)
+        args = {"section": section, "source": src_name, "content_type": headers.get("content-type")}
+        if engine == "stream":
+            # The stream engine stops reading at the cutoff, so its result depends on it.
+            return self._parsed(
+                "rss:stream",
+                payload,
+                tz_name,
+                partial(run, since=since, max_entries=max_entries, truncated=truncated),
+                offload=True,
+                since=since.isoformat() if since else None,
+                max_entries=max_entries,
+                truncated=truncated,
+                **args,
+            )
+        # feedparser reads the whole feed anyway: cache it unfiltered so the entry stays valid as the window moves.
+        items = self._parsed(f"rss:{engine}", payload, tz_name, run, offload=True, **args)
+        return limit_entries(items, since, max_entries)
+
+    def _run_parser(self, spec: ParserSpec, resp: FetchResponse, tz_name: str, *lead: Any, **args: Any) -> Any:
+        """Parse `resp` with `spec` (news parsers get `section, source_name` as `lead`)."""
+        parser = spec.load()
+        if spec.source_type == "json" and not spec.accepts_bytes:
+            return self._parsed(
+                spec.cache_name, resp.content, tz_name, lambda: parser(*lead, resp.json(), tz_name), **args
+            )
+        body = resp.content if spec.accepts_bytes else resp.text
+        kwargs = {"headers": resp.headers} if spec.source_type == "rss" else {}
+        return self._parsed(
+            spec.cache_name,
+            resp.content,
+            tz_name,
+            partial(parser, *lead, body, tz_name, **kwargs),
+            offload=True,
+            content_type=resp.headers.get("content-type"),
+            **args,
+        )
+
+    def _parsed(
+        self,
+        parser: str,
+        payload: bytes,
+        tz_name: str,
+        parse: Callable[[], list[Any]],
+        offload: bool = False,
+        **args: Any,
+    ) -> Any:
+        """Items for `payload`: from the parse cache, else by `parse` (in the process pool when `offload` is
+        set and the payload is large; `parse` must then be picklable). JSON sources are never offloaded:
+        decoding is C code, and shipping the body out would cost more than the parse itself."""
+        if offload and self.parse_pool is not None:
+            parse = partial(self.parse_pool.run, parse, len(payload), tz_name)
+        if self.parse_cache is None:
+            return parse()
+        return self.parse_cache.parse(parser, payload, tz_name, parse, **args)
+
+    @contextmanager
+    def _timed(self, key: str, phase: str) -> Iterator[None]:
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            elapsed = time.monotonic() - started
+            with self._timings_lock:
+                row = self._timings.setdefault(key, {"fetch": 0.0, "parse": 0.0})
+                row[phase] += elapsed
+
+    def _window(self, section: str, report_day: date) -> TimeWindow:
+        """What `_collect_section` keeps; parsers may drop anything published before `since`."""
         sec = self.cfg.get(section, {})
-        count = int(sec.get("count", 5))
-        only_today = bool(sec.get("only_today", False))
-        fallback_days = int(sec.get("fallback_days", 2))
-        sources = sec.get("sources", [])
-        collected: list[NewsItem] = []
-        for src in sources:
-            src_type = src.get("type")
-            src_name = src.get("name", "Unknown")
-            url = (src.get("url") or "").strip()
-            if not url:
-                continue
-            try:
-                if src_type == "rss":
-                    rows = parse_rss_news(section, src_name, url, self.cfg.get("timezone", "Europe/Rome"))
-                elif src_type == "json":
-                    payload = fetch_json(url)
-                    parser_name = src.get("parser", "generic_json_news_v1")
-                    parser = NEWS_PARSERS.get(parser_name)
-                    rows = (
-                        parser(section, src_name, payload, self.cfg.get("timezone", "Europe/Rome"))
-                        if parser
-                        else []
-                    )
-                elif src_type == "search":
-                    # Web search: url field is used as the search query
-                    search_query = url.strip()
-                    count = src.get("count", 10)
-                    country = src.get("country", "IT")
-                    search_results = fetch_web_search(search_query, count=count, country=country)
-                    rows = parse_web_search_results(
-                        section, src_name, search_results, self.cfg.get("timezone", "Europe/Rome")
-                    )
-                else:
-                    rows = []
-            except Exception:
-                rows = []
-
-            for item in rows:
-                if not is_today_or_recent(
-                    item.published_at,
-                    report_day=report_day,
-                    timezone=self.cfg.get("timezone", "Europe/Rome"),
-                    only_today=only_today,
-                    fallback_days=fallback_days,
-                ):
-                    continue
-                if self.store.has_seen(item):
-                    continue
-                collected.append(item)
+        return TimeWindow.for_report_day(
+            report_day,
+            self.tz,
+            only_today=bool(sec.get("only_today", False)),
+            fallback_days=int(sec.get("fallback_days", 2)),
+        )
 
+    def _collect_section(self, section: str, report_day: date, batches: list[list[NewsItem]]) -> list[NewsItem]:
+        count = int(self.cfg.get(section, {}).get("count", 5))
+        window = self.windows.get(section) or self._window(section, report_day)
+        candidates = window.select([x for batch in batches for x in batch])
+        rules = KeywordRules.from_config(self.cfg.get(section, {}).get("keywords"))
+        if rules is not None:
+            candidates, self._filter_stats[section] = compile_rules(rules).select(candidates)
+        scope = GeoScope.from_config(self.cfg.get(section, {}).get("geo_scope"))
+        if scope is not None:
+            checked = len(candidates)
+            candidates = [x for x in candidates if scope.keeps(f"{x.title}\n{x.summary or ''}")]
+            self._geo_stats[section] = {"checked": checked, "kept": len(candidates)}
+        collected = self.store.filter_unseen(candidates)
         collected.sort(key=lambda x: x.published_at or datetime.min.replace(tzinfo=self.tz), reverse=True)
-        return collected[:count]
+        chars = self.cfg.get(section, {}).get("summary_chars", DEFAULT_SUMMARY_CHARS)
+        return truncate_summaries(collected[:count], int(chars) if chars is not None else None)
+
+    def _fetch_options(self, section: str, src: dict[str, Any], deadline_at: float | None = None) -> FetchOptions:
+        fetch_cfg = self.cfg.get("fetch", {})
+        sec = self.cfg.get(section, {})
+        ttl = sec.get("cache_ttl", fetch_cfg.get("cache_ttl", 0)) if isinstance(sec, dict) else 0
+        max_bytes = src.get("max_bytes", fetch_cfg.get("max_bytes"))
+        max_seconds = float(src.get("max_seconds", fetch_cfg.get("max_seconds")) or 0) or None
+        timeout = None
+        if deadline_at is not None:
+            # Hand the source whatever is left of the run budget.
+            remaining = deadline_at - time.monotonic()
+            if remaining <= 0:
+                raise DeadlineExceeded(f"No time left for {section}")
+            timeout = min(self.client.timeout, remaining)
+            max_seconds = min(max_seconds or remaining, remaining)
+        return FetchOptions(
+            timeout=timeout,
+            ttl=float(ttl or 0),
+            max_bytes=int(max_bytes) if max_bytes else None,
+            max_seconds=max_seconds,
+            hedge_after=self.hedge_after.get(source_key(section, str(src.get("name", "Unknown")))),
+            deadline_at=deadline_at,
+        )
+
+    def _hedge_delays(self) -> dict[str, float]:
+        """Hedge delay per opted-in source: its historical latency quantile (p90 by default)."""
+        if not self.hedge_cfg.get("enabled", True):
+            return {}
+        quantile = float(self.hedge_cfg.get("quantile", DEFAULT_HEDGE_QUANTILE))
+        min_samples = int(self.hedge_cfg.get("min_samples", DEFAULT_HEDGE_MIN_SAMPLES))
+        min_delay = float(self.hedge_cfg.get("min_delay", DEFAULT_HEDGE_MIN_DELAY))
+        delays: dict[str, float] = {}
+        for section in ("strikes",) + NEWS_SECTIONS:
+            for src in self._sources(section):
+                if not src.get("hedge"):
+                    continue
+                key = source_key(section, str(src.get("name", "Unknown")))
+                value = self.store.latency_quantile(key, quantile, min_samples=min_samples)
+                if value is not None:
+                    delays[key] = max(value, min_delay)
+        return delays
+
+    def _record_latencies(self) -> None:
+        samples = self.client.drain_latencies()
+        if not self.learn_latency:
+            return
+        keys = self._source_keys()
+        by_source: dict[str, list[float]] = {}
+        for url, values in samples.items():
+            if url in keys:
+                by_source.setdefault(keys[url], []).extend(values)
+        if by_source:
+            self.store.record_latencies(by_source, keep=int(self.hedge_cfg.get("history", DEFAULT_LATENCY_HISTORY)))
+
+    def _hedge_meta(self) -> dict[str, dict[str, Any]]:
+        keys = self._source_keys()
+        labels = self._source_labels()
+        out: dict[str, dict[str, Any]] = {}
+        for url, row in self.client.hedge_stats().items():
+            hedged = row["hedged"]
+            out[labels.get(url, url)] = {
+                **row,
+                "hedge_after": self.hedge_after.get(keys.get(url, "")),
+                "hedge_rate": round(hedged / row["requests"], 3) if row["requests"] else 0.0,
+                "win_rate": round(row["hedge_wins"] / hedged, 3) if hedged else 0.0,
+            }
+        return out
+
+    def _timing_meta(self) -> dict[str, dict[str, float]]:
+        """Seconds spent fetching and parsing, per source that ran."""
+        with self._timings_lock:
+            return {key: {phase: round(x, 4) for phase, x in row.items()} for key, row in self._timings.items()}
+
+    def _source_keys(self) -> dict[str, str]:
+        return {
+            (src.get("url") or "").strip(): source_key(section, str(src.get("name", "Unknown")))
+            for section in ("strikes",) + NEWS_SECTIONS
+            for src in self._sources(section)
+        }
+
+    def _source_labels(self) -> dict[str, str]:
+        labels = {self._weather_url(): "weather"}
+        for section in ("strikes",) + NEWS_SECTIONS:
+            for src in self._sources(section):
+                labels[(src.get("url") or "").strip()] = str(src.get("name", "Unknown"))
+        return labels
+
+    def _cache_meta(self) -> dict[str, dict[str, int]]:
+        labels = self._source_labels()
+        return {labels.get(url, url): row for url, row in self.client.cache_stats().items()}
+
+    def _truncation_meta(self) -> list[dict[str, Any]]:
+        labels = self._source_labels()
+        return [{"source": labels.get(row["url"], row["url"]), **row} for row in self.client.truncations()]
+
+    def _admitted(self, section: str, skipped: dict[str, list[str]]) -> list[dict[str, Any]]:
+        """Sources worth fetching this run: an open circuit skips the source outright, half-open lets it probe."""
+        admitted: list[dict[str, Any]] = []
+        for src in self._sources(section):
+            name = str(src.get("name", "Unknown"))
+            state = self.store.source_circuit(source_key(section, name), self.breaker_cooldown) if self.breaker else None
+            if state == CIRCUIT_OPEN:
+                skipped.setdefault(section, []).append(name)
+                continue
+            admitted.append(src)
+        return admitted
+
+    def _gather(
+        self,
+        section: str,
+        jobs: list[tuple[dict[str, Any], Future]],
+        late: dict[str, list[str]],
+        opened: list[str],
+    ) -> list[list[Any]]:
+        # Source errors never fail the run: the source contributes nothing and the breaker counts it. Failures
+        # the deadline caused (a capped timeout, a body cut off mid-parse) count as late, not against the source.
+        batches: list[list[Any]] = []
+        for src, job in jobs:
+            name = str(src.get("name", "Unknown"))
+            if not _arrived(job):
+                late.setdefault(section, []).append(name)
+                continue
+            error = job.exception()
+            key = source_key(section, name)
+            if error is None:
+                batches.append(job.result())
+                if self.breaker:
+                    self.store.record_source_success(key)
+                continue
+            if self.breaker:
+                message = f"{error.__class__.__name__}: {error}"[:500]
+                before = self.store.source_circuit(key, self.breaker_cooldown)
+                state = self.store.record_source_failure(key, message, self.breaker_threshold)
+                if state == CIRCUIT_OPEN and before != CIRCUIT_OPEN:
+                    opened.append(key)
+        return batches
+
+    def _circuit_meta(self) -> dict[str, dict[str, Any]]:
+        known = self.store.source_circuits(self.breaker_cooldown)
+        configured = {
+            source_key(section, str(src.get("name", "Unknown")))
+            for section in ("strikes",) + NEWS_SECTIONS
+            for src in self._sources(section)
+        }
+        return {key: row for key, row in known.items() if key in configured}
+
+    def _sources(self, section: str) -> list[dict[str, Any]]:
+        sec = self.cfg.get(section, {})
+        sources = sec.get("sources", []) if isinstance(sec, dict) else []
+        return [src for src in sources if isinstance(src, dict)]
+
+    def _make_executor(self) -> Executor:
+        if self.workers <= 1:
+            return _InlineExecutor()
+        return ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="brief-fetch")
+
+
+class _InlineExecutor(Executor):
+    """Runs each job at submit time; used when the worker pool is disabled."""
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        fut: Future = Future()
+        try:
+            fut.set_result(fn(*args, **kwargs))
+        except BaseException as exc:
+            fut.set_exception(exc)
+        return fut
+
+
+def _by_deadline(deadline_at: float | None, fn: Callable[..., Any], *args: Any) -> Any:
+    """Run a source job with the deadline; an error raised once the deadline has passed is reported as late."""
+    try:
+        return fn(*args, deadline_at)
+    except DeadlineExceeded:
+        raise
+    except Exception as exc:
+        if deadline_at is not None and time.monotonic() >= deadline_at:
+            raise DeadlineExceeded(f"Cut off by the run deadline: {exc.__class__.__name__}: {exc}") from exc
+        raise
+
+
+def _arrived(job: Future) -> bool:
+    return job.done() and not job.cancelled() and not isinstance(job.exception(), DeadlineExceeded)
 
 
 def _safe_pick(arr: Any, idx: int) -> Any:
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import importlib
+from dataclasses import dataclass
+from functools import lru_cache
+from importlib.metadata import entry_points
+from typing import Any, Callable
+
+
+ENTRY_POINT_GROUP = "news_briefing.parsers"
+
+DEFAULT_PARSERS = {
+    ("news", "json"): "generic_json_news_v1",
+    ("strikes", "json"): "italy_transport_strikes_v1",
+    ("strikes", "rss"): "italy_mit_strikes_rss_v1",
+    ("strikes", "html"): "italy_mit_strikes_html_v1",
+}
+
+
+@dataclass(frozen=True)
+class ParserSpec:
+    """What a parser key resolves to, and what it can do; the code behind `target` is imported on first use.
+
+    Call shapes: news parsers take `(section, source_name, payload, tz_name)`, strike parsers
+    `(payload, tz_name)`; RSS parsers also get `headers=`. The payload is the raw body when `accepts_bytes`
+    is set (always, for RSS), else the decoded JSON / text. `stream` names a class built with `(tz_name)`
+    that takes body chunks through `feed_bytes` and returns the items from `close()`.
+    `version` goes into the parse cache key, so bumping it invalidates results of code outside this package.
+    """
+
+    name: str
+    kind: str
+    source_type: str
+    target: str
+    accepts_bytes: bool = False
+    stream: str | None = None
+    version: str = "1"
+
+    @classmethod
+    def from_config(cls, name: str, raw: dict[str, Any]) -> "ParserSpec":
+        return cls(
+            name=name,
+            kind=str(raw.get("kind", "news")),
+            source_type=str(raw.get("type", "json")),
+            target=str(raw["target"]),
+            accepts_bytes=bool(raw.get("accepts_bytes", raw.get("type") == "rss")),
+            stream=raw.get("stream"),
+            version=str(raw.get("version", "1")),
+        )
+
+    @property
+    def cache_name(self) -> str:
+        return f"{self.name}@{self.version}"
+
+    def load(self) -> Callable[..., Any]:
+        return _resolve(self.target)
+
+    def load_stream(self) -> type | None:
+        return _resolve(self.stream) if self.stream else None
+
+
+BUILTIN_PARSERS = (
+    ParserSpec("generic_json_news_v1", "news", "json", ".parse:parse_json_news_generic"),
+    ParserSpec("italy_transport_strikes_v1", "strikes", "json", ".parse:parse_strikes_italy_transport"),
+    ParserSpec("italy_mit_strikes_rss_v1", "strikes", "rss", ".parse:parse_strikes_italy_mit_rss", accepts_bytes=True),
+    ParserSpec(
+        "italy_mit_strikes_html_v1",
+        "strikes",
+        "html",
+        ".parse:parse_strikes_italy_mit_html",
+        stream=".parse:MitStrikeTableParser",
+    ),
+)
+
+
+class ParserRegistry:
+    """Parser keys -> `ParserSpec`: built-ins, then the config's `parsers:` block, then installed entry points.
+
+    Entry points (group `news_briefing.parsers`) are looked up by key only when a source names a parser
+    that is neither built in nor configured; each must resolve to a `ParserSpec`, so installing a plugin
+    imports its (light) spec module and nothing else until a source actually parses with it.
+    """
+
+    def __init__(self, declared: dict[str, dict[str, Any]] | None = None):
+        self._specs: dict[str, ParserSpec | None] = {spec.name: spec for spec in BUILTIN_PARSERS}
+        for name, raw in (declared or {}).items():
+            self._specs[name] = ParserSpec.from_config(name, raw)
+
+    def get(self, name: str | None, kind: str, source_type: str) -> ParserSpec | None:
+        """The spec for `name` (or the default for this kind/type), if it handles that kind of source."""
+        name = name or DEFAULT_PARSERS.get((kind, source_type))
+        if not name:
+            return None
+        if name not in self._specs:
+            # Unknown keys are looked up once; a miss is remembered too.
+            self._specs[name] = _entry_point_spec(name)
+        spec = self._specs[name]
+        if spec is None or spec.kind != kind or spec.source_type != source_type:
+            return None
+        return spec
+
+    def names(self) -> list[str]:
+        return sorted(name for name, spec in self._specs.items() if spec is not None)
+
+
+@lru_cache(maxsize=None)
+def _resolve(target: str) -> Any:
+    module_name, _, attr = target.partition(":")
+    module = importlib.import_module(module_name, __package__ if module_name.startswith(".") else None)
+    obj: Any = module
+    for part in attr.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+def _entry_point_spec(name: str) -> ParserSpec | None:
+    eps = entry_points()
+    group = eps.select(group=ENTRY_POINT_GROUP) if hasattr(eps, "select") else eps.get(ENTRY_POINT_GROUP, [])
+    for ep in group:
+        if ep.name == name:
+            spec = ep.load()
+            return spec if isinstance(spec, ParserSpec) and spec.name == name else None
+    return None
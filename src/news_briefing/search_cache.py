@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS search_results (
+  key TEXT PRIMARY KEY,
+  provider TEXT NOT NULL,
+  query TEXT NOT NULL,
+  count INTEGER NOT NULL,
+  country TEXT NOT NULL,
+  results_json TEXT NOT NULL,
+  stored_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS search_quota (
+  provider TEXT NOT NULL,
+  period TEXT NOT NULL,
+  calls INTEGER NOT NULL,
+  PRIMARY KEY(provider, period)
+);
+"""
+
+DEFAULT_SEARCH_TTL = 12 * 3600
+
+
+class SearchCache:
+    """Query-level cache for web search: (query, count, country) -> results, with a per-provider quota ledger.
+
+    Identical queries running at the same time share one request. When a provider's daily or monthly
+    budget is spent, the last stored results are served regardless of age (or nothing, if none exist).
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        ttl: float = DEFAULT_SEARCH_TTL,
+        quota: dict[str, dict[str, int]] | None = None,
+        offline: bool = False,
+    ):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.quota = dict(quota or {})
+        self.offline = offline
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL;")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+        self._lock = threading.Lock()
+        self._inflight: dict[str, Future] = {}
+        self._stats = {"hits": 0, "misses": 0, "coalesced": 0, "degraded": 0}
+
+    @classmethod
+    def from_config(
+        cls,
+        db_path: str | Path,
+        search_cfg: dict[str, Any] | None,
+        offline: bool = False,
+    ) -> "SearchCache":
+        search_cfg = search_cfg or {}
+        return cls(
+            db_path,
+            ttl=float(search_cfg.get("cache_ttl", DEFAULT_SEARCH_TTL)),
+            quota=search_cfg.get("quota") or {},
+            offline=offline,
+        )
+
+    def search(
+        self,
+        provider: str,
+        query: str,
+        count: int,
+        country: str,
+        fetch: Callable[[], list[dict[str, Any]]],
+    ) -> list[dict[str, Any]]:
+        key = search_key(query, count, country)
+        with self._lock:
+            cached = self._stored(key, None if self.offline else self.ttl)
+            if cached is not None:
+                self._stats["hits"] += 1
+                return cached
+            pending = self._inflight.get(key)
+            if pending is not None:
+                self._stats["coalesced"] += 1
+            else:
+                self._stats["misses"] += 1
+                leader: Future = Future()
+                self._inflight[key] = leader
+        if pending is not None:
+            return list(pending.result())
+
+        try:
+            if self.offline or self._spend(provider):
+                results = fetch()
+                self._store(key, provider, query, count, country, results)
+            else:
+                with self._lock:
+                    self._stats["degraded"] += 1
+                    results = self._stored(key, None) or []
+            leader.set_result(results)
+            return results
+        except BaseException as exc:
+            leader.set_exception(exc)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def stats(self) -> dict[str, Any]:
+        day, month = _periods()
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT provider, period, calls FROM search_quota WHERE period IN (?, ?)", (day, month)
+            ).fetchall()
+            out: dict[str, Any] = dict(self._stats)
+        usage: dict[str, dict[str, Any]] = {}
+        for provider, period, calls in rows:
+            usage.setdefault(provider, {"day": 0, "month": 0})["day" if period == day else "month"] = int(calls)
+        for provider, row in usage.items():
+            row["daily_limit"] = self._limit(provider, "daily")
+            row["monthly_limit"] = self._limit(provider, "monthly")
+        out["quota"] = usage
+        return out
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
+    def _spend(self, provider: str) -> bool:
+        """Book one call against the provider's budget; False (and nothing booked) if it is spent."""
+        day, month = _periods()
+        with self._lock:
+            used = dict(
+                self.conn.execute(
+                    "SELECT period, calls FROM search_quota WHERE provider = ? AND period IN (?, ?)",
+                    (provider, day, month),
+                ).fetchall()
+            )
+            for period, kind in ((day, "daily"), (month, "monthly")):
+                limit = self._limit(provider, kind)
+                if limit is not None and int(used.get(period, 0)) >= limit:
+                    return False
+            for period in (day, month):
+                self.conn.execute(
+                    """
+                    INSERT INTO search_quota(provider, period, calls) VALUES (?, ?, 1)
+                    ON CONFLICT(provider, period) DO UPDATE SET calls = calls + 1
+                    """,
+                    (provider, period),
+                )
+            self.conn.commit()
+        return True
+
+    def _limit(self, provider: str, kind: str) -> int | None:
+        value = (self.quota.get(provider) or {}).get(kind)
+        return int(value) if value is not None else None
+
+    def _stored(self, key: str, max_age: float | None) -> list[dict[str, Any]] | None:
+        row = self.conn.execute("SELECT results_json, stored_at FROM search_results WHERE key = ?", (key,)).fetchone()
+        if row is None or (max_age is not None and time.time() - float(row[1]) > max_age):
+            return None
+        return json.loads(row[0])
+
+    def _store(
+        self,
+        key: str,
+        provider: str,
+        query: str,
+        count: int,
+        country: str,
+        results: list[dict[str, Any]],
+    ) -> None:
+        with self._lock:
+            self.conn.execute(
+                """
+                INSERT INTO search_results(key, provider, query, count, country, results_json, stored_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                  provider = excluded.provider,
+                  results_json = excluded.results_json,
+                  stored_at = excluded.stored_at
+                """,
+                (key, provider, query, count, country, json.dumps(results, ensure_ascii=False), time.time()),
+            )
+            self.conn.commit()
+
+
+def search_key(query: str, count: int, country: str) -> str:
+    raw = json.dumps([" ".join(query.split()).casefold(), int(count), country.upper()])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _periods() -> tuple[str, str]:
+    now = datetime.now(timezone.utc)
+    return now.strftime("%Y-%m-%d"), now.strftime("%Y-%m")
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import math
+from typing import Any
+
+
+DEFAULT_SEEN_FP_RATE = 0.01
+MIN_SEEN_CAPACITY = 1024
+
+
+class SeenIndex:
+    """Bloom filter over `seen_items` keys: "no" is certain, "maybe" still needs the exact SQLite lookup.
+
+    Sized for `capacity` keys at false-positive rate `fp_rate` (bits m = -n·ln p / ln²2, k = m/n·ln 2 hashes).
+    Keys are already SHA-256 hex digests, so the k bit positions come from their first 128 bits by double
+    hashing instead of hashing again.
+    """
+
+    def __init__(self, capacity: int, fp_rate: float = DEFAULT_SEEN_FP_RATE):
+        self.capacity = max(int(capacity), MIN_SEEN_CAPACITY)
+        self.fp_rate = min(max(float(fp_rate), 1e-9), 0.5)
+        self.size = max(8, math.ceil(-self.capacity * math.log(self.fp_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / self.capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def add(self, key: str) -> None:
+        h1, h2 = int(key[:16], 16), int(key[16:32], 16) | 1
+        size, bits = self.size, self.bits
+        for i in range(self.hashes):
+            pos = (h1 + i * h2) % size
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        h1, h2 = int(key[:16], 16), int(key[16:32], 16) | 1
+        size, bits = self.size, self.bits
+        for i in range(self.hashes):
+            pos = (h1 + i * h2) % size
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    @property
+    def full(self) -> bool:
+        return self.count >= self.capacity
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "keys": self.count,
+            "capacity": self.capacity,
+            "fp_rate_target": self.fp_rate,
+            "hashes": self.hashes,
+            "memory_bytes": len(self.bits),
+        }
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import hashlib
+import html
+import re
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from .models import NewsItem
+
+
+DEFAULT_SUMMARY_CHARS = 280
+SUMMARY_CACHE_SIZE = 4096
+
+# Elements whose content is never readable text (embeds, scripts, inline SVG...).
+DROP_BLOCK_RE = re.compile(
+    r"<(script|style|iframe|object|embed|noscript|svg|video|audio|figure|template)\b.*?</\1\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+BREAK_TAG_RE = re.compile(r"<(?:br|/?p|/?div|/?li|/?h[1-6]|/?blockquote|/?tr)\b[^>]*>", re.IGNORECASE)
+TAG_RE = re.compile(r"</?[A-Za-z!][^>]*>")
+ELLIPSIS = "…"
+
+_texts: OrderedDict[bytes, str] = OrderedDict()
+_lock = threading.Lock()
+_counts = {"hits": 0, "misses": 0}
+
+
+def clean_summary(raw: str | None, max_chars: int | None = DEFAULT_SUMMARY_CHARS) -> str | None:
+    """Plain single-line text of an HTML (or plain) summary, cut at a word boundary to `max_chars`.
+
+    The HTML-to-text step is memoized by a digest of the input, so the same summary seen again (in another
+    feed, or the next run in the same process) is not re-parsed. `max_chars=0` drops the summary.
+    """
+    if not raw or max_chars == 0:
+        return None
+    return truncate_summary(_plain_text(raw), max_chars)
+
+
+def truncate_summary(text: str | None, max_chars: int | None = DEFAULT_SUMMARY_CHARS) -> str | None:
+    """Already-clean summary text cut at a word boundary to `max_chars` (`None` keeps it whole, 0 drops it)."""
+    if not text or max_chars == 0:
+        return None
+    if max_chars is not None and len(text) > max_chars:
+        cut = text[: max_chars - len(ELLIPSIS)]
+        space = cut.rfind(" ")
+        if space > max_chars // 2:
+            cut = cut[:space]
+        text = cut.rstrip(" ,;:.-") + ELLIPSIS
+    return text or None
+
+
+def clean_summaries(items: list[NewsItem], max_chars: int | None = DEFAULT_SUMMARY_CHARS) -> list[NewsItem]:
+    """`clean_summary` applied to every item in place."""
+    for item in items:
+        item.summary = clean_summary(item.summary, max_chars)
+    return items
+
+
+def truncate_summaries(items: list[NewsItem], max_chars: int | None = DEFAULT_SUMMARY_CHARS) -> list[NewsItem]:
+    """`truncate_summary` applied to every item in place."""
+    for item in items:
+        item.summary = truncate_summary(item.summary, max_chars)
+    return items
+
+
+def summary_stats() -> dict[str, Any]:
+    with _lock:
+        out: dict[str, Any] = {**_counts, "cached": len(_texts)}
+    lookups = out["hits"] + out["misses"]
+    out["hit_rate"] = round(out["hits"] / lookups, 4) if lookups else 0.0
+    return out
+
+
+def clear_cache() -> None:
+    with _lock:
+        _texts.clear()
+        for key in _counts:
+            _counts[key] = 0
+
+
+def _plain_text(raw: str) -> str:
+    key = hashlib.blake2b(raw.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    with _lock:
+        text = _texts.get(key)
+        if text is not None:
+            _texts.move_to_end(key)
+            _counts["hits"] += 1
+            return text
+        _counts["misses"] += 1
+    text = _html_to_text(raw)
+    with _lock:
+        _texts[key] = text
+        if len(_texts) > SUMMARY_CACHE_SIZE:
+            _texts.popitem(last=False)
+    return text
+
+
+def _html_to_text(raw: str) -> str:
+    text = raw
+    if "<" in text:
+        text = COMMENT_RE.sub(" ", text)
+        text = DROP_BLOCK_RE.sub(" ", text)
+        text = BREAK_TAG_RE.sub(" ", text)
+        text = TAG_RE.sub("", text)
+    if "&" in text:
+        text = html.unescape(text)
+        # Entity-escaped markup ("&lt;p&gt;") only becomes tags after unescaping.
+        if "<" in text and TAG_RE.search(text):
+            return _html_to_text(text)
+    return " ".join(text.split())
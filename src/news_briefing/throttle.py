@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+
+DEFAULT_MAX_IN_FLIGHT = 16
+DEFAULT_HOST_CONCURRENCY = 4
+
+
+class TokenBucket:
+    def __init__(self, rate_per_second: float, burst: int = 1):
+        self.rate = rate_per_second
+        self.capacity = float(max(burst, 1))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class HostScheduler:
+    """Gates outbound requests: per-host concurrency cap and token bucket, then a global in-flight cap."""
+
+    def __init__(
+        self,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        hosts: dict[str, dict[str, Any]] | None = None,
+    ):
+        self.hosts = dict(hosts or {})
+        self._global = threading.BoundedSemaphore(max(max_in_flight, 1))
+        self._lock = threading.Lock()
+        self._host_slots: dict[str, threading.BoundedSemaphore] = {}
+        self._buckets: dict[str, TokenBucket | None] = {}
+
+    @classmethod
+    def from_config(cls, fetch_cfg: dict[str, Any] | None) -> "HostScheduler":
+        fetch_cfg = fetch_cfg or {}
+        return cls(
+            max_in_flight=int(fetch_cfg.get("max_in_flight", DEFAULT_MAX_IN_FLIGHT)),
+            hosts=fetch_cfg.get("hosts") or {},
+        )
+
+    @contextmanager
+    def slot(self, host: str) -> Iterator[float]:
+        """Hold a request slot for `host`; yields the seconds spent queueing for it."""
+        started = time.monotonic()
+        host_slot, bucket = self._host_state(host)
+        with host_slot:
+            if bucket is not None:
+                bucket.acquire()
+            with self._global:
+                yield time.monotonic() - started
+
+    def _host_state(self, host: str) -> tuple[threading.BoundedSemaphore, TokenBucket | None]:
+        with self._lock:
+            if host not in self._host_slots:
+                rule = {**(self.hosts.get("default") or {}), **(self.hosts.get(host) or {})}
+                cap = int(rule.get("max_concurrency", DEFAULT_HOST_CONCURRENCY))
+                self._host_slots[host] = threading.BoundedSemaphore(max(cap, 1))
+                rate = float(rule.get("rate_per_second", 0) or 0)
+                self._buckets[host] = TokenBucket(rate, int(rule.get("burst", 1))) if rate > 0 else None
+            return self._host_slots[host], self._buckets[host]
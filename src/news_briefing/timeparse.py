@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import re
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any
+from zoneinfo import ZoneInfo
+
+
+TIMESTAMP_CACHE_SIZE = 4096
+
+MONTHS = {
+    name: idx
+    for idx, name in enumerate(("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"), 1)
+}
+
+# RFC 822 zone names still seen in feeds; anything else goes to dateutil.
+RFC822_ZONES = {
+    "z": 0,
+    "ut": 0,
+    "utc": 0,
+    "gmt": 0,
+    "est": -5,
+    "edt": -4,
+    "cst": -6,
+    "cdt": -5,
+    "mst": -7,
+    "mdt": -6,
+    "pst": -8,
+    "pdt": -7,
+}
+
+RFC822_RE = re.compile(
+    r"(?:[A-Za-z]{3},?\s+)?(\d{1,2})\s+([A-Za-z]{3})[a-z]*\s+(\d{2,4})\s+"
+    r"(\d{1,2}):(\d{2})(?::(\d{2}))?(?:\s*([+-]\d{2}:?\d{2}|[A-Za-z]{1,3}))?"
+)
+ISO_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+_counts = {"fast": 0, "fallback": 0, "failed": 0}
+
+
+def get_zone(name: str) -> ZoneInfo:
+    """Shared `ZoneInfo` per name."""
+    return _zone(name)
+
+
+def parse_timestamp(value: Any, tz: ZoneInfo | None = None) -> datetime | None:
+    """Parse an RSS (RFC 822), Atom/JSON (ISO 8601) or free-form timestamp; naive results get `tz`.
+
+    The two feed formats are parsed directly, everything else by dateutil; results for repeated
+    strings come from a bounded LRU cache.
+    """
+    if not value:
+        return None
+    dt = _parse_cached(str(value).strip())
+    if dt is not None and dt.tzinfo is None and tz is not None:
+        dt = dt.replace(tzinfo=tz)
+    return dt
+
+
+def parse_stats() -> dict[str, Any]:
+    """Cache hit rate plus how many distinct strings took the fast path, dateutil, or failed."""
+    info = _parse_cached.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "lookups": lookups,
+        "hits": info.hits,
+        "hit_rate": round(info.hits / lookups, 4) if lookups else 0.0,
+        "cached": info.currsize,
+        **_counts,
+    }
+
+
+def clear_cache() -> None:
+    _parse_cached.cache_clear()
+    for key in _counts:
+        _counts[key] = 0
+
+
+@lru_cache(maxsize=None)
+def _zone(name: str) -> ZoneInfo:
+    return ZoneInfo(name)
+
+
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def _parse_cached(text: str) -> datetime | None:
+    dt = _parse_fast(text)
+    if dt is not None:
+        _counts["fast"] += 1
+        return dt
+    # dateutil is only imported the first time a string misses the fast path.
+    from dateutil import parser as dt_parser
+
+    try:
+        dt = dt_parser.parse(text)
+    except Exception:
+        _counts["failed"] += 1
+        return None
+    _counts["fallback"] += 1
+    return dt
+
+
+def _parse_fast(text: str) -> datetime | None:
+    if ISO_RE.match(text):
+        try:
+            return datetime.fromisoformat(text[:-1] + "+00:00" if text.endswith(("Z", "z")) else text)
+        except ValueError:
+            return None
+    m = RFC822_RE.fullmatch(text)
+    if not m:
+        return None
+    day, month_name, year, hour, minute, second, zone = m.groups()
+    month = MONTHS.get(month_name[:3].lower())
+    if month is None:
+        return None
+    tzinfo = _rfc822_zone(zone)
+    if zone and tzinfo is None:
+        return None
+    year_num = int(year)
+    if len(year) == 2:
+        year_num += 2000 if year_num < 50 else 1900
+    try:
+        return datetime(year_num, month, int(day), int(hour), int(minute), int(second or 0), tzinfo=tzinfo)
+    except ValueError:
+        return None
+
+
+def _rfc822_zone(zone: str | None) -> timezone | None:
+    if not zone:
+        return None
+    if zone[0] in "+-":
+        digits = zone[1:].replace(":", "")
+        offset = timedelta(hours=int(digits[:2]), minutes=int(digits[2:]))
+        return timezone(-offset if zone[0] == "-" else offset)
+    hours = RFC822_ZONES.get(zone.lower())
+    return timezone(timedelta(hours=hours)) if hours is not None else None
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import json
+import math
 import sqlite3
-from datetime import datetime
+from collections import Counter
+from datetime import date, datetime, timedelta
 from pathlib import Path
+from typing import Any, Callable
 
 from .models import NewsItem
+from .seen_index import DEFAULT_SEEN_FP_RATE, SeenIndex
 from .utils import dedupe_key
 
 
@@ -39,8 +43,36 @@ CREATE TABLE IF NOT EXISTS run_items (
   item_key TEXT NOT NULL,
   FOREIGN KEY(run_id) REFERENCES runs(id)
 );
+
+CREATE TABLE IF NOT EXISTS source_circuits (
+  source_key TEXT PRIMARY KEY,
+  state TEXT NOT NULL,
+  failures INTEGER NOT NULL,
+  opened_at TEXT,
+  last_error TEXT,
+  last_failure_at TEXT,
+  last_success_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS source_latency (
+  source_key TEXT NOT NULL,
+  recorded_at TEXT NOT NULL,
+  seconds REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_source_latency_key ON source_latency(source_key, recorded_at);
 """
 
+# Keys per `IN (...)` lookup; stays under SQLite's default limit of 999 bound parameters.
+SEEN_LOOKUP_CHUNK = 500
+
+# Seconds an open circuit waits before letting one probe through (fetch.circuit_breaker.cooldown_seconds).
+DEFAULT_BREAKER_COOLDOWN = 6 * 3600
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
 
 class Store:
     def __init__(self, db_path: str | Path):
@@ -50,11 +82,82 @@ class Store:
         self.conn.execute("PRAGMA journal_mode=WAL;")
         self.conn.executescript(SCHEMA)
         self.conn.commit()
+        self.seen_index: SeenIndex | None = None
+        self._seen_window: float | None = None
+        self._seen_lookups: Counter[str] = Counter()
+
+    def load_seen_index(
+        self, fp_rate: float = DEFAULT_SEEN_FP_RATE, window_days: float | None = None, capacity: int = 0
+    ) -> SeenIndex:
+        """Preload seen keys into a Bloom filter so most dedupe checks never reach the database.
+
+        Only keys last seen within `window_days` are loaded when it is set; older items then count as unseen
+        again. The filter is sized for twice the loaded keys and rebuilt larger once new runs fill it.
+        """
+        query, params = "SELECT item_key FROM seen_items", ()
+        if window_days is not None:
+            query += " WHERE last_seen_date >= ?"
+            params = ((date.today() - timedelta(days=float(window_days))).isoformat(),)
+        keys = [row[0] for row in self.conn.execute(query, params)]
+        index = SeenIndex(max(capacity, 2 * len(keys)), fp_rate)
+        for key in keys:
+            index.add(key)
+        self.seen_index = index
+        self._seen_window = window_days
+        return index
 
     def has_seen(self, item: NewsItem) -> bool:
         key = dedupe_key(item.title, item.url, item.source)
-        row = self.conn.execute("SELECT 1 FROM seen_items WHERE item_key = ?", (key,)).fetchone()
-        return row is not None
+        return key in self._seen_keys([key])
+
+    def filter_unseen(self, items: list[NewsItem]) -> list[NewsItem]:
+        """The items not yet in `seen_items`, in order; one query per `SEEN_LOOKUP_CHUNK` distinct keys."""
+        keys = [dedupe_key(item.title, item.url, item.source) for item in items]
+        seen = self._seen_keys(list(dict.fromkeys(keys)))
+        return [item for item, key in zip(items, keys) if key not in seen]
+
+    def _seen_keys(self, keys: list[str]) -> set[str]:
+        index = self.seen_index
+        maybe = keys if index is None else [key for key in keys if key in index]
+        seen: set[str] = set()
+        for i in range(0, len(maybe), SEEN_LOOKUP_CHUNK):
+            chunk = maybe[i : i + SEEN_LOOKUP_CHUNK]
+            rows = self.conn.execute(
+                f"SELECT item_key FROM seen_items WHERE item_key IN ({','.join('?' * len(chunk))})", chunk
+            ).fetchall()
+            seen.update(row[0] for row in rows)
+        if index is not None:
+            self._seen_lookups.update(
+                lookups=len(keys), disk_lookups=len(maybe), hits=len(seen), false_positives=len(maybe) - len(seen)
+            )
+        return seen
+
+    def _remember_seen(self, keys: list[str]) -> None:
+        index = self.seen_index
+        if index is None:
+            return
+        for key in keys:
+            index.add(key)
+        if index.full:
+            self.load_seen_index(index.fp_rate, self._seen_window, capacity=2 * index.capacity)
+
+    def seen_index_stats(self) -> dict[str, Any] | None:
+        """Size of the seen-key filter and how its lookups went: `hit_rate` is the share of keys found seen,
+        `fp_rate` the share of unseen keys the filter still sent to the database."""
+        if self.seen_index is None:
+            return None
+        counts = self._seen_lookups
+        unseen = counts["lookups"] - counts["hits"]
+        return {
+            **self.seen_index.stats(),
+            "window_days": self._seen_window,
+            "lookups": counts["lookups"],
+            "disk_lookups": counts["disk_lookups"],
+            "hits": counts["hits"],
+            "false_positives": counts["false_positives"],
+            "hit_rate": round(counts["hits"] / counts["lookups"], 4) if counts["lookups"] else None,
+            "fp_rate": round(counts["false_positives"] / unseen, 4) if unseen else None,
+        }
 
     def create_run(self, report_date: str, brief_path: str, meta: dict) -> int:
         cur = self.conn.execute(
@@ -64,6 +167,55 @@ class Store:
         self.conn.commit()
         return int(cur.lastrowid)
 
+    def persist_run(
+        self,
+        report_date: str,
+        brief_path: str,
+        meta: dict,
+        items: list[NewsItem],
+        write_outputs: Callable[[], None] | None = None,
+    ) -> int:
+        """Record a run and its items in one transaction; returns the run id.
+
+        `write_outputs` runs inside the transaction, after the rows are written and before the commit, so
+        if writing the brief's files raises, none of the run's rows are kept.
+        """
+        created_at = datetime.utcnow().isoformat()
+        rows = [
+            (
+                dedupe_key(item.title, item.url, item.source),
+                item,
+                item.published_at.isoformat() if item.published_at else None,
+            )
+            for item in items
+        ]
+        with self.conn:
+            cur = self.conn.execute(
+                "INSERT INTO runs(report_date, created_at, brief_path, meta_json) VALUES (?, ?, ?, ?)",
+                (report_date, created_at, brief_path, json.dumps(meta, ensure_ascii=False)),
+            )
+            run_id = int(cur.lastrowid)
+            self.conn.executemany(
+                """
+                INSERT INTO seen_items(item_key, section, title, url, source, published_at, first_seen_date, last_seen_date)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(item_key) DO UPDATE SET last_seen_date = excluded.last_seen_date
+                """,
+                [
+                    (key, x.section, x.title, x.url, x.source, published_at, report_date, report_date)
+                    for key, x, published_at in rows
+                ],
+            )
+            self.conn.executemany(
+                "INSERT INTO run_items(run_id, section, title, url, source, published_at, item_key) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(run_id, x.section, x.title, x.url, x.source, published_at, key) for key, x, published_at in rows],
+            )
+            if write_outputs is not None:
+                write_outputs()
+        self._remember_seen([key for key, _, _ in rows])
+        return run_id
+
     def store_item(self, run_id: int, report_date: str, item: NewsItem) -> None:
         key = dedupe_key(item.title, item.url, item.source)
         published_at = item.published_at.isoformat() if item.published_at else None
@@ -89,6 +241,119 @@ class Store:
             (run_id, item.section, item.title, item.url, item.source, published_at, key),
         )
         self.conn.commit()
+        self._remember_seen([key])
+
+    def source_circuit(self, source_key: str, cooldown_seconds: float) -> str:
+        """Breaker state for a source; an open circuit reads as half-open once the cool-down has passed."""
+        row = self.conn.execute(
+            "SELECT state, opened_at FROM source_circuits WHERE source_key = ?", (source_key,)
+        ).fetchone()
+        if row is None:
+            return CIRCUIT_CLOSED
+        return _effective_state(row[0], row[1], cooldown_seconds)
+
+    def record_source_success(self, source_key: str) -> None:
+        self.conn.execute(
+            """
+            INSERT INTO source_circuits(source_key, state, failures, last_success_at)
+            VALUES (?, ?, 0, ?)
+            ON CONFLICT(source_key) DO UPDATE SET
+              state = excluded.state,
+              failures = 0,
+              opened_at = NULL,
+              last_success_at = excluded.last_success_at
+            """,
+            (source_key, CIRCUIT_CLOSED, datetime.utcnow().isoformat()),
+        )
+        self.conn.commit()
+
+    def record_source_failure(self, source_key: str, error: str, threshold: int) -> str:
+        """Count a failure and open the circuit at `threshold` (a failed half-open probe re-opens it at once).
+
+        Returns the stored state afterwards.
+        """
+        now = datetime.utcnow().isoformat()
+        row = self.conn.execute(
+            "SELECT state, failures, opened_at FROM source_circuits WHERE source_key = ?", (source_key,)
+        ).fetchone()
+        failures = (int(row[1]) if row else 0) + 1
+        state, opened_at = (row[0], row[2]) if row else (CIRCUIT_CLOSED, None)
+        if state == CIRCUIT_OPEN or failures >= max(threshold, 1):
+            state, opened_at = CIRCUIT_OPEN, now
+        self.conn.execute(
+            """
+            INSERT INTO source_circuits(source_key, state, failures, opened_at, last_error, last_failure_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(source_key) DO UPDATE SET
+              state = excluded.state,
+              failures = excluded.failures,
+              opened_at = excluded.opened_at,
+              last_error = excluded.last_error,
+              last_failure_at = excluded.last_failure_at
+            """,
+            (source_key, state, failures, opened_at, error, now),
+        )
+        self.conn.commit()
+        return state
+
+    def source_circuits(self, cooldown_seconds: float) -> dict[str, dict]:
+        rows = self.conn.execute(
+            "SELECT source_key, state, failures, opened_at, last_error, last_failure_at, last_success_at "
+            "FROM source_circuits ORDER BY source_key"
+        ).fetchall()
+        return {
+            row[0]: {
+                "state": _effective_state(row[1], row[3], cooldown_seconds),
+                "failures": int(row[2]),
+                "opened_at": row[3],
+                "last_error": row[4],
+                "last_failure_at": row[5],
+                "last_success_at": row[6],
+            }
+            for row in rows
+        }
+
+    def record_latencies(self, samples: dict[str, list[float]], keep: int) -> None:
+        """Append fetch latencies per source, keeping only the newest `keep` samples of each."""
+        now = datetime.utcnow().isoformat()
+        self.conn.executemany(
+            "INSERT INTO source_latency(source_key, recorded_at, seconds) VALUES (?, ?, ?)",
+            [(key, now, float(x)) for key, values in samples.items() for x in values],
+        )
+        for key in samples:
+            self.conn.execute(
+                """
+                DELETE FROM source_latency WHERE source_key = ? AND rowid NOT IN (
+                  SELECT rowid FROM source_latency WHERE source_key = ? ORDER BY recorded_at DESC, rowid DESC LIMIT ?
+                )
+                """,
+                (key, key, keep),
+            )
+        self.conn.commit()
+
+    def latency_quantile(self, source_key: str, q: float, min_samples: int = 1) -> float | None:
+        """Nearest-rank quantile of the stored latencies, or None with fewer than `min_samples`."""
+        values = [
+            float(row[0])
+            for row in self.conn.execute(
+                "SELECT seconds FROM source_latency WHERE source_key = ? ORDER BY seconds", (source_key,)
+            ).fetchall()
+        ]
+        if not values or len(values) < min_samples:
+            return None
+        rank = max(math.ceil(q * len(values)), 1)
+        return values[rank - 1]
 
     def close(self) -> None:
         self.conn.close()
+
+
+def source_key(section: str, name: str) -> str:
+    return f"{section}:{name}"
+
+
+def _effective_state(state: str, opened_at: str | None, cooldown_seconds: float) -> str:
+    if state != CIRCUIT_OPEN or not opened_at:
+        return state
+    elapsed = (datetime.utcnow() - datetime.fromisoformat(opened_at)).total_seconds()
+    return CIRCUIT_HALF_OPEN if elapsed >= cooldown_seconds else CIRCUIT_OPEN
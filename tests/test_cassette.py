@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.news_briefing.cassette import Cassette, CassetteMissError
+from src.news_briefing.client import FetchClient
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # noqa: N802
+        body = f"<rss>{self.path}</rss>".encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        return
+
+
+class TestCassette(unittest.TestCase):
+    def test_record_then_replay_without_network(self) -> None:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        url = f"http://127.0.0.1:{server.server_port}/feed"
+        with tempfile.TemporaryDirectory() as d:
+            recorder = Cassette(d, "record")
+            client = FetchClient(retries=0, cassette=recorder)
+            try:
+                recorded = client.get(url)
+            finally:
+                client.close()
+                server.shutdown()
+                server.server_close()
+            recorder.save()
+
+            client = FetchClient(retries=0, cassette=Cassette(d, "replay", latency_scale=0))
+            try:
+                replayed = client.get(url)
+                self.assertEqual(replayed.content, recorded.content)
+                self.assertEqual(replayed.headers["content-type"], "application/rss+xml")
+                with self.assertRaises(CassetteMissError):
+                    client.get(f"{url}?other=1")
+            finally:
+                client.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
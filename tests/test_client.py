@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from src.news_briefing.client import FetchClient, FetchOptions
+from src.news_briefing.http_cache import ValidatorCache
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    slow_calls = 0
+    busy_calls = 0
+
+    def do_GET(self) -> None:  # noqa: N802
+        if self.path == "/busy":
+            _Handler.busy_calls += 1
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path == "/slow-once":
+            # Only the first request stalls, like a feed with a long tail.
+            _Handler.slow_calls += 1
+            if _Handler.slow_calls == 1:
+                time.sleep(1.0)
+        if self.path == "/etag":
+            self._send_etag()
+            return
+        if self.path == "/big":
+            body = "<rss>".encode("utf-8") + "città ".encode("utf-8") * 20000
+            self.send_response(200)
+            self.send_header("Content-Type", "text/xml; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        body = f"<rss>{self.path}|{self.headers.get('User-Agent')}</rss>".encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self) -> None:  # noqa: N802
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.do_GET()
+
+    def _send_etag(self) -> None:
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = b"<rss>" + b"x" * 1000 + b"</rss>"
+        self.send_response(200)
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        return
+
+
+class TestFetchClient(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.base = f"http://127.0.0.1:{self.server.server_port}"
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_same_host_reuses_connection(self) -> None:
+        client = FetchClient(user_agent="test-agent/1.0", retries=0)
+        try:
+            first = client.get(f"{self.base}/a")
+            second = client.get(f"{self.base}/b")
+            self.assertEqual(first.text, "<rss>/a|test-agent/1.0</rss>")
+            self.assertEqual(second.headers["content-type"], "application/rss+xml; charset=utf-8")
+            host = client.stats()["hosts"]["127.0.0.1"]
+            self.assertEqual(host["requests"], 2)
+            self.assertEqual(host["connections"], 1)
+            self.assertEqual(host["reused"], 1)
+        finally:
+            client.close()
+
+    def test_conditional_get_serves_304_from_disk(self) -> None:
+        url = f"{self.base}/etag"
+        with tempfile.TemporaryDirectory() as d:
+            for _ in range(2):
+                client = FetchClient(retries=0, cache=ValidatorCache(Path(d) / "http_cache.db"))
+                try:
+                    resp = client.get(url)
+                    stats = client.cache_stats()[url]
+                finally:
+                    client.close()
+            self.assertTrue(resp.from_cache)
+            self.assertEqual(resp.status_code, 200)
+            self.assertEqual(len(resp.content), 1011)
+            self.assertEqual(stats, {"fresh_hits": 0, "hits": 1, "misses": 0, "bytes_saved": 1011})
+
+    def test_max_bytes_keeps_decodable_prefix_and_reports_it(self) -> None:
+        client = FetchClient(retries=0)
+        try:
+            # 5 bytes of "<rss>" + 7-byte repeats: the cut lands inside the two-byte "à".
+            resp = client.get(f"{self.base}/big", options=FetchOptions(max_bytes=5 + 7 * 100 + 5))
+            self.assertEqual(resp.truncated, "max_bytes")
+            self.assertEqual(len(resp.content), 710)
+            self.assertTrue(resp.text.endswith("citt"))
+            self.assertNotIn("\ufffd", resp.text)
+            self.assertEqual(client.truncations()[0]["reason"], "max_bytes")
+        finally:
+            client.close()
+
+    def test_hedged_request_beats_stalled_first_attempt(self) -> None:
+        _Handler.slow_calls = 0
+        client = FetchClient(retries=0)
+        try:
+            started = time.monotonic()
+            resp = client.get(f"{self.base}/slow-once", options=FetchOptions(hedge_after=0.1))
+            elapsed = time.monotonic() - started
+            self.assertIn("/slow-once", resp.text)
+            self.assertLess(elapsed, 0.6)
+            stats = client.hedge_stats()[f"{self.base}/slow-once"]
+            self.assertEqual(stats, {"requests": 1, "hedged": 1, "hedge_wins": 1})
+        finally:
+            client.close()
+
+    def test_timed_out_request_still_records_latency(self) -> None:
+        _Handler.slow_calls = 0
+        client = FetchClient(retries=0)
+        try:
+            with self.assertRaises(Exception):
+                client.get(f"{self.base}/slow-once", options=FetchOptions(timeout=0.2))
+            (latency,) = client.drain_latencies()[f"{self.base}/slow-once"]
+            self.assertGreaterEqual(latency, 0.2)
+        finally:
+            client.close()
+
+    def test_post_is_not_retried(self) -> None:
+        client = FetchClient(retries=2, backoff=0)
+        try:
+            _Handler.busy_calls = 0
+            self.assertEqual(client.post(f"{self.base}/busy", data={"q": "x"}).status_code, 503)
+            self.assertEqual(_Handler.busy_calls, 1)
+        finally:
+            client.close()
+
+    def test_no_retries_past_the_deadline(self) -> None:
+        client = FetchClient(retries=2, backoff=0.2)
+        try:
+            _Handler.busy_calls = 0
+            self.assertEqual(client.get(f"{self.base}/busy").status_code, 503)
+            self.assertEqual(_Handler.busy_calls, 3)
+            _Handler.busy_calls = 0
+            started = time.monotonic()
+            resp = client.get(f"{self.base}/busy", options=FetchOptions(deadline_at=started + 0.1))
+            self.assertEqual(resp.status_code, 503)
+            # The first retry goes out at once; the second would back off past the deadline.
+            self.assertEqual(_Handler.busy_calls, 2)
+            self.assertLess(time.monotonic() - started, 0.3)
+        finally:
+            client.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
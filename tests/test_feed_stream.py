@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import unittest
+from datetime import datetime, timezone
+
+from src.news_briefing.parse import parse_rss_news
+
+
+def _rss(days: list[int]) -> bytes:
+    items = "".join(
+        f"<item><title>Story {day}</title><link>https://example.com/{day}</link>"
+        f"<pubDate>{day:02d} Feb 2026 09:00:00 +0000</pubDate>"
+        f"<description>&lt;b&gt;Body {day}&lt;/b&gt;</description></item>"
+        for day in days
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>t</title>{items}</channel></rss>'.encode()
+
+
+ATOM = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>t</title>
+<entry><title>Atom story</title><link rel="alternate" href="https://example.com/atom"/>
+<updated>2026-02-23T08:00:00Z</updated><summary>Short</summary></entry>
+</feed>"""
+
+
+class TestStreamingFeedParser(unittest.TestCase):
+    def test_stream_matches_feedparser(self) -> None:
+        payload = _rss([23, 22, 21])
+        streamed = parse_rss_news("world_news", "Src", payload, "Europe/Rome", engine="stream")
+        parsed = parse_rss_news("world_news", "Src", payload, "Europe/Rome")
+        def rows(items: list) -> list[tuple]:
+            return [(x.title, x.url, x.published_at) for x in items]
+
+        self.assertEqual(rows(streamed), rows(parsed))
+        self.assertEqual(streamed[0].summary, "<b>Body 23</b>")
+
+    def test_stream_stops_at_cutoff_and_entry_cap(self) -> None:
+        payload = _rss([23, 22, 10, 9, 8, 7, 6, 21])
+        since = datetime(2026, 2, 20, tzinfo=timezone.utc)
+        items = parse_rss_news("ai_news", "arXiv", payload, "Europe/Rome", since=since, engine="stream")
+        # Five stale entries in a row end the read, so the late "Story 21" is never reached.
+        self.assertEqual([x.title for x in items], ["Story 23", "Story 22"])
+        capped = parse_rss_news("ai_news", "arXiv", payload, "Europe/Rome", max_entries=1, engine="stream")
+        self.assertEqual([x.title for x in capped], ["Story 23"])
+
+    def test_atom_and_malformed_fallback(self) -> None:
+        atom = parse_rss_news("ai_news", "Src", ATOM, "Europe/Rome", engine="stream")
+        self.assertEqual([(x.title, x.url) for x in atom], [("Atom story", "https://example.com/atom")])
+        # &nbsp; is not an XML entity: the stream engine rejects it and feedparser takes over.
+        broken = _rss([23]).replace(b"Story 23", b"Story&nbsp;23")
+        items = parse_rss_news("ai_news", "Src", broken, "Europe/Rome", engine="stream")
+        self.assertEqual(len(items), 1)
+        self.assertTrue(items[0].title.startswith("Story"))
+
+    def test_truncated_stream_keeps_complete_entries(self) -> None:
+        payload = _rss([23, 22, 21])
+        cut = payload[: payload.index(b"Story 21")]
+        items = parse_rss_news("ai_news", "Src", cut, "Europe/Rome", engine="stream", truncated=True)
+        self.assertEqual([x.title for x in items], ["Story 23", "Story 22"])
+
+    def test_malformed_entry_past_first_chunk_falls_back(self) -> None:
+        # Several 64 KB reads long, with a stray HTML entity three quarters in: the entries before it have
+        # already been read when the stream engine fails, but the body was not cut off, so feedparser decides.
+        body = _rss([1 + i % 28 for i in range(400)]).replace(b"Body", b"Body " + b"x" * 500)
+        marker = body.index(b"<item>", len(body) * 3 // 4)
+        broken = body[:marker] + body[marker:].replace(b"<title>Story ", b"<title>Story&nbsp;", 1)
+        self.assertGreater(len(broken), 3 * 64 * 1024)
+        items = parse_rss_news("ai_news", "Src", broken, "Europe/Rome", engine="stream")
+        self.assertEqual(len(items), 400)
+        cut = parse_rss_news("ai_news", "Src", broken, "Europe/Rome", engine="stream", truncated=True)
+        self.assertLess(len(cut), 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
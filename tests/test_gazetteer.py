@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import unittest
+
+from src.news_briefing.gazetteer import GeoScope, load_gazetteer, place_label
+from src.news_briefing.parse import _extract_city_hint
+
+
+def _names(text: str) -> list[tuple[str, str]]:
+    return [(m.place.kind, m.place.name) for m in load_gazetteer().find(text)]
+
+
+class TestGazetteer(unittest.TestCase):
+    def test_longest_match_single_pass(self) -> None:
+        self.assertEqual(
+            _names("Sciopero a Reggio Emilia e in Emilia-Romagna; presidio a Sesto San Giovanni (MI)"),
+            [
+                ("city", "Reggio Emilia"),
+                ("region", "Emilia-Romagna"),
+                ("city", "Sesto San Giovanni"),
+                ("province", "Milano"),
+            ],
+        )
+        self.assertEqual(_names("FORLÌ, Forli e Milan"), [("city", "Forlì"), ("city", "Forlì"), ("city", "Milano")])
+
+    def test_codes_and_common_words(self) -> None:
+        self.assertEqual(_names("Lombardia/MI"), [("region", "Lombardia"), ("province", "Milano")])
+        self.assertEqual(_names("MI"), [("province", "Milano")])
+        self.assertEqual(_names("AL MI PIACE il treno fermo al prato, opera prima"), [])
+        self.assertEqual(_names("Mostra a Fermo e all'Opera di Prato"), [("city", "Fermo"), ("city", "Prato")])
+        self.assertEqual(_names("Mostra: le grandi marche del design italiano"), [])
+        self.assertEqual(_names("La potenza del colore: mostra di Rothko"), [])
+        self.assertEqual(_names("Sciopero nelle Marche e a Potenza"), [("region", "Marche"), ("city", "Potenza")])
+
+    def test_city_hint_labels(self) -> None:
+        self.assertEqual(place_label("Sciopero nazionale: anche Milano e la Lombardia"), "Italia/Lombardia/Milano")
+        self.assertIsNone(_extract_city_hint("Sciopero del personale"))
+
+    def test_scope(self) -> None:
+        scope = GeoScope.from_config({"provinces": ["MI", "Monza e Brianza"], "national": True}, unlocated=False)
+        self.assertTrue(scope.keeps("Lombardia"))
+        self.assertTrue(scope.keeps("Italia/Tutte"))
+        self.assertTrue(scope.keeps("Lombardia/Monza"))
+        self.assertTrue(scope.keeps(""))
+        self.assertFalse(scope.keeps("Lombardia/Bergamo"))
+        self.assertFalse(scope.keeps("Lazio/Tutte"))
+        self.assertFalse(scope.keeps("Ferrovie, personale viaggiante"))
+        self.assertTrue(scope.keeps("Tutte"))
+        self.assertTrue(scope.keeps("Sciopero nazionale dei trasporti, corteo a Roma"))
+        local = GeoScope.from_config({"provinces": ["MI"], "national": False})
+        self.assertFalse(local.keeps("Sciopero nazionale dei trasporti, corteo a Roma"))
+        events = GeoScope.from_config({"provinces": ["MI", "MB"], "national": False})
+        self.assertTrue(events.keeps("Mostra: le grandi marche del design italiano"))
+        self.assertTrue(events.keeps("La potenza del colore: mostra di Rothko"))
+        city = GeoScope.from_config({"cities": ["Milan"], "national": False})
+        self.assertTrue(city.keeps("Mostra in Lombardia, anche a Milano e Roma"))
+        self.assertFalse(city.keeps("Mostra a Sesto San Giovanni"))
+        self.assertFalse(city.keeps("Mostra nazionale"))
+        self.assertTrue(city.keeps("Una mostra da vedere"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.news_briefing.client import FetchClient
+from src.news_briefing.http_cache import CacheMissError, ResponseCache, response_key
+
+
+class TestResponseCache(unittest.TestCase):
+    def test_dedupes_by_content_and_respects_ttl(self) -> None:
+        with tempfile.TemporaryDirectory() as d:
+            cache = ResponseCache(Path(d) / "response_cache")
+            try:
+                body = b"<rss>" + b"same" * 500 + b"</rss>"
+                for url in ("https://a.example.com/rss", "https://b.example.com/rss"):
+                    cache.put(response_key("GET", url, None, None), "GET", url, 200, {}, "utf-8", body)
+                stats = cache.stats()
+                self.assertEqual(stats["entries"], 2)
+                self.assertEqual(stats["blobs"], 1)
+                self.assertLess(stats["bytes"], stats["raw_bytes"])
+
+                key = response_key("GET", "https://a.example.com/rss", None, None)
+                self.assertEqual(cache.get(key, max_age=60).body, body)
+                self.assertIsNone(cache.get(key, max_age=-1))
+                self.assertIsNotNone(cache.get(key, max_age=None))
+            finally:
+                cache.close()
+
+    def test_evicts_least_recently_used(self) -> None:
+        with tempfile.TemporaryDirectory() as d:
+            cache = ResponseCache(Path(d) / "response_cache", max_bytes=1500)
+            try:
+                keys = [response_key("GET", f"https://example.com/{i}", None, None) for i in range(3)]
+                for i, key in enumerate(keys[:2]):
+                    cache.put(key, "GET", f"https://example.com/{i}", 200, {}, None, os.urandom(600))
+                cache.get(keys[0], max_age=None)
+                cache.put(keys[2], "GET", "https://example.com/2", 200, {}, None, os.urandom(600))
+                self.assertIsNotNone(cache.get(keys[0], max_age=None))
+                self.assertIsNone(cache.get(keys[1], max_age=None))
+                self.assertIsNotNone(cache.get(keys[2], max_age=None))
+            finally:
+                cache.close()
+
+    def test_overwrite_releases_the_replaced_blob(self) -> None:
+        with tempfile.TemporaryDirectory() as d:
+            cache = ResponseCache(Path(d) / "response_cache")
+            try:
+                url = "https://example.com/rss"
+                for body in (b"<rss>old</rss>", b"<rss>new</rss>"):
+                    cache.put(response_key("GET", url, None, None), "GET", url, 200, {}, None, body)
+                self.assertEqual(cache.stats()["blobs"], 1)
+                self.assertEqual(len(list(cache.blob_dir.rglob("*.z"))), 1)
+            finally:
+                cache.close()
+
+    def test_offline_client_serves_cache_and_raises_on_miss(self) -> None:
+        with tempfile.TemporaryDirectory() as d:
+            cache = ResponseCache(Path(d) / "response_cache")
+            url = "https://example.com/feed"
+            cache.put(response_key("GET", url, None, None), "GET", url, 200, {}, "utf-8", b"cached")
+            client = FetchClient(responses=cache, offline=True)
+            try:
+                resp = client.get(url)
+                self.assertTrue(resp.from_cache)
+                self.assertEqual(resp.text, "cached")
+                with self.assertRaises(CacheMissError):
+                    client.get("https://example.com/missing")
+            finally:
+                client.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import unittest
+
+from src.news_briefing.keywords import KeywordRules, compile_rules
+from src.news_briefing.models import NewsItem
+
+
+def _item(title: str, summary: str | None = None) -> NewsItem:
+    return NewsItem("ai_news", title, f"https://example.com/{len(title)}", "Example", summary=summary)
+
+
+class TestKeywordFilter(unittest.TestCase):
+    def test_include_exclude_required(self) -> None:
+        rules = KeywordRules.from_config(
+            {
+                "include": ["AI", "intelligenza  artificiale", "LLM"],
+                "exclude": ["oroscopo", "artificiale"],
+                "required": [],
+            }
+        )
+        items = [
+            _item("OpenAI ships a new LLM"),
+            _item("Mai dire mai", "Un film"),
+            _item("Oroscopo: cosa dice l'AI"),
+            _item("L'Intelligenza\nArtificiale a scuola"),
+            _item("Chip per l'ai", "nuovi acceleratori"),
+        ]
+        kept, stats = compile_rules(rules).select(items)
+        self.assertEqual([x.title for x in kept], ["OpenAI ships a new LLM", "Chip per l'ai"])
+        self.assertEqual((stats["checked"], stats["kept"]), (5, 2))
+        self.assertEqual(stats["hits"]["include:ai"], 2)
+        self.assertEqual(stats["hits"]["exclude:oroscopo"], 1)
+        # "artificiale" sits inside the longer "intelligenza artificiale" match and still counts.
+        self.assertEqual(stats["hits"]["exclude:artificiale"], 1)
+        self.assertEqual(stats["hits"]["include:intelligenza artificiale"], 1)
+
+    def test_required_terms_and_overlaps(self) -> None:
+        rules = KeywordRules.from_config({"required": ["new york", "York Times"]})
+        kept, _ = compile_rules(rules).select([_item("The New York Times reports"), _item("New York news")])
+        self.assertEqual([x.title for x in kept], ["The New York Times reports"])
+
+    def test_rules_compile_once(self) -> None:
+        self.assertIsNone(KeywordRules.from_config({"include": [" "]}))
+        first = compile_rules(KeywordRules.from_config({"include": ["Milano"]}))
+        self.assertIs(compile_rules(KeywordRules.from_config({"include": ["milano "]})), first)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import unittest
+from datetime import date, datetime, timedelta, timezone
+
+from src.news_briefing.models import NewsItem
+from src.news_briefing.parse import TimeWindow, is_today_or_recent
+from src.news_briefing.timeparse import get_zone
+
+
+class TestTimeWindow(unittest.TestCase):
+    def test_matches_per_item_check(self) -> None:
+        rome = get_zone("Europe/Rome")
+        # Around the October DST change, in both UTC and local time, plus an undated item.
+        base = datetime(2026, 10, 22, tzinfo=timezone.utc)
+        stamps: list[datetime | None] = [base + timedelta(minutes=37 * i) for i in range(260)]
+        stamps += [x.astimezone(rome) for x in stamps if x is not None] + [None]
+        items = [NewsItem("world_news", str(i), f"https://example.com/{i}", "Example", x) for i, x in enumerate(stamps)]
+        report_day = date(2026, 10, 25)
+        for only_today, fallback_days in ((True, 0), (False, 0), (False, 2), (False, -1)):
+            window = TimeWindow.for_report_day(report_day, rome, only_today, fallback_days)
+            expected = [
+                x
+                for x in items
+                if is_today_or_recent(x.published_at, report_day, "Europe/Rome", only_today, fallback_days)
+            ]
+            self.assertEqual(window.select(items), expected, (only_today, fallback_days))
+
+    def test_since_is_window_start(self) -> None:
+        window = TimeWindow.for_report_day(date(2026, 3, 1), get_zone("Europe/Rome"), False, 2)
+        self.assertEqual(window.since, datetime(2026, 2, 27, tzinfo=get_zone("Europe/Rome")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest import mock
+
+from src.news_briefing import parse_cache
+from src.news_briefing.models import NewsItem, StrikeItem
+from src.news_briefing.parse import limit_entries
+from src.news_briefing.parse_cache import ParseCache
+from src.news_briefing.timeparse import get_zone
+
+
+ROME = get_zone("Europe/Rome")
+
+ITEMS = [
+    NewsItem("world_news", "Local time", "https://example.com/a", "Example", datetime(2026, 3, 1, 9, 30, tzinfo=ROME)),
+    NewsItem("world_news", "UTC", "https://example.com/b", "Example", datetime(2026, 2, 28, 8, 0, tzinfo=timezone.utc)),
+    NewsItem("world_news", "Undated", "https://example.com/c", "Example", None, "Città", {"rank": 1}),
+]
+
+
+class TestParseCache(unittest.TestCase):
+    def test_same_payload_is_a_lookup(self) -> None:
+        with tempfile.TemporaryDirectory() as d:
+            cache = ParseCache(Path(d) / "parse_cache.db")
+            try:
+                parse = mock.Mock(return_value=ITEMS)
+                first = cache.parse("rss:feedparser", b"<rss/>", "Europe/Rome", parse, section="world_news")
+                second = cache.parse("rss:feedparser", b"<rss/>", "Europe/Rome", parse, section="world_news")
+                self.assertEqual(parse.call_count, 1)
+                self.assertEqual(first, second)
+                self.assertIs(second[0].published_at.tzinfo, ROME)
+                cache.parse("rss:feedparser", b"<rss/>", "UTC", parse, section="world_news")
+                cache.parse("rss:feedparser", b"<rss> </rss>", "Europe/Rome", parse, section="world_news")
+                cache.parse("rss:feedparser", b"<rss/>", "Europe/Rome", parse, section="ai_news")
+                self.assertEqual(parse.call_count, 4)
+                self.assertEqual(cache.stats()["hits"], 1)
+            finally:
+                cache.close()
+
+    def test_strike_rows_round_trip(self) -> None:
+        rows = [StrikeItem("Sciopero", datetime(2026, 10, 25, 2, 30, tzinfo=ROME, fold=1), None, "24 ORE", "Milano")]
+        with tempfile.TemporaryDirectory() as d:
+            cache = ParseCache(Path(d) / "parse_cache.db")
+            try:
+                cache.parse("italy_mit_strikes_rss_v1", b"x", "Europe/Rome", lambda: rows)
+                cached = cache.parse("italy_mit_strikes_rss_v1", b"x", "Europe/Rome", lambda: [])
+                self.assertEqual(cached, rows)
+                self.assertEqual(cached[0].start.utcoffset(), rows[0].start.utcoffset())
+            finally:
+                cache.close()
+
+    def test_new_parser_code_invalidates(self) -> None:
+        with tempfile.TemporaryDirectory() as d:
+            db = Path(d) / "parse_cache.db"
+            old = ParseCache(db)
+            old.parse("rss:feedparser", b"<rss/>", "Europe/Rome", lambda: ITEMS)
+            old.close()
+            with mock.patch.object(parse_cache, "parser_version", return_value="changed"):
+                cache = ParseCache(db)
+            try:
+                self.assertEqual(cache.conn.execute("SELECT COUNT(*) FROM parsed_payloads").fetchone()[0], 0)
+                self.assertEqual(cache.parse("rss:feedparser", b"<rss/>", "Europe/Rome", lambda: []), [])
+            finally:
+                cache.close()
+
+    def test_limit_entries_applies_window(self) -> None:
+        since = datetime(2026, 3, 1, tzinfo=ROME)
+        self.assertEqual([x.title for x in limit_entries(ITEMS, since, None)], ["Local time", "Undated"])
+        self.assertEqual([x.title for x in limit_entries(ITEMS, None, 2)], ["Local time", "UTC"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import unittest
+from functools import partial
+
+from src.news_briefing.parse import parse_rss_news
+from src.news_briefing.parse_pool import ParsePool
+
+
+FEED = (
+    b"<?xml version='1.0' encoding='utf-8'?><rss version='2.0'><channel><title>Example</title>"
+    + b"".join(
+        f"<item><title>Story {i}</title><link>https://example.com/{i}</link>"
+        f"<pubDate>Sun, 01 Mar 2026 0{i}:15:00 +0100</pubDate><description>Città {i}</description></item>".encode()
+        for i in range(5)
+    )
+    + b"</channel></rss>"
+)
+
+
+class TestParsePool(unittest.TestCase):
+    def test_large_payloads_parse_in_a_worker(self) -> None:
+        parse = partial(parse_rss_news, "world_news", "Example", FEED, "Europe/Rome")
+        pool = ParsePool(workers=1, min_bytes=len(FEED))
+        try:
+            self.assertEqual(pool.run(parse, len(FEED), "Europe/Rome"), parse())
+            self.assertEqual(pool.run(parse, len(FEED) - 1, "Europe/Rome"), parse())
+            stats = pool.stats()
+            self.assertEqual((stats["offloaded"], stats["inline"]), (1, 1))
+            self.assertEqual(stats["offloaded_bytes"], len(FEED))
+        finally:
+            pool.close()
+
+    def test_disabled_unless_configured(self) -> None:
+        self.assertIsNone(ParsePool.from_config({}))
+        pool = ParsePool.from_config({"enabled": True, "workers": 3, "min_kb": 1})
+        self.assertEqual((pool.workers, pool.min_bytes), (3, 1024))
+
+
+if __name__ == "__main__":
+    unittest.main()
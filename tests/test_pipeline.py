@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import contextlib
+import tempfile
+import threading
+import time
+import unittest
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Callable
+from unittest import mock
+
+from src.news_briefing.client import FetchResponse
+from src.news_briefing.models import DailyBrief, NewsItem, WeatherInfo
+from src.news_briefing.pipeline import BriefingPipeline
+
+
+def _cfg() -> dict:
+    return {
+        "timezone": "Europe/Rome",
+        "world_news": {
+            "count": 5,
+            "only_today": False,
+            "fallback_days": 2,
+            "sources": [
+                {"name": "Slow", "type": "rss", "url": "https://slow.example.com/rss"},
+                {"name": "Fast", "type": "rss", "url": "https://fast.example.com/rss"},
+            ],
+        },
+    }
+
+
+class _InFlight:
+    """Counts fetches running at once, so overlap is checked directly rather than through wall-clock time."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.now = 0
+        self.peak = 0
+
+    def fetch(self, url: str, **kwargs: object) -> FetchResponse:
+        with self.lock:
+            self.now += 1
+            self.peak = max(self.peak, self.now)
+        try:
+            time.sleep(0.3 if "slow" in url else 0.2)
+        finally:
+            with self.lock:
+                self.now -= 1
+        return FetchResponse(url=url, status_code=200, content=url.encode("utf-8"))
+
+
+def _fake_rss(section: str, source_name: str, payload: bytes, tz_name: str, **kwargs: object) -> list[NewsItem]:
+    published = datetime(2026, 2, 23, 9, 0, tzinfo=timezone.utc)
+    return [NewsItem(section, f"{source_name} story", f"{payload.decode()}/1", source_name, published)]
+
+
+class TestPipelineFanOut(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        # Runs within one test share the database, so breaker state carries over between them.
+        self.db_path = Path(tmp.name) / "briefing.db"
+
+    def _generate(
+        self,
+        cfg: dict | None = None,
+        fetch: Callable[..., FetchResponse] | None = None,
+        rss: Callable[..., list[NewsItem]] | None = _fake_rss,
+        workers: int = 1,
+        weather: WeatherInfo | Exception | None = None,
+        **generate_kwargs: object,
+    ) -> tuple[DailyBrief, dict]:
+        """One dry run with fetching and weather stubbed; `rss=None` leaves the real RSS parser in place."""
+        weather = weather or WeatherInfo("Milan", "2026-02-23", 1.0, 8.0, "晴", 10.0)
+        outcome = {"side_effect": weather} if isinstance(weather, Exception) else {"return_value": weather}
+        pipeline = BriefingPipeline(cfg or _cfg(), db_path=self.db_path, workers=workers)
+        patches = [
+            mock.patch("src.news_briefing.pipeline.fetch_response", side_effect=fetch or _InFlight().fetch),
+            mock.patch.object(BriefingPipeline, "_fetch_weather", **outcome),
+        ]
+        if rss is not None:
+            patches.append(mock.patch("src.news_briefing.pipeline.parse_rss_news", side_effect=rss))
+        try:
+            with contextlib.ExitStack() as stack:
+                for patch in patches:
+                    stack.enter_context(patch)
+                brief, _, meta = pipeline.generate(report_day=date(2026, 2, 23), dry_run=True, **generate_kwargs)
+        finally:
+            pipeline.close()
+        return brief, meta
+
+    def test_concurrent_matches_sequential_order(self) -> None:
+        one, four = _InFlight(), _InFlight()
+        sequential, _ = self._generate(fetch=one.fetch, workers=1)
+        concurrent, _ = self._generate(fetch=four.fetch, workers=4)
+        self.assertEqual([x.title for x in sequential.world_news], ["Slow story", "Fast story"])
+        self.assertEqual([x.title for x in concurrent.world_news], ["Slow story", "Fast story"])
+        self.assertEqual(one.peak, 1)
+        self.assertEqual(four.peak, 2)
+
+    def test_deadline_drops_late_sources(self) -> None:
+        returned = threading.Event()
+        finished_after_return: list[bool] = []
+
+        def slow_fetch(url: str, **kwargs: object) -> FetchResponse:
+            if "slow" in url:
+                # Held until `generate` has returned, so the source is late however slow the runner is.
+                returned.wait(timeout=10)
+                finished_after_return.append(returned.is_set())
+            return FetchResponse(url=url, status_code=200, content=url.encode("utf-8"))
+
+        pipeline_generate = BriefingPipeline.generate
+
+        def generate(pipeline: BriefingPipeline, *args: object, **kwargs: object) -> tuple:
+            try:
+                return pipeline_generate(pipeline, *args, **kwargs)
+            finally:
+                returned.set()
+
+        with mock.patch.object(BriefingPipeline, "generate", generate):
+            brief, meta = self._generate(fetch=slow_fetch, workers=4, deadline=0.2)
+        self.assertEqual([x.title for x in brief.world_news], ["Fast story"])
+        self.assertEqual(meta["deadline"]["late_sources"], {"world_news": ["Slow"]})
+        # The straggler was left running past `generate`, and `close()` waited for it before closing.
+        self.assertEqual(finished_after_return, [True])
+
+    def test_failed_weather_does_not_abort_a_deadline_run(self) -> None:
+        brief, meta = self._generate(weather=ConnectionError("read timed out"), deadline=5)
+        self.assertIsNone(brief.weather.condition)
+        self.assertEqual(meta["deadline"]["errors"], {"weather": "ConnectionError: read timed out"})
+        self.assertEqual([x.title for x in brief.world_news], ["Slow story", "Fast story"])
+
+    def test_circuit_breaker_skips_failing_source(self) -> None:
+        calls: list[str] = []
+
+        def flaky_fetch(url: str, **kwargs: object) -> FetchResponse:
+            calls.append(url)
+            if "slow" in url:
+                raise ConnectionError("down")
+            return FetchResponse(url=url, status_code=200, content=url.encode("utf-8"))
+
+        cfg = _cfg()
+        cfg["fetch"] = {"circuit_breaker": {"failure_threshold": 2, "cooldown_seconds": 3600}}
+        metas = [self._generate(cfg, flaky_fetch)[1] for _ in range(3)]
+        self.assertEqual(calls.count("https://slow.example.com/rss"), 2)
+        self.assertEqual(metas[1]["circuits"]["opened"], ["world_news:Slow"])
+        self.assertEqual(metas[2]["circuits"]["skipped"], {"world_news": ["Slow"]})
+        self.assertEqual(metas[2]["circuits"]["sources"]["world_news:Slow"]["state"], "open")
+
+    def test_deadline_failures_do_not_trip_the_breaker(self) -> None:
+        def timed_out(url: str, **kwargs: object) -> FetchResponse:
+            time.sleep(0.2)
+            raise ConnectionError("read timed out")
+
+        cfg = _cfg()
+        cfg["fetch"] = {"circuit_breaker": {"failure_threshold": 1}}
+        _, meta = self._generate(cfg, timed_out, deadline=0.1)
+        self.assertIn("Slow", meta["deadline"]["late_sources"]["world_news"])
+        self.assertEqual(meta["circuits"]["opened"], [])
+        self.assertNotIn("world_news:Slow", meta["circuits"]["sources"])
+
+    def test_rss_parser_reads_fetched_bytes(self) -> None:
+        feed = (
+            b'<?xml version="1.0" encoding="utf-8"?><rss version="2.0"><channel><title>t</title>'
+            b"<item><title>Citt\xc3\xa0 story</title><link>https://fast.example.com/a</link>"
+            b"<pubDate>Mon, 23 Feb 2026 09:00:00 +0000</pubDate></item></channel></rss>"
+        )
+
+        def fetch(url: str, **kwargs: object) -> FetchResponse:
+            body = feed if "fast" in url else b"<rss/>"
+            return FetchResponse(url=url, status_code=200, content=body, headers={"content-type": "text/xml"})
+
+        brief, meta = self._generate(fetch=fetch, rss=None)
+        self.assertEqual([x.title for x in brief.world_news], ["Città story"])
+        self.assertEqual(set(meta["fetch"]["sources"]["world_news:Fast"]), {"fetch", "parse"})
+
+    def test_keywords_see_the_whole_summary(self) -> None:
+        def rss(section: str, source_name: str, payload: bytes, tz_name: str, **kwargs: object) -> list[NewsItem]:
+            published = datetime(2026, 2, 23, 9, 0, tzinfo=timezone.utc)
+            summary = "<p>" + "Lungo racconto della giornata. " * 20 + "Chiude con una mostra.</p>"
+            return [NewsItem(section, f"{source_name} story", f"{payload.decode()}/1", source_name, published, summary)]
+
+        cfg = _cfg()
+        cfg["world_news"]["keywords"] = {"include": ["mostra"]}
+        cfg["world_news"]["summary_chars"] = 80
+        brief, meta = self._generate(cfg, rss=rss)
+        # "mostra" sits past the 80-character cut: it still matches, and only the shown summary is shortened.
+        self.assertEqual([x.title for x in brief.world_news], ["Slow story", "Fast story"])
+        self.assertEqual(meta["filters"]["world_news"]["hits"], {"include:mostra": 2})
+        self.assertTrue(all(len(x.summary or "") <= 80 and x.summary.endswith("…") for x in brief.world_news))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+from src.news_briefing import registry
+from src.news_briefing.parse import MitStrikeTableParser, parse_strikes_italy_mit_rss
+from src.news_briefing.registry import ParserRegistry, ParserSpec
+
+
+PLUGIN = ParserSpec("plugin_news_v2", "news", "html", "src.news_briefing.utils:dedupe_key", version="2")
+
+
+class TestParserRegistry(unittest.TestCase):
+    def test_builtin_defaults_and_capabilities(self) -> None:
+        parsers = ParserRegistry()
+        rss = parsers.get(None, "strikes", "rss")
+        self.assertEqual(rss.name, "italy_mit_strikes_rss_v1")
+        self.assertTrue(rss.accepts_bytes)
+        self.assertIs(rss.load(), parse_strikes_italy_mit_rss)
+        html = parsers.get("italy_mit_strikes_html_v1", "strikes", "html")
+        self.assertIs(html.load_stream(), MitStrikeTableParser)
+        self.assertIsNone(parsers.get("italy_mit_strikes_rss_v1", "strikes", "json"))
+        self.assertIsNone(parsers.get(None, "news", "html"))
+
+    def test_config_declared_parser(self) -> None:
+        parsers = ParserRegistry(
+            {"local_json_v1": {"kind": "news", "type": "json", "target": "json:loads", "accepts_bytes": True}}
+        )
+        spec = parsers.get("local_json_v1", "news", "json")
+        self.assertEqual((spec.accepts_bytes, spec.cache_name), (True, "local_json_v1@1"))
+        self.assertEqual(spec.load()(b"[1]"), [1])
+
+    def test_entry_points_looked_up_once_by_name(self) -> None:
+        ep = mock.Mock()
+        ep.name = "plugin_news_v2"
+        ep.load.return_value = PLUGIN
+        eps = mock.Mock()
+        eps.select.return_value = [ep]
+        with mock.patch.object(registry, "entry_points", return_value=eps) as found:
+            parsers = ParserRegistry()
+            self.assertIs(parsers.get("plugin_news_v2", "news", "html"), PLUGIN)
+            self.assertIs(parsers.get("plugin_news_v2", "news", "html"), PLUGIN)
+            self.assertIsNone(parsers.get("missing_v1", "news", "html"))
+            self.assertIsNone(parsers.get("missing_v1", "news", "html"))
+        self.assertEqual(found.call_count, 2)
+        eps.select.assert_called_with(group=registry.ENTRY_POINT_GROUP)
+        self.assertIn("plugin_news_v2", parsers.names())
+
+
+if __name__ == "__main__":
+    unittest.main()
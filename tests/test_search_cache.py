@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.news_briefing.client import FetchClient, FetchOptions, FetchResponse
+from src.news_briefing.fetch import fetch_web_search
+from src.news_briefing.http_cache import ResponseCache
+from src.news_briefing.search_cache import SearchCache
+
+
+def _results(query: str) -> list[dict[str, str]]:
+    return [{"title": query, "url": "https://example.com/1", "description": ""}]
+
+
+class TestSearchCache(unittest.TestCase):
+    def test_identical_queries_hit_cache(self) -> None:
+        calls: list[str] = []
+
+        def fetch() -> list[dict[str, str]]:
+            calls.append("x")
+            return _results("Milano mostre")
+
+        with tempfile.TemporaryDirectory() as d:
+            cache = SearchCache(Path(d) / "search.db", ttl=3600)
+            try:
+                first = cache.search("brave", "Milano mostre", 10, "IT", fetch)
+                second = cache.search("brave", "  milano   MOSTRE ", 10, "it", fetch)
+                cache.search("brave", "Milano mostre", 5, "IT", fetch)
+                stats = cache.stats()
+            finally:
+                cache.close()
+        self.assertEqual(first, second)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 2))
+        self.assertEqual(stats["quota"]["brave"]["day"], 2)
+
+    def test_concurrent_queries_are_coalesced(self) -> None:
+        calls: list[str] = []
+
+        def fetch() -> list[dict[str, str]]:
+            calls.append("x")
+            time.sleep(0.2)
+            return _results("q")
+
+        with tempfile.TemporaryDirectory() as d:
+            cache = SearchCache(Path(d) / "search.db", ttl=3600)
+            try:
+                out: list[list[dict[str, str]]] = []
+                threads = [
+                    threading.Thread(target=lambda: out.append(cache.search("brave", "q", 10, "IT", fetch)))
+                    for _ in range(4)
+                ]
+                for t in threads:
+                    t.start()
+                for t in threads:
+                    t.join()
+                stats = cache.stats()
+            finally:
+                cache.close()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(out, [_results("q")] * 4)
+        self.assertEqual(stats["hits"] + stats["coalesced"], 3)
+
+    def test_exhausted_quota_serves_stale_results(self) -> None:
+        with tempfile.TemporaryDirectory() as d:
+            cache = SearchCache(Path(d) / "search.db", ttl=0, quota={"brave": {"daily": 1}})
+            try:
+                self.assertEqual(cache.search("brave", "q", 10, "IT", lambda: _results("old")), _results("old"))
+                time.sleep(0.01)
+                self.assertEqual(cache.search("brave", "q", 10, "IT", lambda: _results("new")), _results("old"))
+                self.assertEqual(cache.search("brave", "other", 10, "IT", lambda: _results("new")), [])
+                stats = cache.stats()
+            finally:
+                cache.close()
+        self.assertEqual(stats["degraded"], 2)
+        self.assertEqual(stats["quota"]["brave"], {"day": 1, "month": 1, "daily_limit": 1, "monthly_limit": None})
+
+    def test_quota_books_only_calls_that_reach_the_provider(self) -> None:
+        sent: list[str] = []
+
+        def send(method: str, url: str, *args: object) -> FetchResponse:
+            sent.append(url)
+            return FetchResponse(url=url, status_code=200, content=b'{"web": {"results": []}}')
+
+        with tempfile.TemporaryDirectory() as d:
+            client = FetchClient(retries=0, responses=ResponseCache(Path(d) / "responses"))
+            cache = SearchCache(Path(d) / "search.db", ttl=0)
+            try:
+                with mock.patch.dict("os.environ", {"BRAVE_API_KEY": "k"}), mock.patch.object(
+                    client, "_send", side_effect=send
+                ):
+                    for _ in range(2):
+                        fetch_web_search("q", client=client, options=FetchOptions(ttl=3600), cache=cache)
+                stats = cache.stats()
+            finally:
+                cache.close()
+                client.close()
+        # A fresh stored response would have answered the second search without reaching Brave.
+        self.assertEqual(len(sent), 2)
+        self.assertEqual(stats["quota"]["brave"]["day"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -29,6 +29,95 @@ class TestStorage(unittest.TestCase):
             finally:
                 store.close()
 
+    def test_filter_unseen_in_chunks(self) -> None:
+        with tempfile.TemporaryDirectory() as d:
+            store = Store(Path(d) / "briefing.db")
+            try:
+                items = [
+                    NewsItem("world_news", f"Title {i}", f"https://example.com/{i}", "Example") for i in range(1200)
+                ]
+                run_id = store.create_run("2026-02-23", "output/2026-02-23.md", {})
+                for item in items[::3]:
+                    store.store_item(run_id, "2026-02-23", item)
+                unseen = store.filter_unseen(items + [items[1]])
+                self.assertEqual(len(unseen), 801)
+                self.assertEqual(unseen[:2], [items[1], items[2]])
+                self.assertIs(unseen[-1], items[1])
+                self.assertEqual(store.filter_unseen([]), [])
+            finally:
+                store.close()
+
+    def test_persist_run_is_one_transaction(self) -> None:
+        with tempfile.TemporaryDirectory() as d:
+            store = Store(Path(d) / "briefing.db")
+            try:
+                items = [NewsItem("world_news", f"Title {i}", f"https://example.com/{i}", "Example") for i in range(3)]
+
+                def fail() -> None:
+                    raise OSError("disk full")
+
+                with self.assertRaises(OSError):
+                    store.persist_run("2026-02-23", "output/2026-02-23.md", {}, items, write_outputs=fail)
+                self.assertEqual(store.conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0], 0)
+                self.assertEqual(len(store.filter_unseen(items)), 3)
+
+                run_id = store.persist_run("2026-02-23", "output/2026-02-23.md", {"x": 1}, items + items[:1])
+                self.assertEqual(store.filter_unseen(items), [])
+                count = store.conn.execute("SELECT COUNT(*) FROM run_items WHERE run_id = ?", (run_id,)).fetchone()[0]
+                self.assertEqual(count, 4)
+            finally:
+                store.close()
+
+    def test_seen_index_skips_disk_for_unseen_keys(self) -> None:
+        with tempfile.TemporaryDirectory() as d:
+            store = Store(Path(d) / "briefing.db")
+            try:
+                items = [NewsItem("ai_news", f"Title {i}", f"https://example.com/{i}", "Example") for i in range(3000)]
+                store.persist_run("2026-02-23", "output/2026-02-23.md", {}, items[:1000])
+                index = store.load_seen_index(fp_rate=0.01)
+                self.assertEqual((index.count, index.capacity), (1000, 2000))
+                self.assertEqual(store.filter_unseen(items[:2000]), items[1000:2000])
+                # New runs go into the filter; filling it rebuilds a larger one from the database.
+                store.persist_run("2026-02-24", "output/2026-02-24.md", {}, items[1000:2500])
+                self.assertTrue(store.has_seen(items[2400]))
+                self.assertFalse(store.has_seen(items[2600]))
+                stats = store.seen_index_stats()
+                self.assertEqual((stats["keys"], stats["capacity"]), (2500, 5000))
+                self.assertEqual((stats["lookups"], stats["hits"]), (2002, 1001))
+                self.assertLess(stats["disk_lookups"], 1050)
+                self.assertLess(stats["fp_rate"], 0.05)
+            finally:
+                store.close()
+
+    def test_circuit_opens_and_half_opens(self) -> None:
+        with tempfile.TemporaryDirectory() as d:
+            store = Store(Path(d) / "briefing.db")
+            try:
+                key = "world_news:Dead Feed"
+                self.assertEqual(store.source_circuit(key, cooldown_seconds=60), "closed")
+                self.assertEqual(store.record_source_failure(key, "ConnectionError: boom", threshold=2), "closed")
+                self.assertEqual(store.record_source_failure(key, "ConnectionError: boom", threshold=2), "open")
+                self.assertEqual(store.source_circuit(key, cooldown_seconds=60), "open")
+                self.assertEqual(store.source_circuit(key, cooldown_seconds=0), "half_open")
+                store.record_source_success(key)
+                row = store.source_circuits(cooldown_seconds=60)[key]
+                self.assertEqual((row["state"], row["failures"]), ("closed", 0))
+            finally:
+                store.close()
+
+    def test_latency_quantile_keeps_recent_history(self) -> None:
+        with tempfile.TemporaryDirectory() as d:
+            store = Store(Path(d) / "briefing.db")
+            try:
+                key = "world_news:Slow Feed"
+                self.assertIsNone(store.latency_quantile(key, 0.9))
+                store.record_latencies({key: [float(x) for x in range(1, 21)]}, keep=10)
+                self.assertEqual(store.latency_quantile(key, 0.9), 19.0)
+                self.assertEqual(store.latency_quantile(key, 0.5), 15.0)
+                self.assertIsNone(store.latency_quantile(key, 0.9, min_samples=11))
+            finally:
+                store.close()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import unittest
+
+from src.news_briefing.parse import MitStrikeTableParser, parse_strikes_italy_mit_html
+
+
+def _row(start: str, sector: str, region: str) -> str:
+    cells = [start, start, "<a href='/x'>USB</a>", sector, "Personale", "DALLE 09.00 ALLE 17.00"]
+    cells += ["", "", "", region, "MI", ""]
+    return "<tr class='r'>" + "".join(f"<td>\n {c} </td>" for c in cells) + "</tr>"
+
+
+PAGE = (
+    "<html><table><thead><tr><th>Inizio</th><th>Fine</th></tr></thead><tbody>"
+    + _row("02/03/2026", "Trasporto pubblico &amp; locale", "Lombardia")
+    + _row("03/03/2026", "Ferroviario <b>nazionale</b>", "Città")
+    + _row("n/d", "Senza data", "Lazio")
+    + "</tbody></table></html>"
+)
+
+
+class TestMitStrikeTable(unittest.TestCase):
+    def test_rows_become_items(self) -> None:
+        items = parse_strikes_italy_mit_html(PAGE, "Europe/Rome")
+        self.assertEqual(
+            [x.title for x in items],
+            ["Trasporto pubblico & locale | Personale", "Ferroviario nazionale | Personale"],
+        )
+        self.assertEqual(items[0].city, "Lombardia/MI")
+        self.assertEqual(items[0].impact_window, "DALLE 09.00 ALLE 17.00")
+        self.assertEqual(items[1].start.isoformat(), "2026-03-03T00:00:00+01:00")
+
+    def test_byte_chunks_match_whole_page(self) -> None:
+        body = PAGE.encode("utf-8")
+        expected = parse_strikes_italy_mit_html(PAGE, "Europe/Rome")
+        for size in (1, 3, 7, 64):
+            table = MitStrikeTableParser("Europe/Rome")
+            for offset in range(0, len(body), size):
+                table.feed_bytes(body[offset : offset + size])
+            self.assertEqual(table.close(), expected, size)
+
+    def test_rows_are_ready_before_the_page_ends(self) -> None:
+        table = MitStrikeTableParser("Europe/Rome")
+        table.feed(PAGE[: PAGE.index("03/03/2026")])
+        self.assertEqual(len(table.items), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import unittest
+
+from src.news_briefing.models import NewsItem
+from src.news_briefing.summary import clean_summaries, clean_summary, clear_cache, summary_stats
+
+
+RAW = (
+    "<p>Il <b>Comune</b> di Milano&nbsp;annuncia</p><figure><img src='x.jpg'><figcaption>Foto</figcaption></figure>"
+    "<script>track()</script><!-- ad --><iframe src='https://video'>embed</iframe><p>nuove linee &amp; orari.</p>"
+)
+
+
+class TestSummary(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_cache()
+
+    def test_html_becomes_text(self) -> None:
+        self.assertEqual(clean_summary(RAW, None), "Il Comune di Milano annuncia nuove linee & orari.")
+        self.assertEqual(clean_summary("&lt;p&gt;Escaped &amp;lt;markup&amp;gt;&lt;/p&gt;", None), "Escaped")
+        self.assertEqual(clean_summary("1 < 2 and 3 > 2", None), "1 < 2 and 3 > 2")
+        self.assertIsNone(clean_summary("<img src='x.jpg'>", None))
+
+    def test_truncates_at_word_boundary(self) -> None:
+        self.assertEqual(clean_summary(RAW, 30), "Il Comune di Milano annuncia…")
+        self.assertIsNone(clean_summary(RAW, 0))
+        self.assertEqual(len(clean_summary("x" * 100, 20) or ""), 20)
+
+    def test_memoized_by_content(self) -> None:
+        items = [NewsItem("world_news", str(i), f"https://example.com/{i}", "Example", summary=RAW) for i in range(3)]
+        clean_summaries(items, 280)
+        self.assertEqual({x.summary for x in items}, {"Il Comune di Milano annuncia nuove linee & orari."})
+        stats = summary_stats()
+        self.assertEqual((stats["misses"], stats["hits"]), (1, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+
+from src.news_briefing.throttle import HostScheduler
+
+
+class TestHostScheduler(unittest.TestCase):
+    def test_per_host_cap_serializes_and_reports_wait(self) -> None:
+        scheduler = HostScheduler(max_in_flight=8, hosts={"slow.example.com": {"max_concurrency": 1}})
+        waits: list[float] = []
+        lock = threading.Lock()
+
+        def hit() -> None:
+            with scheduler.slot("slow.example.com") as waited:
+                time.sleep(0.1)
+            with lock:
+                waits.append(waited)
+
+        threads = [threading.Thread(target=hit) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        waits.sort()
+        self.assertLess(waits[0], 0.05)
+        self.assertGreater(waits[2], 0.15)
+
+    def test_token_bucket_spaces_requests(self) -> None:
+        scheduler = HostScheduler(hosts={"api.example.com": {"rate_per_second": 20, "burst": 1}})
+        started = time.monotonic()
+        for _ in range(3):
+            with scheduler.slot("api.example.com"):
+                pass
+        self.assertGreaterEqual(time.monotonic() - started, 0.09)
+
+    def test_other_hosts_are_not_throttled(self) -> None:
+        scheduler = HostScheduler(hosts={"default": {"max_concurrency": 1}})
+        with scheduler.slot("a.example.com"):
+            with scheduler.slot("b.example.com") as waited:
+                self.assertLess(waited, 0.05)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import unittest
+
+from dateutil import parser as dt_parser
+
+from src.news_briefing.timeparse import clear_cache, get_zone, parse_stats, parse_timestamp
+
+
+SAMPLES = [
+    "Mon, 23 Feb 2026 09:00:00 +0000",
+    "Mon, 23 Feb 2026 09:00:00 GMT",
+    "23 Feb 2026 10:15 +0100",
+    "Tue, 3 Mar 2026 18:30:05 -0500",
+    "2026-02-23T08:00:00Z",
+    "2026-02-23T08:00:00.250+01:00",
+    "2026-02-23",
+    "2026-02-23 07:45:00",
+    "February 23, 2026 9:00 AM",
+]
+
+
+class TestTimeParse(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_cache()
+
+    def test_matches_dateutil(self) -> None:
+        tz = get_zone("Europe/Rome")
+        for text in SAMPLES:
+            expected = dt_parser.parse(text)
+            if expected.tzinfo is None:
+                expected = expected.replace(tzinfo=tz)
+            self.assertEqual(parse_timestamp(text, tz), expected, text)
+
+    def test_fast_path_cache_and_bad_input(self) -> None:
+        tz = get_zone("Europe/Rome")
+        for _ in range(3):
+            parse_timestamp(SAMPLES[0], tz)
+        self.assertIsNone(parse_timestamp("not a date", tz))
+        self.assertIsNone(parse_timestamp("", tz))
+        stats = parse_stats()
+        self.assertEqual((stats["fast"], stats["failed"], stats["hits"]), (1, 1, 2))
+        self.assertIs(get_zone("Europe/Rome"), tz)
+
+
+if __name__ == "__main__":
+    unittest.main()